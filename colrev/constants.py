@@ -20,6 +20,13 @@ class Filepaths:
     TEI_INDEX_DIR = LOCAL_ENVIRONMENT_DIR / Path(".tei_index/")
 
     REGISTRY_FILE = LOCAL_ENVIRONMENT_DIR.joinpath(Path("registry.json"))
+    ENDPOINT_REGISTRY_CACHE_FILE = LOCAL_ENVIRONMENT_DIR.joinpath(
+        Path("endpoint_registry_cache.json")
+    )
+
+    DOCKER_IMAGES_CACHE_FILE = LOCAL_ENVIRONMENT_DIR.joinpath(
+        Path("docker_images_cache.json")
+    )
 
     PREP_REQUESTS_CACHE_FILE = LOCAL_ENVIRONMENT_DIR / Path("prep_requests_cache")
 
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import os
+import shutil
 import tempfile
 import time
 import typing
+from contextlib import contextmanager
+from multiprocessing import Lock
 from pathlib import Path
 from random import randint
 
@@ -46,6 +49,14 @@ class Dataset:
             msg = "Not a CoLRev/git repository. Run\n    colrev init"
             raise colrev_exceptions.RepoSetupError(msg) from exc
 
+        # Index updates collected in batched_index_updates():
+        # path -> (remove, ignore_missing)
+        self._pending_index_updates: typing.Dict[str, typing.Tuple[bool, bool]] = {}
+        self._index_batch_depth = 0
+        self._index_lock = Lock()
+        # Number of index writes (for instrumentation)
+        self.index_writes = 0
+
         self.update_gitignore(
             add=FileSets.DEFAULT_GIT_IGNORE_ITEMS,
             remove=FileSets.DEPRECATED_GIT_IGNORE_ITEMS,
@@ -233,41 +244,31 @@ class Dataset:
         # Correct the first item
         record_list[0]["record"] = "@" + record_list[0]["record"][2:]
 
-        current_id_str = "NOTSET"
-        if self.review_manager.paths.records.is_file():
-            with open(self.review_manager.paths.records, "r+b") as file:
-                seekpos = file.tell()
-                line = file.readline()
-                while line:
+        # Replace the records in a single pass over the records file
+        # (records that are not in the file are appended)
+        replacements = {item[Fields.ID]: item["record"] for item in record_list}
+        records_path = self.review_manager.paths.records
+        if records_path.is_file():
+            with open(records_path, "rb") as file, tempfile.NamedTemporaryFile(
+                mode="wb", dir=records_path.parent, delete=False
+            ) as temp_file:
+                skip_record = False
+                for line in file:
                     if b"@" in line[:3]:
-                        current_id = line[line.find(b"{") + 1 : line.rfind(b",")]
-                        current_id_str = current_id.decode("utf-8")
-                    if current_id_str in [x[Fields.ID] for x in record_list]:
-                        replacement = [
-                            x["record"]
-                            for x in record_list
-                            if x[Fields.ID] == current_id_str
-                        ][0]
-                        record_list = [
-                            x for x in record_list if x[Fields.ID] != current_id_str
-                        ]
-                        line = file.readline()
-                        while (
-                            b"@" not in line[:3] and line
-                        ):  # replace: drop the current record
-                            line = file.readline()
-                        remaining = line + file.read()
-                        file.seek(seekpos)
-                        file.write(replacement.encode("utf-8"))
-                        seekpos = file.tell()
-                        file.flush()
-                        os.fsync(file)
-                        file.write(remaining)
-                        file.truncate()  # if the replacement is shorter...
-                        file.seek(seekpos)
-
-                    seekpos = file.tell()
-                    line = file.readline()
+                        current_id = line[
+                            line.find(b"{") + 1 : line.rfind(b",")
+                        ].decode("utf-8")
+                        skip_record = current_id in replacements
+                        if skip_record:
+                            replacement = replacements.pop(current_id)
+                            temp_file.write(replacement.encode("utf-8"))
+                    if not skip_record:
+                        temp_file.write(line)
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            shutil.copymode(records_path, temp_file.name)
+            os.replace(temp_file.name, records_path)
+        record_list = [item for item in record_list if item[Fields.ID] in replacements]
 
         if len(record_list) > 0:
             with open(
@@ -320,15 +321,28 @@ class Dataset:
                     "msg": f" no status field in record ({record_dict[Fields.ID]})",
                 }
 
-            record = colrev.record.record_prep.PrepRecord(record_dict)
-            if record_dict[Fields.STATUS] in [
-                RecordState.md_needs_manual_preparation,
-            ]:
-                record.run_quality_model(quality_model, set_prepared=True)
-
-            if record_dict[Fields.STATUS] == RecordState.pdf_prepared:
-                record.reset_pdf_provenance_notes()
-
+        # Fetch the DOI metadata and TOCs in bulk (instead of once per record)
+        quality_model.prefetch(
+            record_dict
+            for record_dict in records.values()
+            if record_dict[Fields.STATUS] == RecordState.md_needs_manual_preparation
+        )
+        try:
+            for record_dict in records.values():
+                record = colrev.record.record_prep.PrepRecord(record_dict)
+                if record_dict[Fields.STATUS] in [
+                    RecordState.md_needs_manual_preparation,
+                ]:
+                    record.run_quality_model(quality_model, set_prepared=True)
+
+                if record_dict[Fields.STATUS] == RecordState.pdf_prepared:
+                    record.reset_pdf_provenance_notes()
+            quality_model.run_deferred(set_prepared=True)
+        finally:
+            quality_model.reset_snapshot()
+
+        quality_model.save_memo()
+        self.flush_index_updates()
         self.save_records_dict(records)
         changed = self.review_manager.paths.RECORDS_FILE in [
             r.a_path for r in self._git_repo.index.diff(None)
@@ -356,14 +370,23 @@ class Dataset:
 
         return False
 
-    def set_ids(self, selected_ids: typing.Optional[list] = None) -> dict:
+    def set_ids(
+        self,
+        selected_ids: typing.Optional[list] = None,
+        *,
+        records: typing.Optional[dict] = None,
+    ) -> dict:
         """Set the IDs of records according to predefined formats or
-        according to the LocalIndex"""
+        according to the LocalIndex
+
+        records: records that are already loaded (the records file is not parsed again)
+        """
         id_setter = colrev.record.record_id_setter.IDSetter(
             id_pattern=self.review_manager.settings.project.id_pattern,
             skip_local_index=self.review_manager.settings.is_curated_masterdata_repo(),
         )
-        records = self.load_records_dict()
+        if records is None:
+            records = self.load_records_dict()
         updated_records = id_setter.set_ids(
             records=records,
             selected_ids=selected_ids,
@@ -379,6 +402,7 @@ class Dataset:
 
         if self.review_manager.notified_next_operation is None:
             raise colrev_exceptions.ReviewManagerNotNotifiedError()
+        self.flush_index_updates()
         return self._git_repo
 
     def repo_initialized(self) -> bool:
@@ -410,6 +434,8 @@ class Dataset:
         except ValueError:
             return True  # Repository has no commit
 
+        self.flush_index_updates()
+
         diff_index = [item.a_path for item in self._git_repo.index.diff(None)]
         diff_head = [item.a_path for item in self._git_repo.head.commit.diff()]
         unstaged_changes = diff_index + self._git_repo.untracked_files
@@ -439,6 +465,76 @@ class Dataset:
             elif i > 30:
                 raise colrev_exceptions.GitNotAvailableError()
 
+    def _write_index_updates(
+        self, index_updates: typing.Dict[str, typing.Tuple[bool, bool]]
+    ) -> None:
+        """Write the index updates (path -> (remove, ignore_missing)) to the git index
+
+        Written updates are removed from index_updates."""
+        removed = [path for path, (remove, _) in index_updates.items() if remove]
+        added = [path for path, (remove, _) in index_updates.items() if not remove]
+        self._sleep_util_git_unlocked()
+        if removed:
+            self._git_repo.index.remove(removed)
+            self.index_writes += 1
+            for path in removed:
+                del index_updates[path]
+        if added:
+            self._git_repo.index.add(added)
+            self.index_writes += 1
+            for path in added:
+                del index_updates[path]
+
+    @contextmanager
+    def batched_index_updates(self) -> typing.Iterator[None]:
+        """Collect the index updates of add_changes() and write them at once
+
+        Pending updates are written when the (outermost) context exits,
+        and before the index is read (e.g., in get_repo() or create_commit()).
+        Added files are staged with their content at the time of writing."""
+        with self._index_lock:
+            self._index_batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._index_lock:
+                self._index_batch_depth -= 1
+            if self._index_batch_depth == 0:
+                self.flush_index_updates()
+
+    def flush_index_updates(self) -> None:
+        """Write the pending index updates (collected in batched_index_updates())
+
+        Files that were removed after they were queued are skipped if they were
+        added with ignore_missing (otherwise, a FileNotFoundError is raised after
+        the other updates are written). If writing fails, the updates are kept."""
+        with self._index_lock:
+            index_updates = self._pending_index_updates
+            self._pending_index_updates = {}
+        if not index_updates:
+            return
+
+        missing = [
+            path
+            for path, (remove, _) in index_updates.items()
+            if not remove and not (self.review_manager.path / Path(path)).exists()
+        ]
+        missing_required = [path for path in missing if not index_updates[path][1]]
+        for path in missing:
+            del index_updates[path]
+        try:
+            self._write_index_updates(index_updates)
+        finally:
+            if index_updates:
+                with self._index_lock:
+                    # Updates that were queued in the meantime take precedence
+                    self._pending_index_updates = {
+                        **index_updates,
+                        **self._pending_index_updates,
+                    }
+        if missing_required:
+            raise FileNotFoundError(", ".join(missing_required))
+
     def add_changes(
         self, path: Path, *, remove: bool = False, ignore_missing: bool = False
     ) -> None:
@@ -448,12 +544,18 @@ class Dataset:
             path = path.relative_to(self.review_manager.path)
         path_str = str(path).replace("\\", "/")
 
-        self._sleep_util_git_unlocked()
+        if self._index_batch_depth > 0:
+            if not remove and not (self.review_manager.path / path).exists():
+                if ignore_missing:
+                    return
+                raise FileNotFoundError(path_str)
+            with self._index_lock:
+                self._pending_index_updates.pop(path_str, None)
+                self._pending_index_updates[path_str] = (remove, ignore_missing)
+            return
+
         try:
-            if remove:
-                self._git_repo.index.remove([path_str])
-            else:
-                self._git_repo.index.add([path_str])
+            self._write_index_updates({path_str: (remove, ignore_missing)})
         except FileNotFoundError as exc:
             if not ignore_missing:
                 raise exc
@@ -465,6 +567,7 @@ class Dataset:
 
     def records_changed(self) -> bool:
         """Check whether the records were changed"""
+        self.flush_index_updates()
         main_recs_changed = self.review_manager.paths.RECORDS_FILE_GIT in [
             item.a_path for item in self._git_repo.index.diff(None)
         ] + [x.a_path for x in self._git_repo.head.commit.diff()]
@@ -486,6 +589,7 @@ class Dataset:
         # pylint: disable=redefined-outer-name
         import colrev.ops.commit
 
+        self.flush_index_updates()
         if self.review_manager.exact_call and script_call == "":
             script_call = self.review_manager.exact_call
 
@@ -517,14 +621,11 @@ class Dataset:
 
     def _add_record_changes(self) -> None:
         """Add changes in records to git"""
-        self._sleep_util_git_unlocked()
-        self._git_repo.index.add([str(self.review_manager.paths.RECORDS_FILE)])
+        self.add_changes(self.review_manager.paths.RECORDS_FILE)
 
     def add_setting_changes(self) -> None:
         """Add changes in settings to git"""
-        self._sleep_util_git_unlocked()
-
-        self._git_repo.index.add([str(self.review_manager.paths.SETTINGS_FILE)])
+        self.add_changes(self.review_manager.paths.SETTINGS_FILE)
 
     def has_untracked_search_records(self) -> bool:
         """Check whether there are untracked search records"""
@@ -535,11 +636,17 @@ class Dataset:
 
     def stash_unstaged_changes(self) -> bool:
         """Stash unstaged changes"""
+        self.flush_index_updates()
         ret = self._git_repo.git.stash("push", "--keep-index")
         return "No local changes to save" != ret
 
     def reset_log_if_no_changes(self) -> None:
         """Reset the report log file if there are not changes"""
+        report_path = self.review_manager.paths.report
+        if not report_path.is_file() or report_path.stat().st_size == 0:
+            # Nothing to reset (skip the git status check)
+            return
+        self.flush_index_updates()
         if not self._git_repo.is_dirty():
             self.review_manager.reset_report_logger()
 
@@ -549,6 +656,7 @@ class Dataset:
 
     def get_tree_hash(self) -> str:  # pragma: no cover
         """Get the current tree hash"""
+        self.flush_index_updates()
         tree_hash = self._git_repo.git.execute(["git", "write-tree"])
         return str(tree_hash)
 
@@ -2,6 +2,8 @@
 """Manages Docker"""
 from __future__ import annotations
 
+import json
+import time
 import typing
 from pathlib import Path
 
@@ -10,17 +12,93 @@ from docker.errors import DockerException
 
 import colrev.exceptions as colrev_exceptions
 from colrev.constants import Colors
+from colrev.constants import Filepaths
+
+# Images verified to be available locally (in this process)
+_VERIFIED_IMAGES: typing.Set[str] = set()
+# Images provisioned (requested by build_docker_image) in this process
+_PROVISIONED_IMAGES: typing.Set[str] = set()
 
 
 class DockerManager:
     """The DockerManager manages everything related to Docker
     (e.g. building images, running containers)"""
 
+    # Verified images are cached on disk for one day
+    IMAGE_CACHE_TTL = 24 * 60 * 60
+
+    @classmethod
+    def _load_image_cache(cls) -> dict:
+        try:
+            with open(Filepaths.DOCKER_IMAGES_CACHE_FILE, encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    @classmethod
+    def _image_verified(cls, imagename: str) -> bool:
+        if imagename in _VERIFIED_IMAGES:
+            return True
+        verified_at = cls._load_image_cache().get(imagename, 0)
+        if time.time() - verified_at < cls.IMAGE_CACHE_TTL:
+            _VERIFIED_IMAGES.add(imagename)
+            return True
+        return False
+
+    @classmethod
+    def _register_verified_image(cls, imagename: str) -> None:
+        _VERIFIED_IMAGES.add(imagename)
+        image_cache = cls._load_image_cache()
+        image_cache[imagename] = time.time()
+        try:
+            Filepaths.DOCKER_IMAGES_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(
+                Filepaths.DOCKER_IMAGES_CACHE_FILE, "w", encoding="utf-8"
+            ) as file:
+                json.dump(image_cache, file, indent=4)
+        except OSError:  # pragma: no cover
+            pass
+
+    @classmethod
+    def invalidate_image(cls, imagename: str) -> None:
+        """Remove the image from the cache of verified images
+        (e.g., when it was not found when running a container)"""
+        _VERIFIED_IMAGES.discard(imagename)
+        image_cache = cls._load_image_cache()
+        if image_cache.pop(imagename, None) is None:
+            return
+        try:
+            with open(
+                Filepaths.DOCKER_IMAGES_CACHE_FILE, "w", encoding="utf-8"
+            ) as file:
+                json.dump(image_cache, file, indent=4)
+        except OSError:  # pragma: no cover
+            pass
+
+    @classmethod
+    def is_provisioned(cls, imagename: str) -> bool:
+        """Check whether the image was provisioned in this process"""
+        return imagename in _PROVISIONED_IMAGES
+
+    @classmethod
+    def mark_provisioned(cls, imagename: str) -> None:
+        """Mark the image as provisioned in this process
+        (e.g., when an already running container is used)"""
+        _PROVISIONED_IMAGES.add(imagename)
+
     @classmethod
     def build_docker_image(
         cls, *, imagename: str, dockerfile: typing.Optional[Path] = None
     ) -> None:
-        """Build a docker image"""
+        """Build a docker image
+
+        Endpoints should call this method when a container is needed
+        (not in their constructors). Images that were verified recently
+        (in this process or within the IMAGE_CACHE_TTL) are not checked again."""
+
+        cls.mark_provisioned(imagename)
+        if cls._image_verified(imagename):
+            return
 
         try:
             client = docker.from_env()
@@ -48,6 +126,7 @@ class DockerManager:
                 detailed_trace=f"Docker service not available ({exc}). "
                 + "Please install/start Docker.",
             ) from exc
+        cls._register_verified_image(imagename)
 
     @classmethod
     def check_docker_installed(cls) -> None:  # pragma: no cover
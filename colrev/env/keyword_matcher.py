@@ -0,0 +1,77 @@
+#! /usr/bin/env python
+"""Matcher for keyword lists (substrings, whole strings, and prefixes)."""
+from __future__ import annotations
+
+import re
+import typing
+
+
+def _get_trie_pattern(keywords: typing.Iterable[str]) -> str:
+    """Get a regex pattern matching any of the keywords
+
+    Keywords are merged into a trie so that the regex engine does not
+    try each keyword at each position of the text. Keywords that extend
+    another keyword are not needed (the shorter keyword matches first)."""
+
+    trie: dict = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def get_pattern(node: dict) -> str:
+        if "" in node:
+            return ""
+        alternatives = [re.escape(char) + get_pattern(node[char]) for char in node]
+        if len(alternatives) == 1:
+            return alternatives[0]
+        return "(?:" + "|".join(alternatives) + ")"
+
+    return get_pattern(trie)
+
+
+# pylint: disable=too-few-public-methods
+class KeywordMatcher:
+    """Match texts against keyword lists (built once, e.g., per endpoint)
+
+    - substrings: the keyword occurs in the text
+    - strings: the keyword is the (whole) text
+    - prefixes: the text starts with the keyword
+
+    Texts are lower-cased once (if not case_sensitive). Substrings and prefixes
+    are combined in one compiled regex, whole strings are looked up in a set."""
+
+    def __init__(
+        self,
+        *,
+        substrings: typing.Iterable[str] = (),
+        strings: typing.Iterable[str] = (),
+        prefixes: typing.Iterable[str] = (),
+        case_sensitive: bool = False,
+    ) -> None:
+        self.case_sensitive = case_sensitive
+        substrings = [self._normalize(keyword) for keyword in substrings]
+        prefixes = [self._normalize(keyword) for keyword in prefixes]
+        self.strings = frozenset(self._normalize(keyword) for keyword in strings)
+
+        patterns = []
+        if prefixes:
+            patterns.append("^" + _get_trie_pattern(prefixes))
+        if substrings:
+            patterns.append(_get_trie_pattern(substrings))
+        self._pattern: typing.Optional[re.Pattern] = None
+        if patterns:
+            self._pattern = re.compile("|".join(f"(?:{p})" for p in patterns))
+
+    def _normalize(self, text: str) -> str:
+        return text if self.case_sensitive else text.lower()
+
+    def matches(self, text: str) -> bool:
+        """Check whether the text matches any of the keywords"""
+        text = self._normalize(text)
+        if text in self.strings:
+            return True
+        if self._pattern is None:
+            return False
+        return self._pattern.search(text) is not None
@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import re
+import typing
+from collections import OrderedDict
+from multiprocessing import Lock
 
 import pycountry
+from lingua import LanguageDetector  # pylint: disable=no-name-in-module
 from lingua import LanguageDetectorBuilder  # pylint: disable=no-name-in-module
 
 import colrev.exceptions as colrev_exceptions
@@ -12,22 +16,40 @@ import colrev.record.record
 from colrev.constants import Fields
 
 
+# The language detector has a large memory footprint.
+# It is shared by all LanguageService objects and built on first use.
+_LINGUA_LANGUAGE_DETECTOR: typing.Optional[LanguageDetector] = None
+_LINGUA_LANGUAGE_DETECTOR_LOCK = Lock()
+
+# Detected languages, keyed by the normalized text
+_LANGUAGE_CACHE: typing.OrderedDict[str, str] = OrderedDict()
+_LANGUAGE_CACHE_LOCK = Lock()
+_LANGUAGE_CACHE_MAX_ENTRIES = 200000
+
+
+def _get_lingua_language_detector() -> LanguageDetector:
+    # pylint: disable=global-statement
+    global _LINGUA_LANGUAGE_DETECTOR
+    with _LINGUA_LANGUAGE_DETECTOR_LOCK:
+        if _LINGUA_LANGUAGE_DETECTOR is None:
+            # Note : Lingua is tested/evaluated relative to other libraries:
+            # https://github.com/pemistahl/lingua-py
+            # It performs particularly well for short strings (single words/word pairs)
+            # The langdetect library is non-deterministic, especially for short strings
+            # https://pypi.org/project/langdetect/
+            # Language models are loaded lazily (when they are needed).
+            _LINGUA_LANGUAGE_DETECTOR = (
+                LanguageDetectorBuilder.from_all_languages_with_latin_script().build()
+            )
+        return _LINGUA_LANGUAGE_DETECTOR
+
+
 class LanguageService:
     """Service to detect languages and handle language codes"""
 
     _eng_false_negatives = ["editorial", "introduction"]
 
     def __init__(self) -> None:
-        # Note : Lingua is tested/evaluated relative to other libraries:
-        # https://github.com/pemistahl/lingua-py
-        # It performs particularly well for short strings (single words/word pairs)
-        # The langdetect library is non-deterministic, especially for short strings
-        # https://pypi.org/project/langdetect/
-
-        self._lingua_language_detector = (
-            LanguageDetectorBuilder.from_all_languages_with_latin_script().build()
-        )
-
         # Language formats: ISO 639-1 standard language codes
         # https://pypi.org/project/langcodes/
         # https://github.com/flyingcircusio/pycountry
@@ -36,6 +58,14 @@ class LanguageService:
         for country in pycountry.languages:
             self._lang_code_mapping[country.name.lower()] = country.alpha_3
 
+    @property
+    def _lingua_language_detector(self) -> LanguageDetector:
+        return _get_lingua_language_detector()
+
+    @classmethod
+    def _get_cache_key(cls, text: str) -> str:
+        return " ".join(text.split()).lower()
+
     # pylint: disable=too-many-return-statements
     # pylint: disable=too-many-branches
     def _determine_alphabet(self, str_to_check: str) -> str:
@@ -82,21 +112,60 @@ class LanguageService:
             return "chi"
         return ""  # pragma: no cover
 
+    def _get_language_code(self, *, text: str, language: typing.Any) -> str:
+        if language:
+            # There are too many errors/classifying papers as latin
+            if language.iso_code_639_3.name.lower() == "lat":
+                return ""
+            return language.iso_code_639_3.name.lower()
+
+        return self._determine_alphabet(text)
+
+    def _add_to_cache(self, languages: typing.Dict[str, str]) -> None:
+        with _LANGUAGE_CACHE_LOCK:
+            _LANGUAGE_CACHE.update(languages)
+            while len(_LANGUAGE_CACHE) > _LANGUAGE_CACHE_MAX_ENTRIES:
+                _LANGUAGE_CACHE.popitem(last=False)
+
     def compute_language(self, *, text: str) -> str:
         """Compute the most likely language code"""
 
         if text.lower() in self._eng_false_negatives:
             return "eng"
 
-        language = self._lingua_language_detector.detect_language_of(text)
+        cache_key = self._get_cache_key(text)
+        with _LANGUAGE_CACHE_LOCK:
+            if cache_key in _LANGUAGE_CACHE:
+                return _LANGUAGE_CACHE[cache_key]
 
-        if language:
-            # There are too many errors/classifying papers as latin
-            if language.iso_code_639_3.name.lower() == "lat":
-                return ""
-            return language.iso_code_639_3.name.lower()
+        language = self._lingua_language_detector.detect_language_of(text)
+        language_code = self._get_language_code(text=text, language=language)
+        self._add_to_cache({cache_key: language_code})
+        return language_code
+
+    def compute_languages(self, *, texts: typing.List[str]) -> typing.List[str]:
+        """Compute the most likely language codes (in parallel, for a list of texts)"""
+
+        cache_keys = [self._get_cache_key(text) for text in texts]
+        with _LANGUAGE_CACHE_LOCK:
+            to_detect = {
+                cache_key: text
+                for cache_key, text in zip(cache_keys, texts)
+                if cache_key not in _LANGUAGE_CACHE
+                and text.lower() not in self._eng_false_negatives
+            }
+        if to_detect:
+            detected = self._lingua_language_detector.detect_languages_in_parallel_of(
+                list(to_detect.values())
+            )
+            self._add_to_cache(
+                {
+                    cache_key: self._get_language_code(text=text, language=language)
+                    for (cache_key, text), language in zip(to_detect.items(), detected)
+                }
+            )
 
-        return self._determine_alphabet(text)
+        return [self.compute_language(text=text) for text in texts]
 
     def compute_language_confidence_values(self, *, text: str) -> list:
         """Computes the most likely languages of a string and their language codes"""
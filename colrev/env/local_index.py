@@ -20,11 +20,20 @@ import colrev.exceptions as colrev_exceptions
 import colrev.loader.load_utils
 import colrev.ops.check
 import colrev.record.record
+import colrev.record.record_similarity
 from colrev.constants import ENTRYTYPES
 from colrev.constants import Fields
+from colrev.constants import Filepaths
 from colrev.env.local_index_prep import prepare_record_for_return
 
 
+# Journal rankings (keyed by normalized journal name) and memoized lookups
+# (keyed by journal name), loaded once per process and sqlite file
+_JOURNAL_RANKINGS: typing.Dict[str, typing.Dict[str, list]] = {}
+_JOURNAL_RANKING_LOOKUPS: typing.Dict[str, typing.Dict[str, list]] = {}
+_JOURNAL_RANKINGS_LOCK = Lock()
+
+
 class LocalIndex:
     """The LocalIndex implements indexing and retrieval of records across projects"""
 
@@ -40,9 +49,29 @@ class LocalIndex:
         self.thread_lock = Lock()
 
     def get_journal_rankings(self, journal: str) -> list:
-        """Get the journal rankings from the sqlite database"""
-        sqlite_index_ranking = colrev.env.local_index_sqlite.SQLiteIndexRankings()
-        return sqlite_index_ranking.select(journal=journal)
+        """Get the journal rankings from the sqlite database
+
+        The rankings are loaded once (per process) and journal names are
+        matched after normalizing case and punctuation."""
+        sqlite_index_rankings = colrev.env.local_index_sqlite.SQLiteIndexRankings
+        sqlite_file = str(Filepaths.LOCAL_INDEX_SQLITE_FILE)
+        with _JOURNAL_RANKINGS_LOCK:
+            if sqlite_file not in _JOURNAL_RANKINGS:
+                _JOURNAL_RANKINGS[sqlite_file] = sqlite_index_rankings().select_all()
+                _JOURNAL_RANKING_LOOKUPS[sqlite_file] = {}
+            lookups = _JOURNAL_RANKING_LOOKUPS[sqlite_file]
+            if journal not in lookups:
+                lookups[journal] = _JOURNAL_RANKINGS[sqlite_file].get(
+                    sqlite_index_rankings.normalize_journal_name(journal), []
+                )
+            return list(lookups[journal])
+
+    @classmethod
+    def reset_journal_rankings(cls) -> None:
+        """Reset the journal rankings (e.g., after indexing)"""
+        with _JOURNAL_RANKINGS_LOCK:
+            _JOURNAL_RANKINGS.clear()
+            _JOURNAL_RANKING_LOOKUPS.clear()
 
     def _retrieve_based_on_colrev_id(
         self, cids_to_retrieve: list
@@ -203,6 +232,22 @@ class LocalIndex:
             raise colrev_exceptions.RecordNotInIndexException(toc_key)
         return toc_items
 
+    def get_toc_records(self, toc_key: str) -> typing.List[dict]:
+        """Get the records of a toc (table-of-contents)"""
+
+        toc_items = self._get_toc_items(toc_key, search_across_tocs=False)
+        # SQLiteIndexRecord() must be after _get_toc_items(), which also uses the sqlite file
+        sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord()
+        try:
+            return [
+                sqlite_index_record.get(
+                    key=Fields.COLREV_ID, value=toc_records_colrev_id
+                )
+                for toc_records_colrev_id in toc_items
+            ]
+        finally:
+            sqlite_index_record.connection.close()
+
     def retrieve_from_toc(
         self,
         record: colrev.record.record.Record,
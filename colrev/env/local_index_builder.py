@@ -17,6 +17,7 @@ import requests_cache
 from tqdm import tqdm
 
 import colrev.env.environment_manager
+import colrev.env.local_index
 import colrev.env.local_index_sqlite
 import colrev.env.resources
 import colrev.env.tei_parser
@@ -418,3 +419,4 @@ class LocalIndexBuilder:
             )
             sqlite_index_ranking = colrev.env.local_index_sqlite.SQLiteIndexRankings()
             sqlite_index_ranking.insert_df(data_frame)
+            colrev.env.local_index.LocalIndex.reset_journal_rankings()
@@ -2,6 +2,7 @@
 """LocalIndex: sqlite."""
 from __future__ import annotations
 
+import re
 import sqlite3
 import typing
 
@@ -255,9 +256,15 @@ class SQLiteIndexRankings(SQLiteIndex):
 
     INDEX_NAME = "rankings"
     KEYS: typing.List[str] = []
+    NORMALIZED_JOURNAL_NAME = "journal_name_normalized"
 
     CREATE_TABLE_QUERY = f"CREATE TABLE {INDEX_NAME} (id TEXT PRIMARY KEY)"
-    SELECT_QUERY = f"SELECT * FROM {INDEX_NAME} WHERE journal_name = ?"
+    CREATE_INDEX_QUERY = (
+        f"CREATE INDEX IF NOT EXISTS {INDEX_NAME}_{NORMALIZED_JOURNAL_NAME} "
+        f"ON {INDEX_NAME} ({NORMALIZED_JOURNAL_NAME})"
+    )
+    SELECT_QUERY = f"SELECT * FROM {INDEX_NAME} WHERE {NORMALIZED_JOURNAL_NAME} = ?"
+    SELECT_ALL_QUERY = f"SELECT * FROM {INDEX_NAME}"
 
     def __init__(self, *, reinitialize: bool = False) -> None:
         super().__init__(
@@ -266,19 +273,50 @@ class SQLiteIndexRankings(SQLiteIndex):
             reinitialize=reinitialize,
         )
 
+    @classmethod
+    def normalize_journal_name(cls, journal: str) -> str:
+        """Normalize the journal name (case, punctuation, and whitespace)"""
+        journal = journal.lower().replace("&", " and ")
+        return " ".join(re.sub(r"[^\w\s]", " ", journal).split())
+
     def insert_df(self, data_frame: pd.DataFrame) -> None:
         """Insert a dataframe of journal rankings into the index"""
+        data_frame = data_frame.assign(
+            **{
+                self.NORMALIZED_JOURNAL_NAME: data_frame["journal_name"]
+                .fillna("")
+                .astype(str)
+                .map(self.normalize_journal_name)
+            }
+        )
         conn = sqlite3.connect(str(Filepaths.LOCAL_INDEX_SQLITE_FILE))
         data_frame.to_sql(self.INDEX_NAME, conn, if_exists="replace", index=False)
+        conn.execute(self.CREATE_INDEX_QUERY)
         conn.commit()
         conn.close()
 
+    def _get_rankings_from_rows(self, rows: list) -> list:
+        for row in rows:
+            row.pop(self.NORMALIZED_JOURNAL_NAME, None)
+        return rows
+
     def select(self, journal: str) -> list:
         """Select journal rankings from the index"""
 
         cur = self._get_cursor()
-        cur.execute(self.SELECT_QUERY, (journal,))
+        cur.execute(self.SELECT_QUERY, (self.normalize_journal_name(journal),))
         rankings = cur.fetchall()
+        return self._get_rankings_from_rows(rankings)
+
+    def select_all(self) -> typing.Dict[str, list]:
+        """Select all journal rankings (keyed by normalized journal name)"""
+
+        cur = self._get_cursor()
+        cur.execute(self.SELECT_ALL_QUERY)
+        rankings: typing.Dict[str, list] = {}
+        for row in self._get_rankings_from_rows(cur.fetchall()):
+            journal_name = self.normalize_journal_name(str(row["journal_name"] or ""))
+            rankings.setdefault(journal_name, []).append(row)
         return rankings
 
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 import typing
+from collections import defaultdict
 from pathlib import Path
 
 import requests
@@ -14,6 +15,7 @@ import colrev.env.grobid_service
 import colrev.exceptions as colrev_exceptions
 import colrev.process.operation
 import colrev.record.record
+import colrev.record.record_blocking
 from colrev.constants import ENTRYTYPES
 from colrev.constants import Fields
 from colrev.constants import RecordState
@@ -516,15 +518,13 @@ class TEIParser:
                             entrytype = ENTRYTYPES.BOOK
         return entrytype
 
-    def _get_tei_id_count(self, *, tei_id: str) -> int:
-        count = 0
-
+    def _get_target_references(self) -> typing.Dict[str, typing.List[Element]]:
+        """Get the in-text references (ref elements) per target (in one traversal)"""
+        target_references: typing.Dict[str, typing.List[Element]] = defaultdict(list)
         for reference in self.root.iter(self.ns["tei"] + "ref"):
             if "target" in reference.keys():
-                if reference.get("target") == f"#{tei_id}":
-                    count += 1
-
-        return count
+                target_references[reference.get("target")].append(reference)
+        return target_references
 
     def _get_dict_from_reference(self, reference: Element) -> dict:
         entrytype = self._get_entrytype(reference)
@@ -572,6 +572,9 @@ class TEIParser:
 
         #  https://epidoc.stoa.org/gl/latest/ref-title.html
 
+        if add_intext_citation_count:
+            target_references = self._get_target_references()
+
         bibliographies = self.root.iter(self.ns["tei"] + "listBibl")
         tei_bib_db = []
         for bibliography in bibliographies:
@@ -579,7 +582,9 @@ class TEIParser:
                 ref_rec = self._get_dict_from_reference(reference)
 
                 if add_intext_citation_count:
-                    nr_citations = self._get_tei_id_count(tei_id=ref_rec[Fields.ID])
+                    nr_citations = len(
+                        target_references.get(f"#{ref_rec[Fields.ID]}", [])
+                    )
                     ref_rec[Fields.NR_INTEXT_CITATIONS] = nr_citations  # type: ignore
 
                 tei_bib_db.append(ref_rec)
@@ -609,40 +614,37 @@ class TEIParser:
     def mark_references(self, *, records: dict):  # type: ignore
         """Mark references with the additional record ID"""
 
-        tei_records = self.get_references()
-        for record_dict in tei_records:
+        # Compare each reference only with the candidate records (blocking index)
+        blocking_index = colrev.record.record_blocking.BlockingIndex(
+            record_dict
+            for record_dict in records.values()
+            if record_dict[Fields.STATUS]
+            in [RecordState.rev_included, RecordState.rev_synthesized]
+        )
+        bibliography_references = defaultdict(list)
+        bibliography = self.root.find(f".//{self.ns['tei']}listBibl")
+        if bibliography is not None:
+            for ref in bibliography:
+                bibliography_references[ref.get(f'{self.ns["w3"]}id')].append(ref)
+        target_references = self._get_target_references()
+
+        for record_dict in self.get_references():
             if Fields.TITLE not in record_dict:
                 continue
 
-            max_sim = 0.9
-            max_sim_record = {}
-            for local_record_dict in records.values():
-                if local_record_dict[Fields.STATUS] not in [
-                    RecordState.rev_included,
-                    RecordState.rev_synthesized,
-                ]:
-                    continue
-                rec_sim = colrev.record.record.Record.get_record_similarity(
-                    colrev.record.record.Record(record_dict),
-                    colrev.record.record.Record(local_record_dict),
-                )
-                if rec_sim > max_sim:
-                    max_sim_record = local_record_dict
-                    max_sim = rec_sim
-            if len(max_sim_record) == 0:
+            max_sim_record, max_sim = blocking_index.get_most_similar(record_dict)
+            if max_sim_record is None or max_sim <= 0.9:
                 continue
 
             # Record found: mark in tei
-            bibliography = self.root.find(f".//{self.ns['tei']}listBibl")
             # mark reference in bibliography
-            for ref in bibliography:
-                if ref.get(f'{self.ns["w3"]}id') == record_dict[Fields.TEI_ID]:
-                    ref.set(Fields.ID, max_sim_record[Fields.ID])
+            for ref in bibliography_references.get(record_dict[Fields.TEI_ID], []):
+                ref.set(Fields.ID, max_sim_record[Fields.ID])
             # mark reference in in-text citations
-            for reference in self.root.iter(f'{self.ns["tei"]}ref'):
-                if "target" in reference.keys():
-                    if reference.get("target") == f"#{record_dict['tei_id']}":
-                        reference.set(Fields.ID, max_sim_record[Fields.ID])
+            for reference in target_references.get(
+                f"#{record_dict[Fields.TEI_ID]}", []
+            ):
+                reference.set(Fields.ID, max_sim_record[Fields.ID])
 
             # if settings file available: dedupe_io match agains records
 
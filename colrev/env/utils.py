@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 """Collection of utility functions"""
+from __future__ import annotations
+
 import operator
 import pkgutil
 import re
@@ -10,12 +12,11 @@ from functools import reduce
 from pathlib import Path
 from pathlib import PosixPath
 
-from jinja2 import Environment
-from jinja2 import FunctionLoader
-from jinja2.environment import Template
-
 import colrev.exceptions as colrev_exceptions
 
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from jinja2.environment import Template
+
 
 def retrieve_package_file(*, template_file: Path, target: Path) -> None:
     """Retrieve a file from the CoLRev package"""
@@ -49,10 +50,44 @@ def inplace_change(*, filename: Path, old_string: str, new_string: str) -> None:
         file.write(content)
 
 
+def inplace_change_values(*, filename: Path, replacements: dict) -> None:
+    """Replace braced values ({old} -> {new}) in a file in one pass
+
+    replacements: {old_value: new_value}, e.g., renamed file paths in a bib file
+    """
+    if not replacements:
+        return
+    with open(filename, encoding="utf8") as file:
+        content = file.read()
+    new_content = re.sub(
+        r"\{([^{}\n]*)\}",
+        lambda match: "{" + replacements.get(match.group(1), match.group(1)) + "}",
+        content,
+    )
+    if new_content == content:
+        return
+    with open(filename, "w", encoding="utf8") as file:
+        file.write(new_content)
+
+
 def get_template(template_path: str) -> Template:
-    """Load a jinja template"""
+    """Load a jinja template (compiled templates are cached in the temp directory)"""
+    # pylint: disable=import-outside-toplevel
+    from jinja2 import Environment
+    from jinja2 import FileSystemBytecodeCache
+    from jinja2 import FunctionLoader
+
+    try:
+        bytecode_cache: typing.Optional[FileSystemBytecodeCache] = (
+            FileSystemBytecodeCache()
+        )
+    except RuntimeError:
+        # No (safe) temp directory available
+        bytecode_cache = None
     environment = Environment(
-        loader=FunctionLoader(_load_jinja_template), autoescape=True
+        loader=FunctionLoader(_load_jinja_template),
+        autoescape=True,
+        bytecode_cache=bytecode_cache,
     )
     template = environment.get_template(template_path)
     return template
@@ -7,7 +7,7 @@ def main() -> int:
     """Main entrypoint for the checks"""
 
     review_manager = colrev.review_manager.ReviewManager()
-    ret = review_manager.check_repo()
+    ret = review_manager.check_repo(staged_only=True)
 
     print(ret)
 
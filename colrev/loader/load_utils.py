@@ -129,24 +129,42 @@ Example json record:
 """
 from __future__ import annotations
 
+import importlib
 import logging
 import tempfile
 import typing
 from pathlib import Path
 
-import colrev.loader.bib
-import colrev.loader.enl
-import colrev.loader.json
-import colrev.loader.md
-import colrev.loader.nbib
-import colrev.loader.ris
-import colrev.loader.table
+# Record counts per file: {resolved path: (size, mtime_ns, nr_records)}
+_NR_RECORDS_CACHE: typing.Dict[str, typing.Tuple[int, int, int]] = {}
+
+# Loaders (module, class) per file suffix
+# Note: loaders are imported when they are used (e.g., the TableLoader requires pandas)
+_LOADERS = {
+    ".bib": ("colrev.loader.bib", "BIBLoader"),
+    ".csv": ("colrev.loader.table", "TableLoader"),
+    ".xls": ("colrev.loader.table", "TableLoader"),
+    ".xlsx": ("colrev.loader.table", "TableLoader"),
+    ".ris": ("colrev.loader.ris", "RISLoader"),
+    ".enl": ("colrev.loader.enl", "ENLLoader"),
+    ".txt": ("colrev.loader.enl", "ENLLoader"),
+    ".md": ("colrev.loader.md", "MarkdownLoader"),
+    ".nbib": ("colrev.loader.nbib", "NBIBLoader"),
+    ".json": ("colrev.loader.json", "JSONLoader"),
+}
 
 
 # pylint: disable=too-many-arguments
 # flake8: noqa: E501
 
 
+def _get_loader(filename: Path) -> typing.Any:
+    if filename.suffix not in _LOADERS:
+        raise NotImplementedError(f"Unsupported file type: {filename.suffix}")
+    module_name, class_name = _LOADERS[filename.suffix]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
 def load(  # type: ignore
     filename: Path,
     *,
@@ -165,22 +183,7 @@ def load(  # type: ignore
             return {}
         raise FileNotFoundError
 
-    if filename.suffix == ".bib":
-        parser = colrev.loader.bib.BIBLoader  # type: ignore
-    elif filename.suffix in [".csv", ".xls", ".xlsx"]:
-        parser = colrev.loader.table.TableLoader  # type: ignore
-    elif filename.suffix == ".ris":
-        parser = colrev.loader.ris.RISLoader  # type: ignore
-    elif filename.suffix in [".enl", ".txt"]:
-        parser = colrev.loader.enl.ENLLoader  # type: ignore
-    elif filename.suffix == ".md":
-        parser = colrev.loader.md.MarkdownLoader  # type: ignore
-    elif filename.suffix == ".nbib":
-        parser = colrev.loader.nbib.NBIBLoader  # type: ignore
-    elif filename.suffix == ".json":
-        parser = colrev.loader.json.JSONLoader  # type: ignore
-    else:
-        raise NotImplementedError(f"Unsupported file type: {filename.suffix}")
+    parser = _get_loader(filename)
 
     return parser(
         filename=filename,
@@ -237,26 +240,25 @@ def loads(  # type: ignore
 def get_nr_records(  # type: ignore
     filename: Path,
 ) -> int:
-    """Get the number of records in a file"""
+    """Get the number of records in a file
+
+    Counts are cached (per path, size and modification time)."""
 
     if not filename.exists():
         return 0
 
-    if filename.suffix == ".bib":
-        parser = colrev.loader.bib.BIBLoader  # type: ignore
-    elif filename.suffix in [".csv", ".xls", ".xlsx"]:
-        parser = colrev.loader.table.TableLoader  # type: ignore
-    elif filename.suffix == ".ris":
-        parser = colrev.loader.ris.RISLoader  # type: ignore
-    elif filename.suffix in [".enl", ".txt"]:
-        parser = colrev.loader.enl.ENLLoader  # type: ignore
-    elif filename.suffix == ".md":
-        parser = colrev.loader.md.MarkdownLoader  # type: ignore
-    elif filename.suffix == ".nbib":
-        parser = colrev.loader.nbib.NBIBLoader  # type: ignore
-    elif filename.suffix == ".json":
-        parser = colrev.loader.json.JSONLoader  # type: ignore
-    else:
-        raise NotImplementedError(f"Unsupported file type: {filename.suffix}")
+    file_stat = filename.stat()
+    cache_key = str(filename.resolve())
+    cached = _NR_RECORDS_CACHE.get(cache_key)
+    if cached and cached[:2] == (file_stat.st_size, file_stat.st_mtime_ns):
+        return cached[2]
 
-    return parser.get_nr_records(filename)
+    parser = _get_loader(filename)
+
+    nr_records = parser.get_nr_records(filename)
+    _NR_RECORDS_CACHE[cache_key] = (
+        file_stat.st_size,
+        file_stat.st_mtime_ns,
+        nr_records,
+    )
+    return nr_records
@@ -4,13 +4,16 @@ from __future__ import annotations
 
 import html
 import re
+import typing
 
-import colrev.env.language_service
 import colrev.exceptions as colrev_exceptions
 from colrev.constants import Fields
 from colrev.constants import FieldValues
 from colrev.constants import RecordState
 
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import colrev.record.record
+
 # pylint: disable=too-few-public-methods
 
 
@@ -40,7 +43,7 @@ class LoadFormatter:
         '"u': "ü",
     }
 
-    _FIELDS_TO_PROCESS = [
+    _FIELDS_TO_PROCESS = {
         Fields.AUTHOR,
         Fields.YEAR,
         Fields.TITLE,
@@ -52,9 +55,21 @@ class LoadFormatter:
         Fields.PAGES,
         Fields.DOI,
         Fields.ABSTRACT,
-    ]
+    }
+
+    # Single pass over the string: braced sequences (e.g., {\"a}) take precedence,
+    # longer sequences are matched first
+    _LATEX_SPECIAL_CHAR_PATTERN = re.compile(
+        "|".join(
+            re.escape(f"{{{latex_char}}}") + "|" + re.escape(latex_char)
+            for latex_char in sorted(_LATEX_SPECIAL_CHAR_MAPPING, key=len, reverse=True)
+        )
+    )
 
     def __init__(self) -> None:
+        # pylint: disable=import-outside-toplevel
+        import colrev.env.language_service
+
         self.language_service = colrev.env.language_service.LanguageService()
 
     def _fix_author_particles(self, record: colrev.record.record.Record) -> None:
@@ -124,13 +139,14 @@ class LoadFormatter:
         self._rename_issue_to_number(record)
 
     def _unescape_latex(self, *, input_str: str) -> str:
-        for latex_char, repl_char in self._LATEX_SPECIAL_CHAR_MAPPING.items():
-            input_str = input_str.replace(f"{{{latex_char}}}", repl_char)
-            input_str = input_str.replace(latex_char, repl_char)
-        return input_str
+        return self._LATEX_SPECIAL_CHAR_PATTERN.sub(
+            lambda match: self._LATEX_SPECIAL_CHAR_MAPPING[match.group().strip("{}")],
+            input_str,
+        )
 
     def _unescape_html(self, *, input_str: str) -> str:
-        input_str = html.unescape(input_str)
+        if "&" in input_str:
+            input_str = html.unescape(input_str)
         if "<" in input_str:
             input_str = re.sub(r"<.*?>", "", input_str)
         return input_str
@@ -142,7 +158,8 @@ class LoadFormatter:
             record.data[field] = str(record.data[field])
             if "\\" in record.data[field]:
                 record.data[field] = self._unescape_latex(input_str=record.data[field])
-            record.data[field] = self._unescape_html(input_str=record.data[field])
+            if "&" in record.data[field] or "<" in record.data[field]:
+                record.data[field] = self._unescape_html(input_str=record.data[field])
 
             record.data[field] = record.data[field].replace("\n", " ").rstrip().lstrip()
 
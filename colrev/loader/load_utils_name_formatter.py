@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 import typing
+from functools import lru_cache
 
 from colrev.constants import Fields
 
@@ -28,7 +29,7 @@ def split_tex_string(
         elif char == "}":
             brace_level -= 1
         elif brace_level == 0 and pos > 0:
-            match = sep_re.match(string[pos:])
+            match = sep_re.match(string, pos)
             if match:
                 sep_len = len(match.group())
                 if pos + sep_len < string_len:
@@ -122,6 +123,8 @@ class NameParser:
         return name_string
 
 
+# Author strings recur across records (and sources)
+@lru_cache(maxsize=10000)
 def parse_names(names: str) -> str:
     """Parse names"""
     if "," in names:
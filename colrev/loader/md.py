@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import logging
+import re
 import typing
+from multiprocessing import Lock
+from multiprocessing.pool import ThreadPool as Pool
 from pathlib import Path
 
 import requests
@@ -17,10 +20,31 @@ from colrev.constants import Fields
 # pylint: disable=duplicate-code
 # pylint: disable=too-many-arguments
 
+# BibTeX entries parsed by GROBID (without ID), keyed by the normalized reference
+_BIBTEX_CACHE: typing.Dict[str, str] = {}
+_BIBTEX_CACHE_LOCK = Lock()
+_BIBTEX_ENTRY_START = re.compile(r"^@", flags=re.MULTILINE)
+_BIBTEX_ENTRY_KEY = re.compile(r"^@(\w+)\{[^,\n]*,")
+
+
+def _normalize_reference(reference: str) -> str:
+    return " ".join(reference.split())
+
+
+def _set_entry_id(entry: str, *, record_id: str) -> str:
+    return _BIBTEX_ENTRY_KEY.sub(
+        lambda match: "@" + match.group(1) + "{" + record_id + ",", entry, count=1
+    )
+
 
 class MarkdownLoader(colrev.loader.loader.Loader):
     """Loads reference strings from text (md) files (based on GROBID)"""
 
+    # References per processCitationList request
+    CHUNK_SIZE = 50
+    NR_PARALLEL_REQUESTS = 4
+    TIMEOUT = 120
+
     def __init__(
         self,
         *,
@@ -55,6 +79,74 @@ class MarkdownLoader(colrev.loader.loader.Loader):
                     count += 1
         return count
 
+    def _parse_references(
+        self, *, grobid_url: str, references: typing.List[str]
+    ) -> typing.List[str]:
+        """Parse a chunk of references (one BibTeX entry per reference)"""
+        ret = requests.post(
+            grobid_url + "/api/processCitationList",
+            data={"consolidateCitations": "0", "citations": references},
+            headers={"Accept": "application/x-bibtex"},
+            timeout=self.TIMEOUT,
+        )
+        entries = [
+            entry.strip()
+            for entry in _BIBTEX_ENTRY_START.split(ret.text)
+            if entry.strip()
+        ]
+        if ret.status_code == 200 and len(entries) == len(references):
+            return ["@" + entry for entry in entries]
+
+        # Fallback: parse the references individually
+        entries = []
+        for reference in references:
+            ret = requests.post(
+                grobid_url + "/api/processCitation",
+                data={"consolidateCitations": "0", "citations": reference},
+                headers={"Accept": "application/x-bibtex"},
+                timeout=self.TIMEOUT,
+            )
+            entries.append(ret.text.strip() if ret.status_code == 200 else "")
+        return entries
+
+    def _get_bibtex_entries(
+        self, *, grobid_url: str, references: typing.List[str]
+    ) -> typing.Dict[str, str]:
+        """Get the BibTeX entries of the (normalized) references
+        (cached, in chunks, with a bounded number of parallel requests)"""
+
+        with _BIBTEX_CACHE_LOCK:
+            missing = [
+                reference
+                for reference in dict.fromkeys(references)
+                if reference not in _BIBTEX_CACHE
+            ]
+        chunks = [
+            missing[i : i + self.CHUNK_SIZE]
+            for i in range(0, len(missing), self.CHUNK_SIZE)
+        ]
+        if chunks:
+            with Pool(min(self.NR_PARALLEL_REQUESTS, len(chunks))) as pool:
+                results = pool.map(
+                    lambda chunk: self._parse_references(
+                        grobid_url=grobid_url, references=chunk
+                    ),
+                    chunks,
+                )
+            with _BIBTEX_CACHE_LOCK:
+                for chunk, entries in zip(chunks, results):
+                    # Failed requests (no entry) are not cached
+                    _BIBTEX_CACHE.update(
+                        (reference, entry)
+                        for reference, entry in zip(chunk, entries)
+                        if entry
+                    )
+
+        with _BIBTEX_CACHE_LOCK:
+            return {
+                reference: _BIBTEX_CACHE.get(reference, "") for reference in references
+            }
+
     def load_records_list(self) -> list:
         """Load records from the source"""
 
@@ -66,20 +158,20 @@ class MarkdownLoader(colrev.loader.loader.Loader):
         with open(self.filename, encoding="utf8") as file:
             references = [line.rstrip() for line in file if "#" not in line[:2]]
 
-        data = ""
-        ind = 0
-        for ref in references:
-            options = {}
-            options["consolidateCitations"] = "0"
-            options["citations"] = ref
-            ret = requests.post(
-                grobid_service.GROBID_URL + "/api/processCitation",
-                data=options,
-                headers={"Accept": "application/x-bibtex"},
-                timeout=30,
-            )
-            ind += 1
-            data = data + "\n" + ret.text.replace("{-1,", "{" + str(ind) + ",")
+        # Records are numbered by their position in the reference list
+        numbered_references = {
+            ind: _normalize_reference(ref)
+            for ind, ref in enumerate(references, start=1)
+            if ref.strip()
+        }
+        bibtex_entries = self._get_bibtex_entries(
+            grobid_url=grobid_service.GROBID_URL,
+            references=list(numbered_references.values()),
+        )
+        data = "\n".join(
+            _set_entry_id(bibtex_entries[reference], record_id=str(ind))
+            for ind, reference in numbered_references.items()
+        )
 
         records_dict = colrev.loader.load_utils.loads(
             load_string=data,
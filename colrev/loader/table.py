@@ -2,6 +2,7 @@
 """Convenience functions to load tabular files (csv, xlsx)"""
 from __future__ import annotations
 
+import csv
 import logging
 import typing
 from pathlib import Path
@@ -45,8 +46,11 @@ class TableLoader(colrev.loader.loader.Loader):
     def get_nr_records(cls, filename: Path) -> int:
         """Get the number of records in the file"""
         if filename.name.endswith(".csv"):
-            data = pd.read_csv(filename)
-        elif filename.name.endswith((".xls", ".xlsx")):
+            # Count the (non-blank) rows without parsing the table
+            with open(filename, encoding="utf-8", newline="") as file:
+                nr_rows = sum(1 for row in csv.reader(file) if row)
+            return max(nr_rows - 1, 0)
+        if filename.name.endswith((".xls", ".xlsx")):
             data = pd.read_excel(filename, dtype=str)
         else:
             raise NotImplementedError
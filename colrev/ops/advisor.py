@@ -612,12 +612,12 @@ class Advisor:
         # Note : we can use many parallel processes
         # because __append_registered_repo_instructions mainly waits for the network
         # it does not use a lot of CPU capacity
-        pool = ThreadPool(50)
-        add_instructions = pool.map(
-            self._append_registered_repo_instructions, registered_paths
-        )
-
-        environment_instructions += list(filter(None, add_instructions))
+        if registered_paths:
+            with ThreadPool(min(50, len(registered_paths))) as pool:
+                add_instructions = pool.map(
+                    self._append_registered_repo_instructions, registered_paths
+                )
+            environment_instructions += list(filter(None, add_instructions))
 
         corrections_path = self.review_manager.paths.corrections
         if len(list(corrections_path.glob("*.json"))) > 0:
@@ -13,6 +13,8 @@ import yaml
 from git.exc import InvalidGitRepositoryError
 
 import colrev.exceptions as colrev_exceptions
+import colrev.loader.load_utils
+import colrev.process.status
 from colrev.constants import ExitCodes
 from colrev.constants import Fields
 from colrev.constants import OperationsType
@@ -22,6 +24,10 @@ from colrev.process.model import ProcessModel
 if typing.TYPE_CHECKING:  # pragma: no cover
     import colrev.review_manager
 
+# Start of an entry in the records file (group 1: entrytype, group 2: ID)
+_BIB_ENTRY_START = re.compile(r"^@(\w+)\s*\{\s*([^,\s]+)\s*,", re.MULTILINE)
+_BIB_ORIGIN_FIELD = re.compile(r"^\s*colrev_origin\s*=\s*\{([^}]*)\}", re.MULTILINE)
+
 
 class Checker:
     """The CoLRev checker makes sure the project setup is ok"""
@@ -484,10 +490,14 @@ class Checker:
                 )
 
     def _retrieve_prior(self) -> dict:
-        prior: dict = {Fields.STATUS: [], "persisted_IDs": []}
         prior_records = next(
             self.review_manager.dataset.load_records_from_history(), {}
         )
+        return self._get_prior(prior_records=prior_records)
+
+    @classmethod
+    def _get_prior(cls, *, prior_records: dict) -> dict:
+        prior: dict = {Fields.STATUS: [], "persisted_IDs": []}
         for prior_record in prior_records.values():
             for orig in prior_record[Fields.ORIGIN]:
                 prior[Fields.STATUS].append([orig, prior_record[Fields.STATUS]])
@@ -610,6 +620,32 @@ class Checker:
 
         return status_data
 
+    @classmethod
+    def _run_check_scripts(cls, check_scripts: list) -> list:
+        failure_items = []
+        for check_script in check_scripts:
+            try:
+                if not check_script["params"]:
+                    check_script["script"]()
+                else:
+                    if isinstance(check_script["params"], list):
+                        check_script["script"](*check_script["params"])
+                    else:
+                        check_script["script"](**check_script["params"])
+            except (
+                colrev_exceptions.MissingDependencyError,
+                colrev_exceptions.GitConflictError,
+                colrev_exceptions.PropagatedIDChange,
+                colrev_exceptions.DuplicateIDsError,
+                colrev_exceptions.OriginError,
+                colrev_exceptions.FieldValueError,
+                colrev_exceptions.StatusTransitionError,
+                colrev_exceptions.UnstagedGitChangesError,
+                colrev_exceptions.StatusFieldValueError,
+            ) as exc:
+                failure_items.append(f"{type(exc).__name__}: {exc}")
+        return failure_items
+
     def check_repo_basics(self) -> list:
         """Calls data.main() to update the stats"""
 
@@ -634,29 +670,7 @@ class Checker:
 
         check_scripts.extend(data_checks)
 
-        failure_items = []
-        for check_script in check_scripts:
-            try:
-                if not check_script["params"]:
-                    check_script["script"]()
-                else:
-                    if isinstance(check_script["params"], list):
-                        check_script["script"](*check_script["params"])
-                    else:
-                        check_script["script"](**check_script["params"])
-            except (
-                colrev_exceptions.MissingDependencyError,
-                colrev_exceptions.GitConflictError,
-                colrev_exceptions.PropagatedIDChange,
-                colrev_exceptions.DuplicateIDsError,
-                colrev_exceptions.OriginError,
-                colrev_exceptions.FieldValueError,
-                colrev_exceptions.StatusTransitionError,
-                colrev_exceptions.UnstagedGitChangesError,
-                colrev_exceptions.StatusFieldValueError,
-            ) as exc:
-                failure_items.append(f"{type(exc).__name__}: {exc}")
-        return failure_items
+        return self._run_check_scripts(check_scripts)
 
     def check_repo_extended(self) -> list:
         """Calls all checks that require prior data (take longer)"""
@@ -728,29 +742,225 @@ class Checker:
 
             check_scripts.extend(main_refs_checks)
 
-        failure_items = []
-        for check_script in check_scripts:
-            try:
-                if not check_script["params"]:
-                    check_script["script"]()
-                else:
-                    if isinstance(check_script["params"], list):
-                        check_script["script"](*check_script["params"])
-                    else:
-                        check_script["script"](**check_script["params"])
-            except (
-                colrev_exceptions.MissingDependencyError,
-                colrev_exceptions.GitConflictError,
-                colrev_exceptions.PropagatedIDChange,
-                colrev_exceptions.DuplicateIDsError,
-                colrev_exceptions.OriginError,
-                colrev_exceptions.FieldValueError,
-                colrev_exceptions.StatusTransitionError,
-                colrev_exceptions.UnstagedGitChangesError,
-                colrev_exceptions.StatusFieldValueError,
-            ) as exc:
-                failure_items.append(f"{type(exc).__name__}: {exc}")
-        return failure_items
+        return self._run_check_scripts(check_scripts)
+
+    @classmethod
+    def _split_bib_entries(cls, bib_str: str) -> typing.Optional[typing.Dict[str, str]]:
+        """Split the records file into entry strings (keyed by ID)
+
+        Returns None if the file contains duplicate IDs or non-record entries."""
+        starts = list(_BIB_ENTRY_START.finditer(bib_str))
+        entries: typing.Dict[str, str] = {}
+        for match, next_match in zip(starts, starts[1:] + [None]):  # type: ignore
+            if match.group(1).lower() in ["comment", "string", "preamble"]:
+                return None
+            end = next_match.start() if next_match else len(bib_str)
+            entries[match.group(2)] = bib_str[match.start() : end]
+        if len(entries) != len(starts):
+            return None
+        return entries
+
+    def _get_head_and_index_blobs(self, path: str) -> typing.Optional[typing.List[str]]:
+        """Get the file in HEAD and in the index (None: not in HEAD or the index)"""
+        git_repo = self.review_manager.dataset.get_repo()
+        if (path, 0) not in git_repo.index.entries:
+            return None
+        try:
+            head_blob = git_repo.head.commit.tree / path
+        except (KeyError, ValueError):
+            return None
+        index_blob = git_repo.index.entries[(path, 0)].to_blob(git_repo)
+        return [
+            blob.data_stream.read().decode("utf-8", "replace")
+            for blob in [head_blob, index_blob]
+        ]
+
+    def _get_staged_records_blobs(self) -> typing.Optional[typing.List[str]]:
+        """Get the records file in HEAD and in the index (None: full check required)"""
+        git_repo = self.review_manager.dataset.get_repo()
+        try:
+            head_commit = git_repo.head.commit
+        except ValueError:
+            return None
+        staged_paths = {
+            path
+            for diff_item in git_repo.index.diff(head_commit)
+            for path in [diff_item.a_path, diff_item.b_path]
+            if path
+        }
+
+        search_dir = str(self.review_manager.paths.SEARCH_DIR).replace("\\", "/")
+        if str(self.review_manager.paths.SETTINGS_FILE) in staged_paths or any(
+            path.startswith(search_dir + "/") for path in staged_paths
+        ):
+            return None
+        return self._get_head_and_index_blobs(
+            self.review_manager.paths.RECORDS_FILE_GIT
+        )
+
+    @classmethod
+    def _get_expected_status(
+        cls, head_status: typing.Any, added: typing.Any, removed: typing.Any
+    ) -> typing.Any:
+        if isinstance(head_status, dict):
+            return {
+                key: cls._get_expected_status(value, added[key], removed[key])
+                for key, value in head_status.items()
+            }
+        if isinstance(head_status, bool):
+            return head_status
+        return head_status + added - removed
+
+    def _staged_status_file_is_consistent(
+        self, *, prior_records: dict, records: dict
+    ) -> bool:
+        """Check whether the staged STATUS_FILE reflects the changed records
+
+        The statistics are sums over the records (and their origins). The
+        expected statistics are those in HEAD, plus those of the changed records
+        in the index, minus those of the changed records in HEAD."""
+
+        blobs = self._get_head_and_index_blobs(
+            str(self.review_manager.paths.STATUS_FILE).replace("\\", "/")
+        )
+        if blobs is None:
+            return False
+        head_status, staged_status = (yaml.safe_load(blob) for blob in blobs)
+        try:
+            expected_status = self._get_expected_status(
+                head_status,
+                colrev.process.status.get_status_stats(
+                    review_manager=self.review_manager, records=records
+                ).get_status_file_dict(),
+                colrev.process.status.get_status_stats(
+                    review_manager=self.review_manager, records=prior_records
+                ).get_status_file_dict(),
+            )
+        except (KeyError, TypeError):
+            return False
+        expected_status["completeness_condition"] = (
+            expected_status["nr_incomplete"] == 0
+            and expected_status["currently"]["md_retrieved"] == 0
+        )
+        return expected_status == staged_status
+
+    def _load_changed_records(self, *, entries: dict, changed_ids: set) -> dict:
+        changed_str = "".join(
+            entries[record_id]
+            for record_id in sorted(changed_ids)
+            if record_id in entries
+        )
+        if not changed_str:
+            return {}
+        return colrev.loader.load_utils.loads(
+            load_string=changed_str,
+            implementation="bib",
+            logger=self.review_manager.logger,
+        )
+
+    def _get_staged_status_data(self) -> typing.Optional[dict]:
+        """Get the prior and status_data of the records changed in the index
+        (None: full check required)"""
+
+        blobs = self._get_staged_records_blobs()
+        if blobs is None:
+            return None
+        head_entries = self._split_bib_entries(blobs[0])
+        index_entries = self._split_bib_entries(blobs[1])
+        if head_entries is None or index_entries is None:
+            return None
+
+        changed_ids = {
+            record_id
+            for record_id in head_entries.keys() | index_entries.keys()
+            if head_entries.get(record_id) != index_entries.get(record_id)
+        }
+        prior_records = self._load_changed_records(
+            entries=head_entries, changed_ids=changed_ids
+        )
+        records = self._load_changed_records(
+            entries=index_entries, changed_ids=changed_ids
+        )
+
+        # Data endpoints (and their outputs) depend on the included records
+        if any(
+            record_dict[Fields.STATUS]
+            in [RecordState.rev_included, RecordState.rev_synthesized]
+            for record_dict in list(prior_records.values()) + list(records.values())
+        ):
+            return None
+
+        # status.yaml is updated based on all records
+        if not self._staged_status_file_is_consistent(
+            prior_records=prior_records, records=records
+        ):
+            return None
+
+        prior = self._get_prior(prior_records=prior_records)
+        status_data = self._retrieve_status_data(prior=prior, records=records)
+        # Origins of the unchanged records (for the uniqueness of origins)
+        for record_id, entry in index_entries.items():
+            if record_id in changed_ids:
+                continue
+            origin_field = _BIB_ORIGIN_FIELD.search(entry)
+            if not origin_field:
+                continue
+            for origin in origin_field.group(1).split(";"):
+                origin = origin.strip()
+                if origin:
+                    status_data["origin_ID_list"].setdefault(origin, []).append(
+                        record_id
+                    )
+        return {"prior": prior, "status_data": status_data}
+
+    def check_repo_staged(self) -> dict:
+        """Check the changes staged for the next commit
+        Entrypoint for pre-commit hooks (fast path)
+
+        Only the records that changed in the RECORDS_FILE (compared to HEAD)
+        are parsed and checked. The full check is run when the settings or
+        search sources changed, when included records changed, or when the
+        staged STATUS_FILE does not reflect the changed records."""
+
+        staged_data = self._get_staged_status_data()
+        if staged_data is None:
+            return self.check_repo()
+
+        environment_manager = self.review_manager.get_environment_manager()
+        check_scripts: list[dict[str, typing.Any]] = [
+            {
+                "script": environment_manager.check_git_installed,
+                "params": [],
+            },
+            {"script": self._check_git_conflicts, "params": []},
+            {"script": self.check_repository_setup, "params": []},
+            {"script": self._check_software, "params": []},
+            {
+                "script": self._check_colrev_origins,
+                "params": {"status_data": staged_data["status_data"]},
+            },
+            {
+                "script": self._check_change_in_propagated_ids,
+                "params": staged_data,
+            },
+            {
+                "script": self.check_status_transitions,
+                "params": {"status_data": staged_data["status_data"]},
+            },
+            {
+                "script": self._check_records_screen,
+                "params": {"status_data": staged_data["status_data"]},
+            },
+            {
+                "script": self.check_fields,
+                "params": {"status_data": staged_data["status_data"]},
+            },
+        ]
+        failure_items = self._run_check_scripts(check_scripts)
+
+        if failure_items:
+            return {"status": ExitCodes.FAIL, "msg": "  " + "\n  ".join(failure_items)}
+        return {"status": ExitCodes.SUCCESS, "msg": "Everything ok."}
 
     def check_repo(self) -> dict:
         """Check whether the repository is in a consistent state
@@ -5,7 +5,6 @@ from __future__ import annotations
 import typing
 from pathlib import Path
 
-import colrev.packages.grobid_tei.src.grobid_tei
 import colrev.process.operation
 from colrev.constants import Colors
 from colrev.constants import EndpointType
@@ -49,6 +48,9 @@ class Data(colrev.process.operation.Operation):
 
     def reading_heuristics(self) -> list:
         """Determine heuristics for the reading process"""
+        # pylint: disable=import-outside-toplevel
+        # pylint: disable=redefined-outer-name
+        import colrev.packages.grobid_tei.src.grobid_tei
 
         enlit_list = []
         records = self.review_manager.dataset.load_records_dict()
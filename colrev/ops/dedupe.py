@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import string
 import typing
-from collections import defaultdict
 from itertools import combinations
 from pathlib import Path
 
@@ -14,6 +13,7 @@ from bib_dedupe.bib_dedupe import prep
 import colrev.exceptions as colrev_exceptions
 import colrev.process.operation
 import colrev.record.record
+import colrev.record.record_clusters
 from colrev.constants import Colors
 from colrev.constants import EndpointType
 from colrev.constants import ENTRYTYPES
@@ -56,14 +56,6 @@ class Dedupe(colrev.process.operation.Operation):
         )
         self.dedupe_dir.mkdir(exist_ok=True, parents=True)
 
-    @classmethod
-    def _dfs(cls, node: str, graph: dict, visited: dict, component: list) -> None:
-        visited[node] = True
-        component.append(node)
-        for neighbor in graph[node]:
-            if not visited[neighbor]:
-                cls._dfs(neighbor, graph, visited, component)
-
     @classmethod
     def connected_components(cls, id_sets: list) -> list:
         """
@@ -75,24 +67,7 @@ class Dedupe(colrev.process.operation.Operation):
         Returns:
             list: A list of connected components.
         """
-        graph = defaultdict(list)
-
-        # Create an adjacency list
-        for origin_set in id_sets:
-            for combination in combinations(origin_set, 2):
-                graph[combination[0]].append(combination[1])
-                graph[combination[1]].append(combination[0])
-
-        visited = {node: False for node in graph}
-        components = []
-
-        for node in graph:
-            if not visited[node]:
-                component: typing.List[str] = []
-                cls._dfs(node, graph, visited, component)
-                components.append(sorted(component))
-
-        return components
+        return colrev.record.record_clusters.get_connected_components(id_sets)
 
     @classmethod
     def get_records_for_dedupe(
@@ -444,35 +419,59 @@ class Dedupe(colrev.process.operation.Operation):
             set_to_md_processed=set_to_md_processed,
         )
 
+    @classmethod
+    def _get_current_record(cls, *, records: dict, record_id: str) -> dict:
+        """Follow the MOVED_DUPE_ID marks (with path compression)"""
+        current_record = records[record_id]
+        while "MOVED_DUPE_ID" in current_record:
+            current_record = records[current_record["MOVED_DUPE_ID"]]
+        record_dict = records[record_id]
+        while "MOVED_DUPE_ID" in record_dict:
+            next_record_dict = records[record_dict["MOVED_DUPE_ID"]]
+            record_dict["MOVED_DUPE_ID"] = current_record[Fields.ID]
+            record_dict = next_record_dict
+        return current_record
+
     def _get_records_to_merge(
         self, *, records: dict, id_sets: list
     ) -> typing.Iterable[tuple]:
         """Resolves multiple/chained duplicates (by following the MOVED_DUPE_ID mark)
         and returns tuples with the primary merge record in the first position."""
 
+        # IDs of each set are resolved in the order of the records
+        positions = {record_id: pos for pos, record_id in enumerate(records)}
         for id_set in id_sets:
-            recs_to_merge = [r for r in records.values() if r[Fields.ID] in id_set]
-
-            # Simple way of implementing the closure
-            # cases where the main_record has already been merged into another record
-            for ind, rec_to_merge in enumerate(recs_to_merge):
-                cur_rec = rec_to_merge
-                while "MOVED_DUPE_ID" in cur_rec:
-                    cur_rec = records[cur_rec["MOVED_DUPE_ID"]]
-                recs_to_merge[ind] = cur_rec
+            # IDs of the set that were not (yet) merged into another record of the set
+            current_ids: typing.List[str] = []
+            for record_id in sorted(set(id_set), key=positions.__getitem__):
+                for current_id in current_ids:
+                    # Resolve cases where records have already been merged
+                    rec_1 = self._get_current_record(
+                        records=records, record_id=current_id
+                    )
+                    rec_2 = self._get_current_record(
+                        records=records, record_id=record_id
+                    )
+                    if rec_1[Fields.ID] == rec_2[Fields.ID]:
+                        continue
 
-            if all(recs_to_merge[0][Fields.ID] == r[Fields.ID] for r in recs_to_merge):
-                continue
+                    main_record_dict, dupe_record_dict = (
+                        self._select_primary_merge_record(rec_1, rec_2)
+                    )
 
-            for rec_1, rec_2 in combinations(recs_to_merge, 2):
-                main_record_dict, dupe_record_dict = self._select_primary_merge_record(
-                    rec_1, rec_2
-                )
+                    main_record = colrev.record.record.Record(main_record_dict)
+                    dupe_record = colrev.record.record.Record(dupe_record_dict)
 
-                main_record = colrev.record.record.Record(main_record_dict)
-                dupe_record = colrev.record.record.Record(dupe_record_dict)
+                    yield (main_record, dupe_record)
 
-                yield (main_record, dupe_record)
+                current_ids = list(
+                    dict.fromkeys(
+                        self._get_current_record(records=records, record_id=x)[
+                            Fields.ID
+                        ]
+                        for x in current_ids + [record_id]
+                    )
+                )
 
     def _get_origins_for_current_ids(self, current_record_ids: list) -> dict:
         """
@@ -2,8 +2,14 @@
 """CoLRev load operation: Load records from search sources into references.bib."""
 from __future__ import annotations
 
+import hashlib
 import itertools
+import json
+import multiprocessing as mp
 import string
+import typing
+from multiprocessing import Lock
+from multiprocessing.pool import ThreadPool as Pool
 from pathlib import Path
 
 import colrev.exceptions as colrev_exceptions
@@ -42,6 +48,9 @@ class Load(colrev.process.operation.Operation):
         self.package_manager = self.review_manager.get_package_manager()
 
         self.load_formatter = colrev.loader.load_utils_formatter.LoadFormatter()
+        # Search sources are loaded in parallel (the git repository
+        # and the append-only digests are not thread-safe)
+        self.append_only_lock = Lock()
 
         if not hide_load_explanation:
             self.review_manager.logger.info("Load")
@@ -57,46 +66,96 @@ class Load(colrev.process.operation.Operation):
                 "colrev/manual/metadata_retrieval/load.html"
             )
 
-    def _get_currently_imported_origin_list(self) -> list:
+    def _get_currently_imported_origins(self) -> typing.Set[str]:
         records_headers = self.review_manager.dataset.load_records_dict(
             header_only=True
         )
-        record_header_list = list(records_headers.values())
-        imported_origins = [
-            item for x in record_header_list for item in x[Fields.ORIGIN]
-        ]
+        imported_origins = {
+            item for x in records_headers.values() for item in x[Fields.ORIGIN]
+        }
         return imported_origins
 
+    def _load_append_only_digests(self) -> dict:
+        if not self.review_manager.paths.append_only_digests.is_file():
+            return {}
+        try:
+            with open(
+                self.review_manager.paths.append_only_digests, encoding="utf-8"
+            ) as file:
+                return json.load(file)
+        except json.JSONDecodeError:
+            return {}
+
+    def _save_append_only_digests(self, digests: dict) -> None:
+        self.review_manager.paths.append_only_digests.parent.mkdir(
+            parents=True, exist_ok=True
+        )
+        with open(
+            self.review_manager.paths.append_only_digests, "w", encoding="utf-8"
+        ) as file:
+            json.dump(digests, file, indent=4, sort_keys=True)
+
+    @classmethod
+    def _get_prefix_digest(cls, contents: bytes) -> dict:
+        return {
+            "length": len(contents),
+            "sha256": hashlib.sha256(contents).hexdigest(),
+        }
+
+    @classmethod
+    def _has_prefix(cls, contents: bytes, *, prefix_digest: dict) -> bool:
+        digest = cls._get_prefix_digest(contents[: prefix_digest["length"]])
+        return all(digest[key] == prefix_digest[key] for key in ["length", "sha256"])
+
     def ensure_append_only(self, file: Path) -> None:
         """Ensure that the file was only appended to.
 
         This method must be called for all packages that work
-        with an ex-post assignment of incremental IDs."""
+        with an ex-post assignment of incremental IDs.
+
+        The length and hash of the last verified (committed) version are stored
+        in the .colrev directory. Only versions that were committed afterwards
+        are verified (if the history was rewritten, all versions are verified again)."""
+
+        with self.append_only_lock:
+            prefix_digest = self._get_verified_prefix_digest(file)
+
+        current_contents = file.read_bytes().replace(b"\r", b"")
+        if not self._has_prefix(current_contents, prefix_digest=prefix_digest):
+            raise colrev_exceptions.AppendOnlyViolation(
+                f"{file} was changed (uncommitted file)"
+            )
 
+    def _get_verified_prefix_digest(self, file: Path) -> dict:
         git_repo = self.review_manager.dataset.get_repo()
 
         # Ensure the path uses forward slashes, which is compatible with Git's path handling
         search_file_path = str(Path("data/search") / file.name).replace("\\", "/")
-        revlist = (
-            (
-                commit.hexsha,
-                (commit.tree / search_file_path).data_stream.read(),
+
+        digests = self._load_append_only_digests()
+        prefix_digest = self._get_prefix_digest(b"")
+        new_commits = []
+        for commit in git_repo.iter_commits(paths=str(file)):
+            if commit.hexsha == digests.get(search_file_path, {}).get("commit"):
+                prefix_digest = digests[search_file_path]
+                break
+            new_commits.append(commit)
+
+        for commit in reversed(new_commits):
+            filecontents = (
+                (commit.tree / search_file_path).data_stream.read().replace(b"\r", b"")
             )
-            for commit in git_repo.iter_commits(paths=str(file))
-        )
-        prior_file_content = ""
-        for commit, filecontents in list(revlist):
-            if not filecontents.decode("utf-8").startswith(prior_file_content):
+            if not self._has_prefix(filecontents, prefix_digest=prefix_digest):
                 raise colrev_exceptions.AppendOnlyViolation(
-                    f"{file} was changed (commit: {commit})"
+                    f"{file} was changed (commit: {commit.hexsha})"
                 )
-            prior_file_content = filecontents.decode("utf-8").replace("\r", "")
-        current_contents = file.read_text(encoding="utf-8").replace("\r", "")
+            prefix_digest = self._get_prefix_digest(filecontents)
+            prefix_digest["commit"] = commit.hexsha
 
-        if not current_contents.startswith(prior_file_content):
-            raise colrev_exceptions.AppendOnlyViolation(
-                f"{file} was changed (uncommitted file)"
-            )
+        if new_commits:
+            digests[search_file_path] = prefix_digest
+            self._save_append_only_digests(digests)
+        return prefix_digest
 
     def _import_provenance(
         self,
@@ -222,6 +281,7 @@ class Load(colrev.process.operation.Operation):
         source: colrev.package_manager.interfaces.SearchSourceInterface,
         *,
         select_new_records: bool = True,
+        imported_origins: typing.Optional[typing.Set[str]] = None,
     ) -> None:
         """
         Prepares a search source for loading records into the review manager's dataset.
@@ -234,6 +294,8 @@ class Load(colrev.process.operation.Operation):
             source: The search source package endpoint interface to prepare for loading.
             select_new_records: A boolean flag indicating whether to filter out records
                                 that have already been imported. Defaults to True.
+            imported_origins: The origins that are currently in the records file
+                              (loaded from the records file if not provided).
         """
         source_records_list = list(source.load(self).values())  # type: ignore
         self._validate_source_records(source_records_list, source=source)
@@ -246,9 +308,11 @@ class Load(colrev.process.operation.Operation):
                 target_state=RecordState.md_retrieved
             )
 
-        imported_origins = []
-        if select_new_records:
-            imported_origins = self._get_currently_imported_origin_list()
+        if not select_new_records:
+            imported_origins = set()
+        else:
+            if imported_origins is None:
+                imported_origins = self._get_currently_imported_origins()
             source_records_list = [
                 x
                 for x in source_records_list
@@ -279,58 +343,175 @@ class Load(colrev.process.operation.Operation):
         self.review_manager.logger.debug(
             f"Load source records {source.search_source.filename}"
         )
-
         self.setup_source_for_load(source)
+        self._load_prepared_sources([source], keep_ids=keep_ids)
+
+    def _setup_sources_for_load(
+        self,
+        sources: typing.List[colrev.package_manager.interfaces.SearchSourceInterface],
+    ) -> typing.List[colrev.package_manager.interfaces.SearchSourceInterface]:
+        """Parse the search files in parallel (sources without records are skipped)"""
+
+        imported_origins = self._get_currently_imported_origins()
+
+        def _setup(
+            source: colrev.package_manager.interfaces.SearchSourceInterface,
+        ) -> typing.Optional[str]:
+            try:
+                self.setup_source_for_load(source, imported_origins=imported_origins)
+            except FileNotFoundError:
+                return f"{source.search_source.filename}: Nothing to load"
+            except colrev_exceptions.NoRecordsToImport as exc:
+                return str(exc)
+            except colrev_exceptions.ImportException as exc:
+                return f"{Colors.RED}{exc}{Colors.END}"
+            return None
+
+        pool = Pool(max(1, min(len(sources), mp.cpu_count())))
+        messages = pool.map(_setup, sources)
+        pool.close()
+        pool.join()
+
+        prepared_sources = []
+        for source, message in zip(sources, messages):
+            if message is None:
+                prepared_sources.append(source)
+                continue
+            if Colors.RED in message:
+                self.review_manager.logger.error(message)
+            else:
+                self.review_manager.logger.info(message)
+        return prepared_sources
+
+    def _import_source_records(
+        self,
+        sources: typing.List[colrev.package_manager.interfaces.SearchSourceInterface],
+    ) -> typing.Dict[str, list]:
+        """Run the load formatter and the quality model in a worker pool
+
+        Sources with records that cannot be imported are skipped (not in the result)."""
+
+        source_records_list = [
+            (str(source.search_source.filename), source_record)
+            for source in sources
+            for source_record in source.search_source.source_records_list
+        ]
+
+        def _import(
+            item: typing.Tuple[str, dict],
+        ) -> typing.Tuple[str, typing.Union[dict, Exception]]:
+            filename, record_dict = item
+            try:
+                return filename, self._import_record(record_dict=record_dict)
+            except colrev_exceptions.ImportException as exc:
+                return filename, exc
+
+        pool = Pool(mp.cpu_count())
+        results = pool.map(_import, source_records_list)
+        pool.close()
+        pool.join()
+
+        imported_records: typing.Dict[str, list] = {
+            str(source.search_source.filename): [] for source in sources
+        }
+        for filename, result in results:
+            if filename not in imported_records:
+                continue
+            if isinstance(result, Exception):
+                self.review_manager.logger.error(f"{Colors.RED}{result}{Colors.END}")
+                del imported_records[filename]
+                continue
+            imported_records[filename].append(result)
+        return imported_records
+
+    @classmethod
+    def _get_unique_id(cls, record_id: str, *, records: dict) -> str:
+        """Make sure not to replace existing records"""
+        order = 0
+        letters = list(string.ascii_lowercase)
+        next_unique_id = record_id
+        appends: list = []
+        while next_unique_id in records:
+            if len(appends) == 0:
+                order += 1
+                appends = list(itertools.product(letters, repeat=order))
+            next_unique_id = record_id + "".join(list(appends.pop(0)))
+        return next_unique_id
+
+    def _load_prepared_sources(
+        self,
+        sources: typing.List[colrev.package_manager.interfaces.SearchSourceInterface],
+        *,
+        keep_ids: bool,
+    ) -> typing.List[colrev.package_manager.interfaces.SearchSourceInterface]:
+        """Import the records of all sources and save the records file once
+
+        Returns the sources that were loaded."""
+
         records = self.review_manager.dataset.load_records_dict()
 
-        self.review_manager.logger.debug(
-            f"Import individual source records {source.search_source.filename}"
+        self.review_manager.logger.debug("Import individual source records")
+        # Fetch the DOI metadata and TOCs in bulk (instead of once per record)
+        self.quality_model.prefetch(
+            [
+                source_record
+                for source in sources
+                for source_record in source.search_source.source_records_list
+            ]
         )
-        for source_record in source.search_source.source_records_list:
-            source_record = self._import_record(record_dict=source_record)
-
-            # Make sure not to replace existing records
-            order = 0
-            letters = list(string.ascii_lowercase)
-            next_unique_id = source_record[Fields.ID]
-            appends: list = []
-            while next_unique_id in records:
-                if len(appends) == 0:
-                    order += 1
-                    appends = list(itertools.product(letters, repeat=order))
-                next_unique_id = source_record[Fields.ID] + "".join(
-                    list(appends.pop(0))
+        try:
+            imported_records = self._import_source_records(sources)
+            self.quality_model.run_deferred()
+        finally:
+            self.quality_model.reset_snapshot()
+        sources = [
+            source
+            for source in sources
+            if str(source.search_source.filename) in imported_records
+        ]
+        for source in sources:
+            for source_record in imported_records[str(source.search_source.filename)]:
+                source_record[Fields.ID] = self._get_unique_id(
+                    source_record[Fields.ID], records=records
                 )
-            source_record[Fields.ID] = next_unique_id
-
-            records[source_record[Fields.ID]] = source_record
+                records[source_record[Fields.ID]] = source_record
 
+                self.review_manager.logger.info(
+                    f" {Colors.GREEN}{source_record['ID']}".ljust(46)
+                    + f"md_retrieved →  {source_record['colrev_status']}{Colors.END}"
+                )
+        if not sources:
+            return []
+
+        imported_origins = {
+            origin for record in records.values() for origin in record[Fields.ORIGIN]
+        }
+        for source in sources:
+            self._validate_load(source=source, imported_origins=imported_origins)
+            if source.search_source.to_import == 0:
+                self.review_manager.logger.info(
+                    f"No additional records loaded ({source.search_source.filename})"
+                )
+                continue
             self.review_manager.logger.info(
-                f" {Colors.GREEN}{source_record['ID']}".ljust(46)
-                + f"md_retrieved →  {source_record['colrev_status']}{Colors.END}"
+                f"New records loaded ({source.search_source.filename.name})".ljust(38)
+                + f"{source.search_source.to_import} records"
             )
 
-        self.review_manager.logger.debug(
-            f"Save records {source.search_source.filename}"
-        )
-        self.review_manager.dataset.save_records_dict(records)
-        self._validate_load(source=source)
-
-        if source.search_source.to_import == 0:
-            self.review_manager.logger.info("No additional records loaded")
-            return
-
-        if not keep_ids:
+        self.review_manager.logger.debug("Save records")
+        if not keep_ids and any(imported_records.values()):
             # Set IDs based on local_index
             # (the same records are more likely to have the same ID on the same machine)
             self.review_manager.logger.debug("Set IDs")
-            records = self.review_manager.dataset.set_ids()
+            self.review_manager.dataset.set_ids(records=records)
+        else:
+            self.review_manager.dataset.save_records_dict(records)
+        self.quality_model.save_memo()
 
-        self.review_manager.logger.info(
-            "New records loaded".ljust(38) + f"{source.search_source.to_import} records"
-        )
         self.review_manager.dataset.add_setting_changes()
-        self.review_manager.dataset.add_changes(source.search_source.filename)
+        for source in sources:
+            self.review_manager.dataset.add_changes(source.search_source.filename)
+        return sources
 
     def _add_source_to_settings(
         self,
@@ -397,21 +578,28 @@ class Load(colrev.process.operation.Operation):
         self,
         *,
         source: colrev.package_manager.interfaces.SearchSourceInterface,
+        imported_origins: typing.Set[str],
     ) -> None:
-        imported_origins = self._get_currently_imported_origin_list()
-        imported = len(imported_origins) - source.search_source.len_before
+        origin_prefix = f"{source.search_source.get_origin_prefix()}/"
+        len_before = len(
+            [
+                o
+                for o in source.search_source.imported_origins
+                if o.startswith(origin_prefix)
+            ]
+        )
+        source_origins = [o for o in imported_origins if o.startswith(origin_prefix)]
+        imported = len(source_origins) - len_before
 
         if imported == source.search_source.to_import:
             return
         # Note : for diagnostics, it is easier if we complete the process
         # and create the commit (instead of raising an exception)
-        self.review_manager.logger.error(
-            f"len_before: {source.search_source.len_before}"
-        )
-        self.review_manager.logger.error(f"len_after: {len(imported_origins)}")
+        self.review_manager.logger.error(f"len_before: {len_before}")
+        self.review_manager.logger.error(f"len_after: {len(source_origins)}")
 
         origins_to_import = [
-            o[Fields.ORIGIN] for o in source.search_source.source_records_list
+            o[Fields.ORIGIN][0] for o in source.search_source.source_records_list
         ]
         if source.search_source.to_import - imported > 0:
             self.review_manager.logger.error(
@@ -419,9 +607,7 @@ class Load(colrev.process.operation.Operation):
                 f"{source.search_source.to_import - imported} records missing{Colors.END}"
             )
 
-            missing_origins = [
-                o for o in origins_to_import if o not in imported_origins
-            ]
+            missing_origins = [o for o in origins_to_import if o not in source_origins]
             self.review_manager.logger.error(
                 f"{Colors.RED}Records not yet imported: {missing_origins}{Colors.END}"
             )
@@ -432,23 +618,28 @@ class Load(colrev.process.operation.Operation):
                 f" records too much{Colors.END}"
             )
             additional_origins = [
-                o for o in imported_origins if o not in origins_to_import
+                o
+                for o in source_origins
+                if o not in origins_to_import
+                and o not in source.search_source.imported_origins
             ]
             self.review_manager.logger.error(
                 f"{Colors.RED}Records additionally imported: {additional_origins}{Colors.END}"
             )
 
-    def _create_load_commit(self, source: colrev.settings.SearchSource) -> None:
+    def _create_load_commit(
+        self,
+        sources: typing.List[colrev.package_manager.interfaces.SearchSourceInterface],
+    ) -> None:
         git_repo = self.review_manager.dataset.get_repo()
         stashed = "No local changes to save" != git_repo.git.stash(
             "push", "--keep-index"
         )
-        # part_exact_call = self.review_manager.exact_call
-        # self.review_manager.exact_call = (
-        #     f"{part_exact_call} -s {source.search_source.filename.name}"
-        # )
+        search_files = ", ".join(
+            f"data/search/{source.search_source.filename.name}" for source in sources
+        )
         self.review_manager.dataset.create_commit(
-            msg=f"Load: data/search/{source.search_source.filename.name} → "
+            msg=f"Load: {search_files} → "
             f"{self.review_manager.paths.RECORDS_FILE_GIT}",
             skip_hooks=True,
         )
@@ -463,26 +654,24 @@ class Load(colrev.process.operation.Operation):
         *,
         keep_ids: bool = False,
     ) -> None:
-        """Load records (main entrypoint)"""
+        """Load records (main entrypoint)
+
+        The search files are parsed in parallel, the records are formatted
+        and checked in a worker pool, and the records file is saved (and committed) once.
+        """
 
         if not self.review_manager.high_level_operation:
             print()
 
-        for source in self.load_active_sources():
-            try:
-                self.review_manager.logger.info(f"Load {source.search_source.filename}")
-                self._add_source_to_settings(source)
-                self.load_source_records(source, keep_ids=keep_ids)
-                self._create_load_commit(source)
+        sources = self.load_active_sources()
+        for source in sources:
+            self.review_manager.logger.info(f"Load {source.search_source.filename}")
+            self._add_source_to_settings(source)
 
-            except FileNotFoundError:
-                self.review_manager.logger.info(" Nothing to load")
-                print()
-            except colrev_exceptions.NoRecordsToImport as exc:
-                self.review_manager.logger.info(exc)
-                print()
-            except colrev_exceptions.ImportException as exc:
-                self.review_manager.logger.error(f"{Colors.RED}{exc}{Colors.END}")
+        sources = self._setup_sources_for_load(sources)
+        sources = self._load_prepared_sources(sources, keep_ids=keep_ids)
+        if sources:
+            self._create_load_commit(sources)
 
         self.review_manager.logger.info(
             f"{Colors.GREEN}Completed load operation{Colors.END}"
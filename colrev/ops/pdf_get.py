@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import shutil
+import typing
 from glob import glob
 from multiprocessing.pool import ThreadPool as Pool
 from pathlib import Path
 
+import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
 import colrev.process.operation
+import colrev.record.record_blocking
 import colrev.record.record_pdf
 from colrev.constants import Colors
 from colrev.constants import EndpointType
@@ -342,11 +345,11 @@ class PDFGet(colrev.process.operation.Operation):
     ) -> dict:
         """Check for PDFs that are in the pdfs directory but not linked in the record file"""
 
-        linked_pdfs = [
+        linked_pdfs = {
             str(Path(x[Fields.FILE]).resolve())
             for x in records.values()
             if Fields.FILE in x
-        ]
+        }
         pdf_dir = self.review_manager.paths.pdf
         pdf_files = glob(str(pdf_dir) + "/**.pdf", recursive=True)
         unlinked_pdfs = [
@@ -362,6 +365,8 @@ class PDFGet(colrev.process.operation.Operation):
         grobid_service = self.review_manager.get_grobid_service()
         grobid_service.start()
         self.review_manager.logger.info("Check unlinked PDFs")
+        # Compare each PDF only with the candidate records (blocking index)
+        blocking_index = colrev.record.record_blocking.BlockingIndex(records.values())
         for file in unlinked_pdfs:
             msg = f"Check unlinked PDF: {file.relative_to(self.review_manager.path)}"
             self.review_manager.logger.info(msg)
@@ -372,20 +377,9 @@ class PDFGet(colrev.process.operation.Operation):
                 if "error" in pdf_record:
                     continue
 
-                max_similarity = 0.0
-                max_sim_record = None
-                for record in records.values():
-                    sim = colrev.record.record_pdf.PDFRecord.get_record_similarity(
-                        colrev.record.record_pdf.PDFRecord(
-                            pdf_record, path=self.review_manager.path
-                        ),
-                        colrev.record.record_pdf.PDFRecord(
-                            record.copy(), path=self.review_manager.path
-                        ),
-                    )
-                    if sim > max_similarity:
-                        max_similarity = sim
-                        max_sim_record = record
+                max_sim_record, max_similarity = blocking_index.get_most_similar(
+                    pdf_record
+                )
                 if max_sim_record:
                     if max_similarity > 0.5:
                         if RecordState.pdf_prepared == max_sim_record[Fields.STATUS]:
@@ -418,10 +412,9 @@ class PDFGet(colrev.process.operation.Operation):
                         # if RecordState.pdf_needs_manual_preparation == colrev_status:
                         #     # revert?
             else:
-                record = records[file.stem]
                 self.link_pdf(
                     colrev.record.record_pdf.PDFRecord(
-                        record, path=self.review_manager.path
+                        records[file.stem], path=self.review_manager.path
                     )
                 )
 
@@ -435,15 +428,10 @@ class PDFGet(colrev.process.operation.Operation):
         record_dict: dict,
         file: Path,
         new_filename: Path,
-        pdfs_search_file: Path,
+        renamed_paths: dict,
     ) -> None:
-        record_dict[Fields.FILE] = new_filename
-        if pdfs_search_file.is_file():
-            colrev.env.utils.inplace_change(
-                filename=pdfs_search_file,
-                old_string="{" + str(file) + "}",
-                new_string="{" + str(new_filename) + "}",
-            )
+        # Note: the search file is updated for all renamed paths at once (in rename_pdfs)
+        renamed_paths[str(file)] = str(new_filename)
 
         if not file.is_file():
             corrected_path = Path(str(file).replace("  ", " "))
@@ -474,6 +462,8 @@ class PDFGet(colrev.process.operation.Operation):
         # review_manager.settings.sources
         pdfs_search_file = Path("data/search/pdfs.bib")
 
+        # Collect the renamed paths and update the search file in one pass
+        renamed_paths: typing.Dict[str, str] = {}
         for record_dict in records.values():
             if Fields.FILE not in record_dict:
                 continue
@@ -495,12 +485,15 @@ class PDFGet(colrev.process.operation.Operation):
                 record_dict=record_dict,
                 file=file,
                 new_filename=new_filename,
-                pdfs_search_file=pdfs_search_file,
+                renamed_paths=renamed_paths,
             )
 
         self.review_manager.dataset.save_records_dict(records)
 
         if pdfs_search_file.is_file():
+            colrev.env.utils.inplace_change_values(
+                filename=pdfs_search_file, replacements=renamed_paths
+            )
             self.review_manager.dataset.add_changes(pdfs_search_file)
 
     def _get_data(self) -> dict:
@@ -386,6 +386,37 @@ class PDFPrep(colrev.process.operation.Operation):
             except colrev_exceptions.TEIException:
                 self.review_manager.logger.error("Error generating TEI")
 
+    def _prepare_pdfs(self, *, pdf_prep_data: dict) -> None:
+        if self.review_manager.verbose_mode:
+            for item in pdf_prep_data["items"]:
+                record = item["record"]
+                record = self.prepare_pdf(item)
+                self.review_manager.dataset.save_records_dict(
+                    {record[Fields.ID]: record}, partial=True
+                )
+
+        else:
+            endpoint_names = [
+                s["endpoint"]
+                for s in self.review_manager.settings.pdf_prep.pdf_prep_package_endpoints
+            ]
+            if "colrev.grobid_tei" in endpoint_names:  # type: ignore
+                pool = Pool(mp.cpu_count() // 2)
+            elif "colrev.ocrmypdf" in endpoint_names:  # type: ignore
+                # OCR jobs are queued for the OCR workers (sized by CPU count)
+                pool = Pool(max(self.cpus, mp.cpu_count()))
+            else:
+                pool = Pool(self.cpus)
+            pdf_prep_record_list = pool.map(self.prepare_pdf, pdf_prep_data["items"])
+            pool.close()
+            pool.join()
+
+            self.review_manager.dataset.save_records_dict(
+                {r[Fields.ID]: r for r in pdf_prep_record_list}, partial=True
+            )
+
+            self._print_stats(pdf_prep_record_list=pdf_prep_record_list)
+
     @colrev.process.operation.Operation.decorate()
     def main(
         self,
@@ -444,32 +475,13 @@ class PDFPrep(colrev.process.operation.Operation):
             "PDFs to prep".ljust(38) + f'{pdf_prep_data["nr_tasks"]} PDFs'
         )
 
-        if self.review_manager.verbose_mode:
-            for item in pdf_prep_data["items"]:
-                record = item["record"]
-                record = self.prepare_pdf(item)
-                self.review_manager.dataset.save_records_dict(
-                    {record[Fields.ID]: record}, partial=True
-                )
-
-        else:
-            endpoint_names = [
-                s["endpoint"]
-                for s in self.review_manager.settings.pdf_prep.pdf_prep_package_endpoints
-            ]
-            if "colrev.grobid_tei" in endpoint_names:  # type: ignore
-                pool = Pool(mp.cpu_count() // 2)
-            else:
-                pool = Pool(self.cpus)
-            pdf_prep_record_list = pool.map(self.prepare_pdf, pdf_prep_data["items"])
-            pool.close()
-            pool.join()
-
-            self.review_manager.dataset.save_records_dict(
-                {r[Fields.ID]: r for r in pdf_prep_record_list}, partial=True
-            )
-
-            self._print_stats(pdf_prep_record_list=pdf_prep_record_list)
+        try:
+            self._prepare_pdfs(pdf_prep_data=pdf_prep_data)
+        finally:
+            # Endpoints may keep workers running (e.g., OCR containers)
+            for endpoint in self.pdf_prep_package_endpoints.values():
+                if hasattr(endpoint, "close"):
+                    endpoint.close()
 
         self.review_manager.dataset.create_commit(msg="PDFs: prepare")
         self.review_manager.logger.info(
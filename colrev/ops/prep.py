@@ -22,6 +22,7 @@ from requests.exceptions import ReadTimeout
 import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
 import colrev.loader.load_utils
+import colrev.package_manager.interfaces
 import colrev.process.operation
 import colrev.record.record_prep
 from colrev.constants import Colors
@@ -35,7 +36,6 @@ from colrev.writer.write_utils import to_string
 from colrev.writer.write_utils import write_file
 
 if typing.TYPE_CHECKING:  # pragma: no cover
-    import colrev.package_manager.interfaces
     import colrev.review_manager
     import colrev.settings
 
@@ -58,6 +58,7 @@ FIELDS_TO_KEEP = FieldSet.STANDARDIZED_FIELD_KEYS + [
 ]
 
 
+# pylint: disable=too-many-lines
 # pylint: disable=too-many-instance-attributes
 class Prep(colrev.process.operation.Operation):
     """Prepare records (metadata)"""
@@ -763,6 +764,15 @@ class Prep(colrev.process.operation.Operation):
                 )
                 endpoint.check_availability(source_operation=self)  # type: ignore
 
+    def _prefetch(self, preparation_data: list) -> None:
+        """Let endpoints process all records at once (e.g., in batches)"""
+        prefetch_interface = colrev.package_manager.interfaces.PrepPrefetchInterface
+        records = [item["record"] for item in preparation_data]
+        for endpoint in self.prep_package_endpoints.values():
+            # pylint: disable=no-value-for-parameter
+            if prefetch_interface.providedBy(endpoint):
+                endpoint.prefetch(records)  # type: ignore
+
     def _log_record_change_scores(
         self, *, preparation_data: list, prepared_records: list
     ) -> None:
@@ -892,6 +902,7 @@ class Prep(colrev.process.operation.Operation):
         self.review_manager.dataset.save_records_dict(
             {r[Fields.ID]: r for r in prepared_records}, partial=True
         )
+        self.quality_model.save_memo()
         self._log_commit_details(prepared_records)
         self.review_manager.dataset.create_commit(
             msg="Prep: improve record metadata",
@@ -947,6 +958,7 @@ class Prep(colrev.process.operation.Operation):
 
                 preparation_data = self._get_prep_data_tasks(prep_round)
                 previous_preparation_data = deepcopy(preparation_data)
+                self._prefetch(preparation_data)
 
                 self._print_estimated_time(preparation_data)
                 if self._nothing_to_prepare_condition(preparation_data):
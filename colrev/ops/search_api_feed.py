@@ -164,6 +164,27 @@ class SearchAPIFeed:
                 )
         return added_new
 
+    def relink_record(self, *, record_id: str, new_source_identifier: str) -> None:
+        """Change the source_identifier of a feed record (e.g., a renamed file)
+
+        The source_identifier is also updated in the corresponding main records
+        (if they contain the previous source_identifier)."""
+
+        feed_record_dict = self.feed_records[record_id]
+        old_source_identifier = feed_record_dict[self.source_identifier]
+        self._available_ids.pop(old_source_identifier, None)
+        self._available_ids[new_source_identifier] = record_id
+        feed_record_dict[self.source_identifier] = new_source_identifier
+
+        if self.prep_mode:
+            return
+        colrev_origin = f"{self.origin_prefix}/{record_id}"
+        for record_dict in self.records.values():
+            if colrev_origin not in record_dict[Fields.ORIGIN]:
+                continue
+            if record_dict.get(self.source_identifier, "") == old_source_identifier:
+                record_dict[self.source_identifier] = new_source_identifier
+
     def _have_changed(
         self,
         record_a: colrev.record.record.Record,
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import io
+import json
 import typing
 
+import git
 import yaml
 
 import colrev.env.utils
@@ -24,52 +26,74 @@ class Status(colrev.process.operation.Operation):
             operations_type=self.type,
         )
 
+    def _get_commit_analytics(self, commit: git.Commit) -> dict:
+        filecontents = (
+            commit.tree / str(self.review_manager.paths.STATUS_FILE)
+        ).data_stream.read()
+        var_t = io.StringIO(filecontents.decode("utf-8"))
+
+        # TBD: we could simply include the whole STATUS_FILE
+        # (to create a general-purpose status analyzer)
+        # -> flatten nested structures (e.g., overall/currently)
+        # -> integrate with get_status (current data) -
+        # and get_prior? (levels: aggregated_statistics vs. record-level?)
+
+        data_loaded = yaml.safe_load(var_t)
+        return {
+            "atomic_steps": data_loaded["atomic_steps"],
+            "completed_atomic_steps": data_loaded["completed_atomic_steps"],
+            "commit_id": commit.hexsha,
+            "commit_message": str(commit.message).split("\n", maxsplit=1)[0],
+            "commit_author": commit.author.name,
+            "committed_date": commit.committed_date,
+            "search": data_loaded["overall"]["md_retrieved"],
+            "included": data_loaded["overall"]["rev_included"],
+        }
+
+    def _load_analytics_store(self, git_repo: git.Repo) -> dict:
+        """Load the analytics of the commits that were processed before
+        (reset if the history was rewritten)"""
+        try:
+            with open(
+                self.review_manager.paths.status_analytics, encoding="utf-8"
+            ) as file:
+                store = json.load(file)
+            if git_repo.is_ancestor(store["head"], git_repo.head.commit):
+                return store
+        except (OSError, ValueError, KeyError, git.GitCommandError):
+            pass
+        return {"head": "", "commits": []}
+
     def get_analytics(self) -> dict:
-        """Get status analytics"""
+        """Get status analytics
 
-        analytics_dict = {}
-        git_repo = self.review_manager.dataset.get_repo()
+        The analytics of each commit are stored (append-only) and only
+        commits that are newer than the last processed commit are parsed."""
 
-        revlist = list(
-            (
-                commit.hexsha,
-                commit.message,
-                commit.author.name,
-                commit.committed_date,
-                (
-                    commit.tree / str(self.review_manager.paths.STATUS_FILE)
-                ).data_stream.read(),
+        git_repo = self.review_manager.dataset.get_repo()
+        head = git_repo.head.commit.hexsha
+
+        store = self._load_analytics_store(git_repo)
+        if store["head"] != head:
+            rev = f"{store['head']}..{head}" if store["head"] else head
+            store["commits"].extend(
+                self._get_commit_analytics(commit)
+                for commit in reversed(
+                    list(
+                        git_repo.iter_commits(
+                            rev, paths=str(self.review_manager.paths.STATUS_FILE)
+                        )
+                    )
+                )
             )
-            for commit in git_repo.iter_commits(
-                paths=str(self.review_manager.paths.STATUS_FILE)
+            store["head"] = head
+            self.review_manager.paths.status_analytics.parent.mkdir(
+                parents=True, exist_ok=True
             )
-        )
-        for ind, (
-            commit_id,
-            commit_msg,
-            commit_author,
-            committed_date,
-            filecontents,
-        ) in enumerate(revlist):
-            var_t = io.StringIO(filecontents.decode("utf-8"))
-
-            # TBD: we could simply include the whole STATUS_FILE
-            # (to create a general-purpose status analyzer)
-            # -> flatten nested structures (e.g., overall/currently)
-            # -> integrate with get_status (current data) -
-            # and get_prior? (levels: aggregated_statistics vs. record-level?)
-
-            data_loaded = yaml.safe_load(var_t)
-            analytics_dict[len(revlist) - ind] = {
-                "atomic_steps": data_loaded["atomic_steps"],
-                "completed_atomic_steps": data_loaded["completed_atomic_steps"],
-                "commit_id": commit_id,
-                "commit_message": commit_msg.split("\n")[0],
-                "commit_author": commit_author,
-                "committed_date": committed_date,
-                "search": data_loaded["overall"]["md_retrieved"],
-                "included": data_loaded["overall"]["rev_included"],
-            }
+            with open(
+                self.review_manager.paths.status_analytics, "w", encoding="utf-8"
+            ) as file:
+                json.dump(store, file)
 
         # keys = list(analytics_dict.values())[0].keys()
         # with open("analytics.csv", "w", newline="", encoding="utf8") as output_file:
@@ -77,14 +101,19 @@ class Status(colrev.process.operation.Operation):
         #     dict_writer.writeheader()
         #     dict_writer.writerows(reversed(analytics_dict.values()))
 
-        return analytics_dict
+        return dict(reversed(list(enumerate(store["commits"], start=1))))
 
     def get_review_status_report(
-        self, *, records: typing.Optional[dict] = None, colors: bool = True
+        self,
+        *,
+        records: typing.Optional[dict] = None,
+        status_stats: typing.Optional[colrev.process.status.StatusStats] = None,
+        colors: bool = True,
     ) -> str:
         """Get the review status report"""
 
-        status_stats = self.review_manager.get_status_stats(records=records)
+        if status_stats is None:
+            status_stats = self.review_manager.get_status_stats(records=records)
 
         template = colrev.env.utils.get_template(template_path="ops/commit/status.txt")
 
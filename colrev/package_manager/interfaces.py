@@ -144,6 +144,16 @@ class PrepInterface(
         """Run the prep operation"""
 
 
+# pylint: disable=too-few-public-methods
+class PrepPrefetchInterface(PrepInterface):  # pylint: disable=inherit-non-class
+    """The PackageEndpoint interface for prep operations that process
+    all records of a prep round at once (before prepare is called)"""
+
+    # pylint: disable=no-self-argument
+    def prefetch(records: list) -> None:  # type: ignore
+        """Process the records of the prep round (e.g., in batches)"""
+
+
 # pylint: disable=too-few-public-methods
 class PrepManInterface(
     GeneralInterface, zope.interface.Interface
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import importlib.util
+import typing
 from importlib.metadata import distribution
 from importlib.metadata import distributions
 from importlib.metadata import PackageNotFoundError
@@ -27,6 +28,41 @@ from colrev.constants import EndpointType
 
 ENDPOINT_OVERVIEW = colrev.package_manager.interfaces.ENDPOINT_OVERVIEW
 
+# Endpoint classes that were verified (once per process)
+_VERIFIED_ENDPOINT_CLASSES: typing.Dict[typing.Tuple[str, EndpointType], Any] = {}
+
+
+def _endpoint_verified(
+    endpoint_class: Any, endpoint_type: EndpointType, identifier: str
+) -> bool:
+    interface_definition = ENDPOINT_OVERVIEW[endpoint_type]["import_name"]
+    try:
+        verifyClass(interface_definition, endpoint_class)  # type: ignore
+        return True
+    except zope.interface.exceptions.Invalid as exc:
+        print(f"Error registering endpoint {identifier}: {exc}")
+    return False
+
+
+def load_endpoint_class(
+    *, endpoint_path: str, endpoint_type: EndpointType, identifier: str
+) -> Any:
+    """Load (and verify) the endpoint class ("module:class")"""
+
+    if (endpoint_path, endpoint_type) in _VERIFIED_ENDPOINT_CLASSES:
+        return _VERIFIED_ENDPOINT_CLASSES[(endpoint_path, endpoint_type)]
+
+    module_name, class_name = endpoint_path.split(":")
+    module = importlib.import_module(module_name)
+    cls = getattr(module, class_name)
+    if not _endpoint_verified(cls, endpoint_type, identifier):
+        raise colrev_exceptions.MissingDependencyError(
+            f"Endpoint {class_name} in {module_name} "
+            f"does not implement the {endpoint_type} interface"
+        )
+    _VERIFIED_ENDPOINT_CLASSES[(endpoint_path, endpoint_type)] = cls
+    return cls
+
 
 class Package:
     """A Python package for CoLRev"""
@@ -76,17 +112,6 @@ class Package:
             0
         ].value
 
-    def _endpoint_verified(
-        self, endpoint_class: Any, endpoint_type: EndpointType, identifier: str
-    ) -> bool:
-        interface_definition = ENDPOINT_OVERVIEW[endpoint_type]["import_name"]
-        try:
-            verifyClass(interface_definition, endpoint_class)  # type: ignore
-            return True
-        except zope.interface.exceptions.BrokenImplementation as exc:
-            print(f"Error registering endpoint {identifier}: {exc}")
-        return False
-
     def get_endpoint_class(self, package_type: EndpointType) -> Any:
         """Get the endpoint class for a package type"""
         if not self.has_endpoint(package_type):
@@ -94,16 +119,11 @@ class Package:
                 f"Package {self.name} does not have a {package_type} endpoint"
             )
 
-        endpoint_path = self.get_endpoint(package_type)
-        module_name, class_name = endpoint_path.split(":")
-        module = importlib.import_module(module_name)
-        cls = getattr(module, class_name)
-        if not self._endpoint_verified(cls, package_type, self.name):
-            raise colrev_exceptions.MissingDependencyError(
-                f"Endpoint {class_name} in {module_name} "
-                f"does not implement the {package_type} interface"
-            )
-        return cls
+        return load_endpoint_class(
+            endpoint_path=self.get_endpoint(package_type),
+            endpoint_type=package_type,
+            identifier=self.name,
+        )
 
     def add_to_type_identifier_endpoint_dict(
         self, type_identifier_endpoint_dict: dict
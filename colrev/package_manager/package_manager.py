@@ -2,9 +2,11 @@
 """Discovering and using packages."""
 from __future__ import annotations
 
+import hashlib
 import importlib.metadata
 import importlib.util
 import json
+import os
 import platform
 import subprocess
 import sys
@@ -18,6 +20,25 @@ from colrev.constants import Colors
 from colrev.constants import EndpointType
 from colrev.constants import Filepaths
 
+# Endpoints of the installed packages (loaded once per process)
+_TYPE_IDENTIFIER_ENDPOINT_DICT: typing.Dict[EndpointType, typing.Dict[str, Any]] = {}
+
+
+def _get_distributions_fingerprint() -> str:
+    """Get the fingerprint of the installed distributions
+
+    Installing, upgrading, or removing a distribution
+    changes the modification time of its sys.path directory."""
+    fingerprint = hashlib.sha256(sys.version.encode("utf-8"))
+    fingerprint.update(colrev.__version__.encode("utf-8"))
+    for path_entry in sys.path:
+        try:
+            mtime = os.stat(path_entry or ".").st_mtime_ns
+        except OSError:
+            continue
+        fingerprint.update(f"{path_entry}:{mtime}".encode("utf-8"))
+    return fingerprint.hexdigest()
+
 
 class PackageManager:
     """The PackageManager provides functionality for package lookup and discovery"""
@@ -31,7 +52,7 @@ class PackageManager:
             if ep.group == group
         ]
 
-    def _load_type_identifier_endpoint_dict(self) -> dict:
+    def _discover_type_identifier_endpoint_dict(self) -> dict:
         type_identifier_endpoint_dict: typing.Dict[
             EndpointType, typing.Dict[str, Any]
         ] = {endpoint_type: {} for endpoint_type in EndpointType}
@@ -47,6 +68,73 @@ class PackageManager:
 
         return type_identifier_endpoint_dict
 
+    def _load_cached_type_identifier_endpoint_dict(
+        self, fingerprint: str
+    ) -> typing.Optional[dict]:
+        try:
+            with open(Filepaths.ENDPOINT_REGISTRY_CACHE_FILE, encoding="utf-8") as file:
+                cache = json.load(file)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if cache.get("fingerprint") != fingerprint:
+            return None
+        return {
+            endpoint_type: cache["endpoints"].get(endpoint_type.value, {})
+            for endpoint_type in EndpointType
+        }
+
+    def _save_cached_type_identifier_endpoint_dict(
+        self, fingerprint: str, type_identifier_endpoint_dict: dict
+    ) -> None:
+        cache = {
+            "fingerprint": fingerprint,
+            "endpoints": {
+                endpoint_type.value: endpoints
+                for endpoint_type, endpoints in type_identifier_endpoint_dict.items()
+            },
+        }
+        try:
+            Filepaths.ENDPOINT_REGISTRY_CACHE_FILE.parent.mkdir(
+                parents=True, exist_ok=True
+            )
+            with open(
+                Filepaths.ENDPOINT_REGISTRY_CACHE_FILE, "w", encoding="utf-8"
+            ) as file:
+                json.dump(cache, file, indent=4)
+        except OSError:  # pragma: no cover
+            pass
+
+    def _drop_cached_endpoint(
+        self, *, package_type: EndpointType, package_identifier: str
+    ) -> None:
+        """Drop an outdated endpoint (the cache is rewritten by the next process)"""
+        _TYPE_IDENTIFIER_ENDPOINT_DICT[package_type].pop(package_identifier, None)
+        try:
+            Filepaths.ENDPOINT_REGISTRY_CACHE_FILE.unlink(missing_ok=True)
+        except OSError:  # pragma: no cover
+            pass
+
+    def _load_type_identifier_endpoint_dict(self) -> dict:
+        """Load the endpoints of the installed packages (cached on disk,
+        invalidated when the installed distributions change)"""
+
+        if _TYPE_IDENTIFIER_ENDPOINT_DICT:
+            return _TYPE_IDENTIFIER_ENDPOINT_DICT
+
+        fingerprint = _get_distributions_fingerprint()
+        type_identifier_endpoint_dict = self._load_cached_type_identifier_endpoint_dict(
+            fingerprint
+        )
+        if type_identifier_endpoint_dict is None:
+            type_identifier_endpoint_dict = (
+                self._discover_type_identifier_endpoint_dict()
+            )
+            self._save_cached_type_identifier_endpoint_dict(
+                fingerprint, type_identifier_endpoint_dict
+            )
+        _TYPE_IDENTIFIER_ENDPOINT_DICT.update(type_identifier_endpoint_dict)
+        return _TYPE_IDENTIFIER_ENDPOINT_DICT
+
     def discover_packages(self, *, package_type: EndpointType) -> typing.Dict:
         """Discover packages (registered in the CoLRev environment)"""
 
@@ -74,6 +162,27 @@ class PackageManager:
     ):
         """Load a package endpoint"""
 
+        endpoint_path = self._load_type_identifier_endpoint_dict()[package_type].get(
+            package_identifier
+        )
+        if endpoint_path is not None:
+            try:
+                return colrev.package_manager.package.load_endpoint_class(
+                    endpoint_path=endpoint_path,
+                    endpoint_type=package_type,
+                    identifier=package_identifier,
+                )
+            except (
+                ImportError,
+                AttributeError,
+                colrev_exceptions.MissingDependencyError,
+            ):
+                # The cached endpoint may be outdated (e.g., a class that was renamed
+                # in an editable install): drop it and discover the endpoint
+                self._drop_cached_endpoint(
+                    package_type=package_type, package_identifier=package_identifier
+                )
+
         package = colrev.package_manager.package.Package(package_identifier)
         return package.get_endpoint_class(package_type)
 
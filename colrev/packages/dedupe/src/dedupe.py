@@ -9,7 +9,6 @@ import bib_dedupe.cluster
 import bib_dedupe.maybe_cases
 import pandas as pd
 import zope.interface
-from bib_dedupe.bib_dedupe import block
 from bib_dedupe.bib_dedupe import export_maybe
 from bib_dedupe.bib_dedupe import import_maybe
 from bib_dedupe.bib_dedupe import match
@@ -21,6 +20,8 @@ import colrev.package_manager.package_settings
 import colrev.record.record
 from colrev.constants import Fields
 from colrev.constants import RecordState
+from colrev.packages.dedupe.src.feature_store import DedupeFeatureStore
+from colrev.record.record_blocking import block_new_records
 
 # pylint: disable=too-few-public-methods
 
@@ -79,15 +80,32 @@ class Dedupe:
             "search_set",
         ] = "old_search"
 
-        records_df = self.dedupe_operation.get_records_for_dedupe(
-            records_df=records_df, verbosity_level=verbosity_level
+        # Only new or changed records are prepared (features are persisted)
+        # and only pairs involving new records (not in old_search) are blocked
+        feature_store = DedupeFeatureStore(
+            store_path=self.review_manager.paths.cache / Path("dedupe_features.json")
+        )
+        records_df = feature_store.get_records_for_dedupe(
+            records=records,
+            records_df=records_df,
+            prep_function=lambda records_df: self.dedupe_operation.get_records_for_dedupe(
+                records_df=records_df, verbosity_level=verbosity_level
+            ),
         )
 
         if 0 == records_df.shape[0]:
             return
 
-        deduplication_pairs = block(records_df, verbosity_level=verbosity_level)
-        matched_df = match(deduplication_pairs, verbosity_level=verbosity_level)
+        deduplication_pairs = block_new_records(records_df)
+        deduplication_pairs = feature_store.remove_non_duplicates(deduplication_pairs)
+        if deduplication_pairs.empty:
+            matched_df = pd.DataFrame(columns=["ID_1", "ID_2", "duplicate_label"])
+        else:
+            matched_df = match(deduplication_pairs, verbosity_level=verbosity_level)
+        feature_store.add_non_duplicates(
+            pairs_df=deduplication_pairs, matched_df=matched_df
+        )
+        feature_store.save()
         matched_df = import_maybe(matched_df)
 
         if self.dedupe_operation.debug:
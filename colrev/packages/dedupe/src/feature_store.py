@@ -0,0 +1,157 @@
+#! /usr/bin/env python
+"""Persisted bib_dedupe features (for incremental deduplication)"""
+from __future__ import annotations
+
+import hashlib
+import json
+import typing
+from importlib.metadata import version
+from pathlib import Path
+
+import pandas as pd
+from bib_dedupe.constants.fields import SEARCH_SET
+
+from colrev.constants import Fields
+
+# Fields that are considered by bib_dedupe (prep/block/match)
+DEDUPE_FIELDS = [
+    Fields.ID,
+    Fields.ENTRYTYPE,
+    Fields.TITLE,
+    Fields.AUTHOR,
+    Fields.YEAR,
+    Fields.JOURNAL,
+    Fields.BOOKTITLE,
+    Fields.SERIES,
+    Fields.VOLUME,
+    Fields.NUMBER,
+    Fields.PAGES,
+    Fields.ABSTRACT,
+    Fields.DOI,
+]
+
+
+class DedupeFeatureStore:
+    """Store of the bib_dedupe features (prepared fields and block keys) per record
+
+    Features are keyed by a hash of the fields considered by bib_dedupe.
+    Pairs that were matched as non-duplicates are stored (as pairs of hashes)
+    so that they are not matched again."""
+
+    def __init__(self, *, store_path: Path) -> None:
+        self.store_path = store_path
+        self.bib_dedupe_version = version("bib-dedupe")
+        store = self._load()
+        self.features: typing.Dict[str, dict] = store.get("features", {})
+        self.non_duplicates: typing.Set[str] = set(store.get("non_duplicates", []))
+        self.content_hashes: typing.Dict[str, str] = {}
+
+    def _load(self) -> dict:
+        if not self.store_path.is_file():
+            return {}
+        try:
+            with open(self.store_path, encoding="utf-8") as file:
+                store = json.load(file)
+        except json.JSONDecodeError:
+            return {}
+        if store.get("bib_dedupe_version") != self.bib_dedupe_version:
+            return {}
+        return store
+
+    def save(self) -> None:
+        """Save the store (features of the current records)"""
+        current_hashes = set(self.content_hashes.values())
+        store = {
+            "bib_dedupe_version": self.bib_dedupe_version,
+            "features": {
+                content_hash: features
+                for content_hash, features in self.features.items()
+                if content_hash in current_hashes
+            },
+            "non_duplicates": sorted(
+                pair_key
+                for pair_key in self.non_duplicates
+                if all(h in current_hashes for h in pair_key.split("|"))
+            ),
+        }
+        self.store_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.store_path, "w", encoding="utf-8") as file:
+            json.dump(store, file)
+
+    @classmethod
+    def get_content_hash(cls, record_dict: dict) -> str:
+        """Get the hash of the fields that are considered by bib_dedupe"""
+        content = json.dumps(
+            [str(record_dict.get(field, "")) for field in DEDUPE_FIELDS]
+        )
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def _get_pair_key(self, id_1: str, id_2: str) -> str:
+        return "|".join(sorted([self.content_hashes[id_1], self.content_hashes[id_2]]))
+
+    def get_records_for_dedupe(
+        self,
+        *,
+        records: dict,
+        records_df: pd.DataFrame,
+        prep_function: typing.Callable,
+    ) -> pd.DataFrame:
+        """Get the prepared records (only new or changed records are prepared)"""
+
+        self.content_hashes = {
+            record_id: self.get_content_hash(records[record_id])
+            for record_id in records_df[Fields.ID]
+        }
+        to_prep_df = records_df[
+            ~records_df[Fields.ID].map(self.content_hashes).isin(self.features)
+        ]
+        if to_prep_df.shape[0] > 0:
+            prepared_df = prep_function(records_df=to_prep_df)
+            if isinstance(prepared_df, pd.DataFrame):
+                for features in prepared_df.drop(
+                    columns=[SEARCH_SET], errors="ignore"
+                ).to_dict(orient="records"):
+                    content_hash = self.content_hashes[features[Fields.ID]]
+                    self.features[content_hash] = features
+
+        prepared_records = [
+            self.features[content_hash]
+            for content_hash in self.content_hashes.values()
+            if content_hash in self.features
+        ]
+        if not prepared_records:
+            return pd.DataFrame()
+        prepared_df = pd.DataFrame(prepared_records)
+        search_sets = (
+            records_df.set_index(Fields.ID)[SEARCH_SET]
+            if SEARCH_SET in records_df.columns
+            else pd.Series(dtype=str)
+        )
+        prepared_df[SEARCH_SET] = (
+            prepared_df[Fields.ID].map(search_sets).fillna("").astype(str)
+        )
+        prepared_df.index = prepared_df[Fields.ID]
+        return prepared_df
+
+    def remove_non_duplicates(self, pairs_df: pd.DataFrame) -> pd.DataFrame:
+        """Remove pairs that were previously matched as non-duplicates"""
+        if pairs_df.empty or not self.non_duplicates:
+            return pairs_df
+        known = pairs_df.apply(
+            lambda x: self._get_pair_key(x["ID1"], x["ID2"]) in self.non_duplicates,
+            axis=1,
+        )
+        return pairs_df[~known]
+
+    def add_non_duplicates(
+        self, *, pairs_df: pd.DataFrame, matched_df: pd.DataFrame
+    ) -> None:
+        """Add the blocked pairs that were not matched (as duplicates or maybe cases)"""
+        if pairs_df.empty:
+            return
+        matched_pairs = {
+            frozenset(pair) for pair in matched_df[["ID_1", "ID_2"]].values.tolist()
+        }
+        for id_1, id_2 in pairs_df[["ID1", "ID2"]].values.tolist():
+            if frozenset([id_1, id_2]) not in matched_pairs:
+                self.non_duplicates.add(self._get_pair_key(id_1, id_2))
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+"""Test the feature store of the dedupe package"""
+from pathlib import Path
+
+import pandas as pd
+from bib_dedupe.bib_dedupe import prep
+
+from colrev.constants import Fields
+from colrev.packages.dedupe.src import feature_store
+from colrev.record.record_blocking import block_new_records
+
+RECORDS = {
+    "Smith2020": {
+        "ID": "Smith2020",
+        "ENTRYTYPE": "article",
+        "title": "Digital platforms and the future of work",
+        "author": "Smith, John and Miller, Anna",
+        "journal": "MIS Quarterly",
+        "year": "2020",
+        "volume": "44",
+        "number": "2",
+        "pages": "1--20",
+    },
+    "Smith2020a": {
+        "ID": "Smith2020a",
+        "ENTRYTYPE": "article",
+        "title": "Digital Platforms and the Future of Work",
+        "author": "Smith, J. and Miller, A.",
+        "journal": "MIS Quarterly",
+        "year": "2020",
+        "volume": "44",
+        "number": "2",
+        "pages": "1--20",
+    },
+    "Jones2019": {
+        "ID": "Jones2019",
+        "ENTRYTYPE": "article",
+        "title": "Digital platforms and the future of organizing",
+        "author": "Jones, Peter",
+        "journal": "MIS Quarterly",
+        "year": "2020",
+        "volume": "44",
+        "number": "2",
+        "pages": "21--40",
+    },
+}
+
+
+def test_feature_store(tmp_path: Path) -> None:
+    """Test that only new or changed records are prepared and blocked"""
+
+    store_path = tmp_path / Path(".colrev/dedupe_features.json")
+    prepared_ids = []
+
+    def prep_function(records_df: pd.DataFrame) -> pd.DataFrame:
+        prepared_ids.extend(records_df["ID"].tolist())
+        return prep(records_df, cpu=1)
+
+    records_df = pd.DataFrame.from_dict(RECORDS, orient="index")
+    records_df.loc[records_df["ID"] != "Smith2020a", "search_set"] = "old_search"
+
+    store = feature_store.DedupeFeatureStore(store_path=store_path)
+    prepared_df = store.get_records_for_dedupe(
+        records=RECORDS, records_df=records_df, prep_function=prep_function
+    )
+    assert sorted(prepared_ids) == ["Jones2019", "Smith2020", "Smith2020a"]
+    assert prepared_df.loc["Smith2020a", "search_set"] == ""
+    assert prepared_df.loc["Smith2020", "search_set"] == "old_search"
+
+    pairs_df = block_new_records(prepared_df)
+    pairs = {frozenset(pair) for pair in pairs_df[["ID1", "ID2"]].values.tolist()}
+    assert frozenset(["Smith2020", "Jones2019"]) not in pairs
+    assert frozenset(["Smith2020", "Smith2020a"]) in pairs
+
+    matched_df = pd.DataFrame(
+        [["Smith2020", "Smith2020a", "duplicate"]],
+        columns=["ID_1", "ID_2", "duplicate_label"],
+    )
+    store.add_non_duplicates(pairs_df=pairs_df, matched_df=matched_df)
+    store.save()
+
+    # Unchanged records are not prepared again, changed records are
+    records = {k: dict(v) for k, v in RECORDS.items()}
+    records["Smith2020"][Fields.TITLE] = "Digital platforms and the future of work!"
+    records_df = pd.DataFrame.from_dict(records, orient="index")
+    prepared_ids.clear()
+    store = feature_store.DedupeFeatureStore(store_path=store_path)
+    prepared_df = store.get_records_for_dedupe(
+        records=records, records_df=records_df, prep_function=prep_function
+    )
+    assert prepared_ids == ["Smith2020"]
+    assert prepared_df.shape[0] == 3
+    assert (prepared_df["search_set"] == "").all()
+
+    # Pairs of unchanged records that were not matched as duplicates are skipped
+    pairs_df = block_new_records(prepared_df)
+    pairs = {frozenset(pair) for pair in pairs_df[["ID1", "ID2"]].values.tolist()}
+    assert pairs == {
+        frozenset(["Smith2020", "Smith2020a"]),
+        frozenset(["Jones2019", "Smith2020a"]),
+        frozenset(["Jones2019", "Smith2020"]),
+    }
+    remaining_pairs = store.remove_non_duplicates(pairs_df)
+    assert {
+        frozenset(pair) for pair in remaining_pairs[["ID1", "ID2"]].values.tolist()
+    } == {
+        frozenset(["Smith2020", "Smith2020a"]),
+        frozenset(["Jones2019", "Smith2020"]),
+    }
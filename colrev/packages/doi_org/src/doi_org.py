@@ -9,6 +9,7 @@ from urllib.parse import unquote
 
 import requests
 
+import colrev.env.language_service
 import colrev.exceptions as colrev_exceptions
 import colrev.package_manager.package_manager
 import colrev.record.record
@@ -5,6 +5,8 @@ from __future__ import annotations
 import zope.interface
 from pydantic import Field
 
+import colrev.env.keyword_matcher
+import colrev.env.utils
 import colrev.package_manager.interfaces
 import colrev.package_manager.package_manager
 import colrev.package_manager.package_settings
@@ -37,18 +39,13 @@ class ExcludeComplementaryMaterialsPrep:
     ) -> None:
         self.settings = self.settings_class(**settings)
 
-        self.complementary_materials_keywords = (
-            colrev.env.utils.load_complementary_material_keywords()
-        )
-
-        # for exact matches:
-        self.complementary_materials_strings = (
-            colrev.env.utils.load_complementary_material_strings()
-        )
-
-        # for prefixes:
-        self.complementary_material_prefixes = (
-            colrev.env.utils.load_complementary_material_prefixes()
+        # Built once (substrings, exact matches, and prefixes)
+        self.complementary_materials_matcher = (
+            colrev.env.keyword_matcher.KeywordMatcher(
+                substrings=colrev.env.utils.load_complementary_material_keywords(),
+                strings=colrev.env.utils.load_complementary_material_strings(),
+                prefixes=colrev.env.utils.load_complementary_material_prefixes(),
+            )
         )
 
     def prepare(
@@ -56,21 +53,8 @@ class ExcludeComplementaryMaterialsPrep:
     ) -> colrev.record.record.Record:
         """Prepare the records by excluding complementary materials"""
 
-        if (
-            any(
-                complementary_materials_keyword
-                in record.data.get(Fields.TITLE, "").lower()
-                for complementary_materials_keyword in self.complementary_materials_keywords
-            )
-            or any(
-                complementary_materials_string
-                == record.data.get(Fields.TITLE, "").lower()
-                for complementary_materials_string in self.complementary_materials_strings
-            )
-            or any(
-                record.data.get(Fields.TITLE, "").lower().startswith(prefix)
-                for prefix in self.complementary_material_prefixes
-            )
+        if self.complementary_materials_matcher.matches(
+            record.data.get(Fields.TITLE, "")
         ):
             record.prescreen_exclude(reason="complementary material")
 
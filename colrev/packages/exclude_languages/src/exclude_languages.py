@@ -21,7 +21,7 @@ from colrev.constants import RecordState
 # pylint: disable=too-few-public-methods
 
 
-@zope.interface.implementer(colrev.package_manager.interfaces.PrepInterface)
+@zope.interface.implementer(colrev.package_manager.interfaces.PrepPrefetchInterface)
 class ExcludeLanguagesPrep:
     """Prepares records by excluding ones that are not in the languages_to_include"""
 
@@ -70,6 +70,18 @@ class ExcludeLanguagesPrep:
             return True
         return False
 
+    def prefetch(self, records: list) -> None:
+        """Detect the languages of the titles in one batch (results are cached)"""
+        titles = [
+            record.data[Fields.TITLE]
+            for record in records
+            if len(record.data.get(Fields.TITLE, "")) >= 30
+            and record.data.get(Fields.LANGUAGE, "") not in self.languages_to_include
+            and not self._title_has_multiple_languages(title=record.data[Fields.TITLE])
+        ]
+        if titles:
+            self.language_service.compute_languages(texts=titles)
+
     def prepare(
         self, record: colrev.record.record_prep.PrepRecord
     ) -> colrev.record.record.Record:
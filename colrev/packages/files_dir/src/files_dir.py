@@ -29,6 +29,7 @@ from colrev.constants import RecordState
 from colrev.constants import SearchSourceHeuristicStatus
 from colrev.constants import SearchType
 from colrev.packages.crossref.src import crossref_api
+from colrev.packages.files_dir.src import files_manifest
 from colrev.writer.write_utils import write_file
 
 # pylint: disable=unused-argument
@@ -51,7 +52,6 @@ class FilesSearchSource:
     heuristic_status = SearchSourceHeuristicStatus.supported
 
     _doi_regex = re.compile(r"10\.\d{4,9}/[-._;/:A-Za-z0-9]*")
-    _batch_size = 20
     rerun: bool
 
     def __init__(
@@ -91,6 +91,9 @@ class FilesSearchSource:
 
         self.crossref_api = crossref_api.CrossrefAPI(params={})
 
+        self._feed_file_paths: typing.Dict[Path, str] = {}
+        self._feed_md_strings: typing.Dict[str, typing.List[dict]] = {}
+
     def _update_if_pdf_renamed(
         self,
         *,
@@ -408,10 +411,10 @@ class FilesSearchSource:
             )
         self.review_manager.logger.debug(f"SearchSource {source.filename} validated")
 
-    def _add_md_string(self, *, record_dict: dict) -> dict:
+    def _get_md_string(self, *, record_dict: dict) -> str:
         # To identify potential duplicates
         if Path(record_dict[Fields.FILE]).suffix != ".pdf":
-            return record_dict
+            return ""
 
         md_copy = record_dict.copy()
         try:
@@ -426,8 +429,24 @@ class FilesSearchSource:
             if key in md_copy:
                 md_copy.pop(key)
         md_string = ",".join([f"{k}:{v}" for k, v in md_copy.items()])
-        record_dict["md_string"] = str(fsize) + md_string
-        return record_dict
+        return str(fsize) + md_string
+
+    def _index_feed_records(
+        self, files_dir_feed: colrev.ops.search_api_feed.SearchAPIFeed
+    ) -> None:
+        """Index the file paths and md_strings of the feed records (once per search)"""
+        self._feed_file_paths = {}
+        self._feed_md_strings = {}
+        for record_dict in files_dir_feed.feed_records.values():
+            self._add_to_feed_index(record_dict)
+
+    def _add_to_feed_index(self, record_dict: dict) -> None:
+        if Fields.FILE not in record_dict:
+            return
+        self._feed_file_paths[Path(record_dict[Fields.FILE])] = record_dict[Fields.ID]
+        md_string = self._get_md_string(record_dict=record_dict)
+        if md_string:
+            self._feed_md_strings.setdefault(md_string, []).append(record_dict)
 
     def prep_link_md(
         self,
@@ -444,7 +463,7 @@ class FilesSearchSource:
         *,
         file_path: Path,
         files_dir_feed: colrev.ops.search_api_feed.SearchAPIFeed,
-        linked_file_paths: list,
+        linked_file_paths: typing.Set[Path],
         local_index: colrev.env.local_index.LocalIndex,
     ) -> dict:
         if file_path.suffix == ".pdf":
@@ -517,7 +536,7 @@ class FilesSearchSource:
         *,
         file_path: Path,
         files_dir_feed: colrev.ops.search_api_feed.SearchAPIFeed,
-        linked_file_paths: list,
+        linked_file_paths: typing.Set[Path],
         local_index: colrev.env.local_index.LocalIndex,
     ) -> dict:
         new_record: dict = {}
@@ -535,12 +554,7 @@ class FilesSearchSource:
                     return new_record
 
         if not self.rerun:
-
-            if file_path in [
-                Path(r[Fields.FILE])
-                for r in files_dir_feed.feed_records.values()
-                if Fields.FILE in r
-            ]:
+            if file_path in self._feed_file_paths:
                 return new_record
         # otherwise: reindex all
 
@@ -573,14 +587,14 @@ class FilesSearchSource:
         self._fix_grobid_errors(new_record)
 
         new_record[Fields.FILE] = str(file_path)
-        new_record = self._add_md_string(record_dict=new_record)
 
         # Note: identical md_string as a heuristic for duplicates
         potential_duplicates = [
             r
-            for r in files_dir_feed.feed_records.values()
-            if r["md_string"] == new_record["md_string"]
-            and not r[Fields.FILE] == new_record[Fields.FILE]
+            for r in self._feed_md_strings.get(
+                self._get_md_string(record_dict=new_record), []
+            )
+            if not r[Fields.FILE] == new_record[Fields.FILE]
         ]
         if potential_duplicates:
             self.review_manager.logger.warning(
@@ -596,83 +610,132 @@ class FilesSearchSource:
         *,
         file_path: Path,
         files_dir_feed: colrev.ops.search_api_feed.SearchAPIFeed,
-        linked_file_paths: list,
+        linked_file_paths: typing.Set[Path],
         local_index: colrev.env.local_index.LocalIndex,
     ) -> dict:
         record_dict = {Fields.ENTRYTYPE: "online", Fields.FILE: file_path}
         return record_dict
 
-    def _get_file_batches(self) -> list:
+    def _get_files(self) -> typing.List[Path]:
         types = ("**/*.pdf", "**/*.mp4")
         files_grabbed: typing.List[Path] = []
         for suffix in types:
             files_grabbed.extend(self.pdfs_path.glob(suffix))
 
-        files_to_index = [
-            x.relative_to(self.review_manager.path) for x in files_grabbed
-        ]
+        return [x.relative_to(self.review_manager.path) for x in files_grabbed]
 
-        file_batches = [
-            files_to_index[i * self._batch_size : (i + 1) * self._batch_size]
-            for i in range(
-                (len(files_to_index) + self._batch_size - 1) // self._batch_size
-            )
-        ]
-        return file_batches
+    def _relink_renamed_file(
+        self,
+        *,
+        files_dir_feed: colrev.ops.search_api_feed.SearchAPIFeed,
+        feed_id: str,
+        old_path: str,
+        new_path: Path,
+    ) -> None:
+        self.review_manager.logger.info(f" renamed: {old_path} > {new_path}")
+        files_dir_feed.relink_record(
+            record_id=feed_id, new_source_identifier=str(new_path)
+        )
+        self._feed_file_paths.pop(Path(old_path), None)
+        self._feed_file_paths[new_path] = feed_id
+
+    def _add_new_record(
+        self,
+        *,
+        files_dir_feed: colrev.ops.search_api_feed.SearchAPIFeed,
+        new_record: dict,
+    ) -> str:
+        self._add_doi_from_pdf_if_not_available(new_record)
+        retrieved_record = colrev.record.record.Record(new_record)
+
+        # Generally: add to feed but do not "update" records
+        prev_feed_record = files_dir_feed.get_prev_feed_record(retrieved_record)
+        files_dir_feed.add_record_to_feed(retrieved_record, prev_feed_record)
+        self._add_to_feed_index(
+            files_dir_feed.feed_records[retrieved_record.data[Fields.ID]]
+        )
+
+        if self.rerun:
+            # If rerun: fix_grobid_fields: in feed and records (if only pdf-file origin)
+            prefix = self.search_source.get_origin_prefix()
+            origin = f"{prefix}/{retrieved_record.data['ID']}"
+            for record_dict in files_dir_feed.records.values():
+                if origin in record_dict[Fields.ORIGIN]:
+                    if len(record_dict[Fields.ORIGIN]) == 1:
+                        self._fix_grobid_errors(record_dict)
+                        if Fields.TITLE not in record_dict:
+                            record_dict[Fields.STATUS] = (
+                                RecordState.md_needs_manual_preparation
+                            )
+        return retrieved_record.data[Fields.ID]
 
-    # pylint: disable=too-many-arguments
-    # pylint: disable=too-many-nested-blocks
-    # pylint: disable=too-many-locals
     def _run_dir_search(
         self,
         *,
         files_dir_feed: colrev.ops.search_api_feed.SearchAPIFeed,
         local_index: colrev.env.local_index.LocalIndex,
-        linked_file_paths: list,
+        linked_file_paths: typing.Set[Path],
     ) -> None:
-        file_batches = self._get_file_batches()
-        if not file_batches:
+        """Index new or changed files (based on the manifest) and save the feed once
+
+        Unchanged files (same path, size and mtime) are skipped.
+        Renamed files (same content hash) are relinked without extracting metadata."""
+
+        files = self._get_files()
+        if not files:
             files_dir_feed.save()
             return
-        for i, file_batch in enumerate(file_batches):
-            for record in files_dir_feed.feed_records.values():
-                record = self._add_md_string(record_dict=record)
-
-            for file_path in file_batch:
-                new_record = self._index_file(
-                    file_path=file_path,
-                    files_dir_feed=files_dir_feed,
-                    linked_file_paths=linked_file_paths,
-                    local_index=local_index,
-                )
-                if new_record == {}:
-                    continue
+        self._index_feed_records(files_dir_feed)
 
-                self._add_doi_from_pdf_if_not_available(new_record)
-                retrieved_record = colrev.record.record.Record(new_record)
+        manifest = files_manifest.FilesManifest(
+            manifest_path=self.review_manager.paths.cache
+            / Path(f"{self.search_source.filename.stem}_manifest.json"),
+            base_path=self.review_manager.path,
+        )
+        manifest.set_current_files(files, feed_ids=files_dir_feed.feed_records.keys())
 
-                # Generally: add to feed but do not "update" records
-                prev_feed_record = files_dir_feed.get_prev_feed_record(retrieved_record)
-                files_dir_feed.add_record_to_feed(retrieved_record, prev_feed_record)
+        for file_path in files:
+            if not self.rerun:
+                feed_id = manifest.get_unchanged_feed_id(file_path)
+                if feed_id in files_dir_feed.feed_records:
+                    continue
 
-                if self.rerun:
-                    # If rerun: fix_grobid_fields: in feed and records (if only pdf-file origin)
-                    prefix = self.search_source.get_origin_prefix()
-                    origin = f"{prefix}/{retrieved_record.data['ID']}"
-                    for record_dict in files_dir_feed.records.values():
-                        if origin in record_dict[Fields.ORIGIN]:
-                            if len(record_dict[Fields.ORIGIN]) == 1:
-                                self._fix_grobid_errors(record_dict)
-                                if Fields.TITLE not in record_dict:
-                                    record_dict[Fields.STATUS] = (
-                                        RecordState.md_needs_manual_preparation
-                                    )
+            entry = manifest.get_entry(file_path)
+            if not self.rerun:
+                old_path, feed_id = manifest.pop_renamed_file(entry)
+                if feed_id:
+                    self._relink_renamed_file(
+                        files_dir_feed=files_dir_feed,
+                        feed_id=feed_id,
+                        old_path=old_path,
+                        new_path=file_path,
+                    )
+                    manifest.add(file_path, entry=entry, feed_id=feed_id)
+                    continue
+                if file_path in self._feed_file_paths:
+                    manifest.add(
+                        file_path,
+                        entry=entry,
+                        feed_id=self._feed_file_paths[file_path],
+                    )
+                    continue
+
+            new_record = self._index_file(
+                file_path=file_path,
+                files_dir_feed=files_dir_feed,
+                linked_file_paths=linked_file_paths,
+                local_index=local_index,
+            )
+            if new_record == {}:
+                continue
 
-            for record in files_dir_feed.feed_records.values():
-                record.pop("md_string")
+            feed_id = self._add_new_record(
+                files_dir_feed=files_dir_feed, new_record=new_record
+            )
+            manifest.add(file_path, entry=entry, feed_id=feed_id)
 
-            last_round = i == len(file_batches) - 1
-            files_dir_feed.save(skip_print=not last_round)
+        files_dir_feed.save()
+        manifest.save()
 
     def _add_doi_from_pdf_if_not_available(self, record_dict: dict) -> None:
         if Path(record_dict[Fields.FILE]).suffix != ".pdf":
@@ -722,9 +785,9 @@ class FilesSearchSource:
             update_only=(not rerun),
         )
 
-        linked_file_paths = [
+        linked_file_paths = {
             Path(r[Fields.FILE]) for r in records.values() if Fields.FILE in r
-        ]
+        }
 
         self._run_dir_search(
             files_dir_feed=files_dir_feed,
@@ -0,0 +1,95 @@
+#! /usr/bin/env python
+"""Manifest of the files indexed in a files_dir search (to skip unchanged files)"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import typing
+from pathlib import Path
+
+
+class FilesManifest:
+    """Manifest of indexed files
+
+    {relative path: {"size": ..., "mtime": ..., "sha256": ..., "feed_id": ...}}
+    """
+
+    def __init__(self, *, manifest_path: Path, base_path: Path) -> None:
+        self.manifest_path = manifest_path
+        self.base_path = base_path
+        self.previous_entries = self._load()
+        self.entries: typing.Dict[str, dict] = {}
+        self._missing_files: typing.Dict[str, typing.Tuple[str, dict]] = {}
+
+    def _load(self) -> dict:
+        if not self.manifest_path.is_file():
+            return {}
+        try:
+            with open(self.manifest_path, encoding="utf-8") as file:
+                return json.load(file)
+        except json.JSONDecodeError:
+            return {}
+
+    def save(self) -> None:
+        """Save the manifest (entries of the current run)"""
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.manifest_path, "w", encoding="utf-8") as file:
+            json.dump(self.entries, file, indent=4, sort_keys=True)
+
+    def set_current_files(
+        self, file_paths: typing.List[Path], *, feed_ids: typing.Iterable[str]
+    ) -> None:
+        """Set the files that are currently available
+
+        Files of the previous run that are no longer available (but in the feed)
+        are candidates for renamed files."""
+        current_paths = {str(file_path) for file_path in file_paths}
+        feed_ids = set(feed_ids)
+        self._missing_files = {
+            entry["sha256"]: (path, entry)
+            for path, entry in self.previous_entries.items()
+            if path not in current_paths and entry["feed_id"] in feed_ids
+        }
+
+    @classmethod
+    def get_content_hash(cls, file_path: Path) -> str:
+        """Get the sha256 hash of the file content"""
+        sha256 = hashlib.sha256()
+        with open(file_path, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                sha256.update(chunk)
+        return sha256.hexdigest()
+
+    def get_unchanged_feed_id(self, file_path: Path) -> str:
+        """Get the feed ID if the file is unchanged (same size and mtime)"""
+        entry = self.previous_entries.get(str(file_path), {})
+        file_stat = os.stat(self.base_path / file_path)
+        if (
+            entry.get("size") == file_stat.st_size
+            and entry.get("mtime") == file_stat.st_mtime
+        ):
+            self.entries[str(file_path)] = entry
+            return entry["feed_id"]
+        return ""
+
+    def get_entry(self, file_path: Path) -> dict:
+        """Get a new entry for the file (without feed_id)"""
+        file_stat = os.stat(self.base_path / file_path)
+        return {
+            "size": file_stat.st_size,
+            "mtime": file_stat.st_mtime,
+            "sha256": self.get_content_hash(self.base_path / file_path),
+        }
+
+    def pop_renamed_file(self, entry: dict) -> typing.Tuple[str, str]:
+        """Get the previous path and feed ID of a renamed file (same content hash)"""
+        if entry["sha256"] not in self._missing_files:
+            return "", ""
+        old_path, old_entry = self._missing_files.pop(entry["sha256"])
+        return old_path, old_entry["feed_id"]
+
+    def add(self, file_path: Path, *, entry: dict, feed_id: str) -> None:
+        """Add the file to the manifest"""
+        entry["feed_id"] = feed_id
+        self.entries[str(file_path)] = entry
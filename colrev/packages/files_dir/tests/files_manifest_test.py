@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+"""Test the manifest of the files_dir SearchSource"""
+import os
+from pathlib import Path
+
+from colrev.packages.files_dir.src import files_manifest
+
+
+def test_files_manifest(tmp_path: Path) -> None:
+    """Test unchanged, changed, and renamed files"""
+
+    pdf_dir = tmp_path / Path("data/pdfs")
+    pdf_dir.mkdir(parents=True)
+    (pdf_dir / Path("a.pdf")).write_bytes(b"content-a")
+    (pdf_dir / Path("b.pdf")).write_bytes(b"content-b")
+    manifest_path = tmp_path / Path(".colrev/files_manifest.json")
+
+    manifest = files_manifest.FilesManifest(
+        manifest_path=manifest_path, base_path=tmp_path
+    )
+    files = [Path("data/pdfs/a.pdf"), Path("data/pdfs/b.pdf")]
+    manifest.set_current_files(files, feed_ids=[])
+    for feed_id, file_path in zip(["000001", "000002"], files):
+        assert manifest.get_unchanged_feed_id(file_path) == ""
+        entry = manifest.get_entry(file_path)
+        assert manifest.pop_renamed_file(entry) == ("", "")
+        manifest.add(file_path, entry=entry, feed_id=feed_id)
+    manifest.save()
+
+    # Rename a.pdf and change b.pdf
+    os.rename(pdf_dir / Path("a.pdf"), pdf_dir / Path("c.pdf"))
+    (pdf_dir / Path("b.pdf")).write_bytes(b"content-b-changed")
+    os.utime(pdf_dir / Path("b.pdf"), (1, 1))
+
+    manifest = files_manifest.FilesManifest(
+        manifest_path=manifest_path, base_path=tmp_path
+    )
+    files = [Path("data/pdfs/b.pdf"), Path("data/pdfs/c.pdf")]
+    manifest.set_current_files(files, feed_ids=["000001", "000002"])
+
+    assert manifest.get_unchanged_feed_id(Path("data/pdfs/b.pdf")) == ""
+    entry = manifest.get_entry(Path("data/pdfs/b.pdf"))
+    assert manifest.pop_renamed_file(entry) == ("", "")
+
+    assert manifest.get_unchanged_feed_id(Path("data/pdfs/c.pdf")) == ""
+    entry = manifest.get_entry(Path("data/pdfs/c.pdf"))
+    assert manifest.pop_renamed_file(entry) == ("data/pdfs/a.pdf", "000001")
+    manifest.add(Path("data/pdfs/c.pdf"), entry=entry, feed_id="000001")
+    manifest.save()
+
+    manifest = files_manifest.FilesManifest(
+        manifest_path=manifest_path, base_path=tmp_path
+    )
+    assert manifest.get_unchanged_feed_id(Path("data/pdfs/c.pdf")) == "000001"
@@ -0,0 +1,227 @@
+#! /usr/bin/env python
+"""Pool of OCR workers (local ocrmypdf processes or long-lived containers)"""
+from __future__ import annotations
+
+import os
+import queue
+import shutil
+import subprocess  # nosec
+import typing
+from multiprocessing import Lock
+from pathlib import Path
+
+import docker
+from docker.errors import DockerException
+from requests.exceptions import RequestException
+
+import colrev.env.docker_manager
+import colrev.exceptions as colrev_exceptions
+import colrev.review_manager
+
+
+class OCRWorkerPool:
+    """A fixed number of OCR workers
+
+    Jobs (apply_ocr) block until a worker is available (backpressure).
+    If ocrmypdf is installed locally, each worker runs a local process.
+    Otherwise, each worker is a long-lived container (started on the first job)
+    with its own directory in the working_dir, and the jobs are executed
+    in the running containers (instead of starting a container per PDF).
+    Workers whose container stopped are replaced (or dropped)."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    # Per-file timeout (seconds)
+    TIMEOUT = 600
+    # Read timeout of the docker client (exec_run blocks until ocrmypdf completes)
+    CLIENT_TIMEOUT = TIMEOUT + 60
+    # Threads used by ocrmypdf for each file
+    JOBS_PER_FILE = 2
+
+    def __init__(
+        self,
+        *,
+        image: str,
+        working_dir: Path,
+        nr_workers: typing.Optional[int] = None,
+        local: typing.Optional[bool] = None,
+    ) -> None:
+        self.image = image
+        self.working_dir = working_dir
+        self.nr_workers = nr_workers or max(
+            1, (os.cpu_count() or 1) // self.JOBS_PER_FILE
+        )
+        if local is None:
+            local = shutil.which("ocrmypdf") is not None
+        self.local = local
+        self._idle_workers: queue.Queue = queue.Queue()
+        # Local processes (None) or (container, worker_dir)
+        self._workers: typing.List[typing.Optional[tuple]] = []
+        self._client: typing.Optional[docker.DockerClient] = None
+        self._lock = Lock()
+
+    def _get_args(self, *, input_file: str, output_file: str) -> typing.List[str]:
+        return [
+            "--force-ocr",
+            "--jobs",
+            str(self.JOBS_PER_FILE),
+            "-l",
+            "eng",
+            input_file,
+            output_file,
+        ]
+
+    def _run_container(self, *, client: docker.DockerClient, worker_dir: Path) -> tuple:
+        worker_dir.mkdir(parents=True, exist_ok=True)
+        container = client.containers.run(
+            image=self.image,
+            entrypoint=["sleep", "infinity"],
+            auto_remove=True,
+            detach=True,
+            user=f"{os.geteuid()}:{os.getegid()}",
+            volumes=[f"{worker_dir}:/home/docker"],
+        )
+        return (container, worker_dir)
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._workers:
+                return
+            if self.local:
+                self._workers = [None] * self.nr_workers
+                for worker in self._workers:
+                    self._idle_workers.put(worker)
+                return
+
+            if not colrev.review_manager.ReviewManager.in_ci_environment():
+                colrev.env.docker_manager.DockerManager.build_docker_image(
+                    imagename=self.image
+                )
+            try:
+                self._client = docker.from_env(timeout=self.CLIENT_TIMEOUT)
+                for worker_nr in range(self.nr_workers):
+                    worker = self._run_container(
+                        client=self._client,
+                        worker_dir=self.working_dir / Path(f"ocr_worker_{worker_nr}"),
+                    )
+                    self._workers.append(worker)
+                    self._idle_workers.put(worker)
+            except DockerException as exc:
+                raise colrev_exceptions.ServiceNotAvailableException(
+                    f"Docker service not available ({exc}). Please install/start Docker."
+                ) from exc
+
+    def _replace_worker(self, worker: tuple) -> typing.Optional[tuple]:
+        """Replace a worker whose container stopped (returns None if it cannot be
+        replaced)"""
+        with self._lock:
+            if self._client is None or worker not in self._workers:
+                # The pool was closed
+                return None
+            self._workers.remove(worker)
+            try:
+                worker[0].stop()
+            except DockerException:
+                pass
+            try:
+                new_worker = self._run_container(
+                    client=self._client, worker_dir=worker[1]
+                )
+            except DockerException:
+                return None
+            self._workers.append(new_worker)
+            return new_worker
+
+    def _get_idle_worker(self) -> typing.Optional[tuple]:
+        while True:
+            try:
+                return self._idle_workers.get(timeout=1)
+            except queue.Empty:
+                pass
+            with self._lock:
+                if not self._workers:
+                    raise colrev_exceptions.ServiceNotAvailableException(
+                        "No OCR worker available (the containers stopped)"
+                    )
+
+    def _apply_ocr_local(self, *, input_path: Path, output_path: Path) -> bool:
+        try:
+            ret = subprocess.run(  # nosec
+                ["ocrmypdf"]
+                + self._get_args(
+                    input_file=str(input_path), output_file=str(output_path)
+                ),
+                capture_output=True,
+                timeout=self.TIMEOUT,
+                check=False,
+            )
+        except subprocess.TimeoutExpired:
+            return False
+        return ret.returncode == 0
+
+    def _apply_ocr_container(
+        self, *, worker: tuple, input_path: Path, output_path: Path
+    ) -> bool:
+        container, worker_dir = worker
+        shutil.copy(input_path, worker_dir / Path("input.pdf"))
+        try:
+            try:
+                exit_code, _ = container.exec_run(
+                    ["timeout", str(self.TIMEOUT), "ocrmypdf"]
+                    + self._get_args(
+                        input_file="/home/docker/input.pdf",
+                        output_file="/home/docker/output.pdf",
+                    ),
+                )
+            except RequestException as exc:
+                # Containers that stopped are replaced (see apply_ocr)
+                if isinstance(exc, DockerException):
+                    raise
+                # e.g., read timeouts (the timeout command ends ocrmypdf)
+                return False
+            if exit_code != 0:
+                return False
+            shutil.move(str(worker_dir / Path("output.pdf")), str(output_path))
+            return True
+        finally:
+            for filename in ["input.pdf", "output.pdf"]:
+                (worker_dir / Path(filename)).unlink(missing_ok=True)
+
+    def apply_ocr(self, *, input_path: Path, output_path: Path) -> bool:
+        """Apply OCR to the input PDF (returns False if OCR failed or timed out)
+
+        Blocks until a worker is available."""
+        self._start()
+        worker = self._get_idle_worker()
+        if worker is None:
+            try:
+                return self._apply_ocr_local(
+                    input_path=input_path, output_path=output_path
+                )
+            finally:
+                self._idle_workers.put(worker)
+        try:
+            return self._apply_ocr_container(
+                worker=worker, input_path=input_path, output_path=output_path
+            )
+        except DockerException:
+            # The container stopped: later jobs should not be assigned to it
+            worker = self._replace_worker(worker)
+            return False
+        finally:
+            if worker is not None:
+                self._idle_workers.put(worker)
+
+    def close(self) -> None:
+        """Stop the worker containers"""
+        with self._lock:
+            for worker in self._workers:
+                if worker is None:
+                    continue
+                try:
+                    worker[0].stop()
+                except DockerException:  # pragma: no cover
+                    pass
+            self._workers = []
+            self._idle_workers = queue.Queue()
+            self._client = None
@@ -2,11 +2,9 @@
 """OCR as a PDF preparation operation"""
 from __future__ import annotations
 
-import os
 import shutil
 from pathlib import Path
 
-import docker
 import zope.interface
 from pydantic import Field
 
@@ -18,6 +16,7 @@ import colrev.package_manager.package_settings
 import colrev.record.record
 from colrev.constants import Fields
 from colrev.constants import PDFDefectCodes
+from colrev.packages.ocrmypdf.src import ocr_worker_pool
 
 # pylint: disable=too-few-public-methods
 # pylint: disable=duplicate-code
@@ -40,11 +39,12 @@ class OCRMyPDF:
         self.settings = self.settings_class(**settings)
         self.review_manager = pdf_prep_operation.review_manager
 
-        if not self.review_manager.in_ci_environment():
-            colrev.env.docker_manager.DockerManager.build_docker_image(
-                imagename=self.OCRMYPDF_IMAGE
-            )
+        # The Docker image is provisioned when OCR is applied
         pdf_prep_operation.docker_images_to_stop.append(self.OCRMYPDF_IMAGE)
+        self.ocr_worker_pool = ocr_worker_pool.OCRWorkerPool(
+            image=self.OCRMYPDF_IMAGE,
+            working_dir=self.review_manager.paths.cache,
+        )
 
     def _apply_ocr(
         self,
@@ -54,32 +54,20 @@ class OCRMyPDF:
         pdf_path = self.review_manager.path / Path(record.data[Fields.FILE])
         non_ocred_filename = Path(str(pdf_path).replace(".pdf", "_no_ocr.pdf"))
         shutil.move(str(pdf_path), str(non_ocred_filename))
-        orig_path = (
-            pdf_path.parents[0] if pdf_path.is_file() else self.review_manager.paths.pdf
-        )
 
         # options = ""
         # if rotate:
         #     options = options + '--rotate-pages '
         # if deskew:
         #     options = options + '--deskew '
-        docker_home_path = Path("/home/docker")
-
-        non_ocr_fname = docker_home_path / non_ocred_filename.name
-        docker_output_fname = docker_home_path / pdf_path.name
-        args = (
-            f"--force-ocr --jobs 4 -l eng {non_ocr_fname.as_posix()} "
-            f"{docker_output_fname.as_posix()}"
-        )
-
-        client = docker.from_env(timeout=120)
-        client.containers.run(
-            image=self.OCRMYPDF_IMAGE,
-            command=args,
-            auto_remove=True,
-            user=f"{os.geteuid()}:{os.getegid()}",
-            volumes=[f"{orig_path}:/home/docker"],
-        )
+        if not self.ocr_worker_pool.apply_ocr(
+            input_path=non_ocred_filename, output_path=pdf_path
+        ):
+            shutil.move(str(non_ocred_filename), str(pdf_path))
+            self.review_manager.logger.error(
+                f"OCR failed or timed out for {record.data[Fields.ID]}"
+            )
+            return record
 
         record.add_field_provenance_note(
             key=Fields.FILE, note="pdf_processed with OCRMYPDF"
@@ -105,3 +93,7 @@ class OCRMyPDF:
         record = self._apply_ocr(record=record)
 
         return record.data
+
+    def close(self) -> None:
+        """Stop the OCR workers (called at the end of the pdf-prep operation)"""
+        self.ocr_worker_pool.close()
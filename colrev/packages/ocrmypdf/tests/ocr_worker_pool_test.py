@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+"""Test the OCR worker pool of the ocrmypdf package"""
+import subprocess  # nosec
+import threading
+import time
+from multiprocessing.pool import ThreadPool as Pool
+from pathlib import Path
+
+import pytest
+from docker.errors import APIError
+from docker.errors import NotFound
+from requests.exceptions import ReadTimeout
+
+import colrev.exceptions as colrev_exceptions
+from colrev.packages.ocrmypdf.src import ocr_worker_pool
+
+
+def test_ocr_worker_pool_containers(tmp_path, mocker) -> None:  # type: ignore
+    """Test that jobs are executed in a fixed number of long-lived containers"""
+
+    mocker.patch(
+        "colrev.review_manager.ReviewManager.in_ci_environment", return_value=False
+    )
+    build_docker_image = mocker.patch(
+        "colrev.env.docker_manager.DockerManager.build_docker_image",
+    )
+    lock = threading.Lock()
+    running = {"current": 0, "max": 0}
+
+    def run_container(**kwargs):  # type: ignore
+        worker_dir = Path(kwargs["volumes"][0].split(":")[0])
+
+        def exec_run(_cmd):  # type: ignore
+            with lock:
+                running["current"] += 1
+                running["max"] = max(running["max"], running["current"])
+            time.sleep(0.01)
+            with lock:
+                running["current"] -= 1
+            if "read_timeout.pdf" == (worker_dir / "input.pdf").read_text():
+                raise ReadTimeout("Read timed out")
+            if "timeout.pdf" == (worker_dir / "input.pdf").read_text():
+                return 124, b""
+            if "stopped.pdf" == (worker_dir / "input.pdf").read_text():
+                raise NotFound("Container not running")
+            (worker_dir / "output.pdf").write_text("ocr")
+            return 0, b""
+
+        container = mocker.Mock()
+        container.exec_run.side_effect = exec_run
+        return container
+
+    client = mocker.Mock()
+    client.containers.run.side_effect = run_container
+    from_env = mocker.patch("docker.from_env", return_value=client)
+
+    pool = ocr_worker_pool.OCRWorkerPool(
+        image="ocrmypdf", working_dir=tmp_path / "cache", nr_workers=2, local=False
+    )
+    input_paths = []
+    for i in range(8):
+        input_path = tmp_path / f"{i}_no_ocr.pdf"
+        input_path.write_text(f"{i}.pdf")
+        input_paths.append(input_path)
+
+    with Pool(8) as thread_pool:
+        results = thread_pool.map(
+            lambda input_path: pool.apply_ocr(
+                input_path=input_path,
+                output_path=input_path.with_name(
+                    input_path.name.replace("_no_ocr", "")
+                ),
+            ),
+            input_paths,
+        )
+
+    assert all(results)
+    build_docker_image.assert_called_once()
+    assert 2 == client.containers.run.call_count
+    assert running["max"] <= 2
+    assert all((tmp_path / f"{i}.pdf").read_text() == "ocr" for i in range(8))
+
+    # Failed (e.g., timed out) jobs do not create output files
+    input_path = tmp_path / "timeout_no_ocr.pdf"
+    input_path.write_text("timeout.pdf")
+    assert not pool.apply_ocr(
+        input_path=input_path, output_path=tmp_path / "timeout.pdf"
+    )
+    assert not (tmp_path / "timeout.pdf").is_file()
+
+    # Read timeouts of the docker client do not end the thread
+    input_path = tmp_path / "read_timeout_no_ocr.pdf"
+    input_path.write_text("read_timeout.pdf")
+    assert not pool.apply_ocr(
+        input_path=input_path, output_path=tmp_path / "read_timeout.pdf"
+    )
+    assert not (tmp_path / "read_timeout.pdf").is_file()
+    # The read timeout of the client exceeds the per-file timeout
+    assert from_env.call_args.kwargs["timeout"] > pool.TIMEOUT
+
+    # Workers whose container stopped are replaced
+    input_path = tmp_path / "stopped_no_ocr.pdf"
+    input_path.write_text("stopped.pdf")
+    assert not pool.apply_ocr(
+        input_path=input_path, output_path=tmp_path / "stopped.pdf"
+    )
+    assert 3 == client.containers.run.call_count
+    assert 2 == len(pool._workers)
+    for input_path in input_paths:
+        assert pool.apply_ocr(
+            input_path=input_path,
+            output_path=input_path.with_name(input_path.name.replace("_no_ocr", "")),
+        )
+
+    pool.close()
+    assert 3 == client.containers.run.call_count
+
+
+def test_ocr_worker_pool_stopped_containers(tmp_path, mocker) -> None:  # type: ignore
+    """Test that workers are dropped if their containers cannot be replaced"""
+
+    mocker.patch(
+        "colrev.review_manager.ReviewManager.in_ci_environment", return_value=True
+    )
+    build_docker_image = mocker.patch(
+        "colrev.env.docker_manager.DockerManager.build_docker_image",
+    )
+    container = mocker.Mock()
+    container.exec_run.side_effect = NotFound("Container not running")
+    client = mocker.Mock()
+    client.containers.run.side_effect = [container, APIError("Docker stopped")]
+    mocker.patch("docker.from_env", return_value=client)
+
+    pool = ocr_worker_pool.OCRWorkerPool(
+        image="ocrmypdf", working_dir=tmp_path / "cache", nr_workers=1, local=False
+    )
+    input_path = tmp_path / "a_no_ocr.pdf"
+    input_path.write_text("a.pdf")
+    assert not pool.apply_ocr(input_path=input_path, output_path=tmp_path / "a.pdf")
+    # The image is not built in CI environments
+    build_docker_image.assert_not_called()
+    assert not pool._workers
+
+    # Waiting jobs do not block when no worker is left
+    with pytest.raises(colrev_exceptions.ServiceNotAvailableException):
+        pool._get_idle_worker()
+
+
+def test_ocr_worker_pool_local(tmp_path, mocker) -> None:  # type: ignore
+    """Test the local ocrmypdf processes (with per-file timeouts)"""
+
+    from_env = mocker.patch("docker.from_env")
+    run = mocker.patch("subprocess.run", return_value=mocker.Mock(returncode=0))
+    pool = ocr_worker_pool.OCRWorkerPool(
+        image="ocrmypdf", working_dir=tmp_path, nr_workers=2, local=True
+    )
+    assert pool.apply_ocr(
+        input_path=tmp_path / "a_no_ocr.pdf", output_path=tmp_path / "a.pdf"
+    )
+    assert "ocrmypdf" == run.call_args.args[0][0]
+    assert pool.TIMEOUT == run.call_args.kwargs["timeout"]
+
+    run.side_effect = subprocess.TimeoutExpired(cmd="ocrmypdf", timeout=1)
+    assert not pool.apply_ocr(
+        input_path=tmp_path / "a_no_ocr.pdf", output_path=tmp_path / "a.pdf"
+    )
+    from_env.assert_not_called()
@@ -121,11 +121,8 @@ class PaperMarkdown:
 
         self._create_non_sample_references_bib()
 
-        if not self.review_manager.in_ci_environment():
-            self.pandoc_image = "pandoc/latex:3.2.0"
-            colrev.env.docker_manager.DockerManager.build_docker_image(
-                imagename=self.pandoc_image
-            )
+        # The Docker image is provisioned when the paper is built
+        self.pandoc_image = "pandoc/latex:3.2.0"
 
         self.paper_relative_path = self.settings.paper_path.relative_to(
             self.review_manager.path
@@ -668,6 +665,10 @@ class PaperMarkdown:
         self.review_manager.dataset.add_changes(self.sample_references)
 
     def _call_docker_build_process(self, *, script: str) -> None:
+        if not self.review_manager.in_ci_environment():
+            colrev.env.docker_manager.DockerManager.build_docker_image(
+                imagename=self.pandoc_image
+            )
         try:
             uid = os.stat(self.review_manager.paths.records).st_uid
             gid = os.stat(self.review_manager.paths.records).st_gid
@@ -690,6 +691,7 @@ class PaperMarkdown:
             container.remove()
 
         except docker.errors.ImageNotFound:
+            colrev.env.docker_manager.DockerManager.invalidate_image(self.pandoc_image)
             self.review_manager.logger.error("Docker image not found")
         except docker.errors.ContainerError as exc:
             if "Temporary failure in name resolution" in str(exc):
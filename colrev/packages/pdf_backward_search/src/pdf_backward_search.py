@@ -4,16 +4,17 @@ from __future__ import annotations
 
 import json
 import typing
+from multiprocessing.pool import ThreadPool as Pool
 from pathlib import Path
 
 import inquirer
 import pandas as pd
 import requests
 import zope.interface
-from bib_dedupe.bib_dedupe import block
 from bib_dedupe.bib_dedupe import cluster
 from bib_dedupe.bib_dedupe import match
 from bib_dedupe.bib_dedupe import prep
+from bib_dedupe.constants.fields import SEARCH_SET
 from bib_dedupe.merge import merge
 from pydantic import Field
 from rapidfuzz import fuzz
@@ -31,6 +32,11 @@ from colrev.constants import RecordState
 from colrev.constants import SearchSourceHeuristicStatus
 from colrev.constants import SearchType
 from colrev.packages.crossref.src import crossref_api
+from colrev.packages.pdf_backward_search.src.reference_store import (
+    BackwardSearchReferenceStore,
+)
+from colrev.record.record_blocking import block_new_records
+from colrev.record.record_blocking import OLD_SEARCH
 
 # pylint: disable=unused-argument
 # pylint: disable=duplicate-code
@@ -43,6 +49,8 @@ class BackwardSearchSource:
     """
 
     _api_url = "https://opencitations.net/index/coci/api/v1/references/"
+    # TEI documents processed in parallel
+    NR_WORKERS = 4
 
     settings_class = colrev.package_manager.package_settings.DefaultSourceSettings
     endpoint = "colrev.pdf_backward_search"
@@ -185,46 +193,75 @@ class BackwardSearchSource:
         return similarity
 
     @classmethod
-    def _deduplicate_all_references(cls, all_references: dict) -> pd.DataFrame:
+    def _deduplicate_all_references(
+        cls,
+        all_references: dict,
+        *,
+        reference_store: BackwardSearchReferenceStore,
+    ) -> pd.DataFrame:
         print("Resolving entities in citation network")
+
+        # Only the references of records that are not integrated
+        # in the (stored) reference network are deduplicated
+        network_df, new_record_ids = reference_store.get_network(all_references)
         # Flatten the list of lists into a single list of references, including the record ID
-        all_references_flat = [
+        new_references_flat = [
             {**ref, "record_id": record_id}
             for record_id, refs in all_references.items()
+            if record_id in new_record_ids
             for ref in refs
         ]
-        if len(all_references_flat) == 0:
-            return pd.DataFrame()
+        if len(new_references_flat) == 0:
+            if network_df.empty:
+                return pd.DataFrame()
+            return network_df.rename(columns={"origin": "bw_search_origins"})
 
-        for ref in all_references_flat:
+        for ref in new_references_flat:
             ref[Fields.ID] = ref["record_id"] + "_backward_search_" + ref[Fields.ID]
 
         # Create a DataFrame from the flattened list of references
-        df_all_references = pd.DataFrame(all_references_flat)
-        df_all_references["nr_references"] = 1
+        df_new_references = pd.DataFrame(new_references_flat)
+        df_new_references["nr_references"] = 1
+        df_new_references["origin"] = df_new_references[Fields.ID]
+        df_new_references[SEARCH_SET] = ""
+        df_all_references = df_new_references
+        if not network_df.empty:
+            # References in the network are not compared with each other
+            network_df[SEARCH_SET] = OLD_SEARCH
+            df_all_references = pd.concat(
+                [network_df, df_new_references], ignore_index=True
+            )
 
         def merge_into_list(values: list) -> str:
             """Concatenate all values into a single string, separated by commas."""
             merged_string = ",".join(str(value) for value in values)
             return merged_string
 
-        def sum_nr_references(values: list) -> int:
+        def sum_nr_references(values: list) -> str:
             """Sum all integers in a list."""
-            return sum(values)
+            return str(sum(int(value) for value in values))
 
         records_df = prep(df_all_references, verbosity_level=0)
-        deduplication_pairs = block(records_df, verbosity_level=0)
-        matched_df = match(deduplication_pairs, verbosity_level=0)
-        duplicate_id_sets = cluster(matched_df, verbosity_level=0)
+        deduplication_pairs = block_new_records(records_df)
+        if deduplication_pairs.empty:
+            duplicate_id_sets = []
+        else:
+            matched_df = match(deduplication_pairs, verbosity_level=0)
+            duplicate_id_sets = cluster(matched_df, verbosity_level=0)
         df_all_references = merge(
-            df_all_references,
+            df_all_references.drop(columns=[SEARCH_SET]),
             duplicate_id_sets=duplicate_id_sets,
             merge_functions={
                 Fields.NR_INTEXT_CITATIONS: merge_into_list,
                 "nr_references": sum_nr_references,
             },
         )
-        df_all_references.rename(columns={"origin": "bw_search_origins"}, inplace=True)
+        reference_store.set_network(
+            network_df=df_all_references, record_ids=all_references
+        )
+        df_all_references = df_all_references.rename(
+            columns={"origin": "bw_search_origins"}
+        )
         return df_all_references
 
     @classmethod
@@ -397,11 +434,17 @@ class BackwardSearchSource:
             if self._bw_search_condition(record=record)
         }
 
+        reference_store = self._get_reference_store(self.review_manager)
         all_references = self._get_all_references(
-            selected_records=selected_records, review_manager=self.review_manager
+            selected_records=selected_records,
+            review_manager=self.review_manager,
+            reference_store=reference_store,
         )
 
-        df_all_references = self._deduplicate_all_references(all_references)
+        df_all_references = self._deduplicate_all_references(
+            all_references, reference_store=reference_store
+        )
+        reference_store.save()
 
         df_all_references["meets_criteria"] = df_all_references[
             Fields.NR_INTEXT_CITATIONS
@@ -454,43 +497,88 @@ class BackwardSearchSource:
         return result
 
     @classmethod
-    def _get_all_references(
+    def _get_references(
         cls,
+        record: dict,
         *,
-        selected_records: dict,
         review_manager: colrev.review_manager.ReviewManager,
-    ) -> dict:
-
-        all_references = {}
-
-        for record in tqdm(selected_records.values()):
-            try:
-
-                review_manager.logger.info(
-                    f" run backward search for {record[Fields.ID]}"
-                )
-
-                pdf_path = review_manager.path / Path(record[Fields.FILE])
-                tei = review_manager.get_tei(
-                    pdf_path=pdf_path,
-                    tei_path=colrev.record.record.Record(record).get_tei_filename(),
+        reference_store: BackwardSearchReferenceStore,
+    ) -> typing.Optional[list]:
+        try:
+            review_manager.logger.info(f" run backward search for {record[Fields.ID]}")
+
+            pdf_path = review_manager.path / Path(record[Fields.FILE])
+            tei_path = colrev.record.record.Record(record).get_tei_filename()
+            references = None
+            if (review_manager.path / tei_path).is_file():
+                references = reference_store.get_references(
+                    record_id=record[Fields.ID],
+                    tei_path=review_manager.path / tei_path,
                 )
-
+            if references is None:
+                tei = review_manager.get_tei(pdf_path=pdf_path, tei_path=tei_path)
                 references = tei.get_references(add_intext_citation_count=True)
                 for reference in references:
                     if "tei_id" in reference:
                         del reference["tei_id"]
-                    reference["bwsearch_ref"] = (
-                        record[Fields.ID] + "_backward_search_" + reference[Fields.ID]
-                    )
+                reference_store.add_references(
+                    record_id=record[Fields.ID],
+                    tei_path=review_manager.path / tei_path,
+                    references=references,
+                )
 
-                all_references[record[Fields.ID]] = references
+            for reference in references:
+                reference["bwsearch_ref"] = (
+                    record[Fields.ID] + "_backward_search_" + reference[Fields.ID]
+                )
+            return references
 
-            except colrev_exceptions.TEIException:
-                review_manager.logger.info("Error accessing TEI")
-            except KeyError as exc:
-                review_manager.logger.info(exc)
-        return all_references
+        except colrev_exceptions.TEIException:
+            review_manager.logger.info("Error accessing TEI")
+        except KeyError as exc:
+            review_manager.logger.info(exc)
+        return None
+
+    @classmethod
+    def _get_all_references(
+        cls,
+        *,
+        selected_records: dict,
+        review_manager: colrev.review_manager.ReviewManager,
+        reference_store: BackwardSearchReferenceStore,
+    ) -> dict:
+        """Get the references of the records
+        (TEI documents are processed in parallel, reference lists are reused
+        if the TEI did not change)"""
+
+        with Pool(cls.NR_WORKERS) as pool:
+            references_list = list(
+                tqdm(
+                    pool.imap(
+                        lambda record: cls._get_references(
+                            record,
+                            review_manager=review_manager,
+                            reference_store=reference_store,
+                        ),
+                        selected_records.values(),
+                    ),
+                    total=len(selected_records),
+                )
+            )
+
+        return {
+            record_id: references
+            for record_id, references in zip(selected_records, references_list)
+            if references is not None
+        }
+
+    @classmethod
+    def _get_reference_store(
+        cls, review_manager: colrev.review_manager.ReviewManager
+    ) -> BackwardSearchReferenceStore:
+        return BackwardSearchReferenceStore(
+            store_path=review_manager.paths.cache / Path("pdf_backward_search.json")
+        )
 
     @classmethod
     def _get_settings_from_ui(
@@ -520,11 +608,17 @@ class BackwardSearchSource:
             ]
         }
 
+        reference_store = cls._get_reference_store(review_manager)
         all_references = cls._get_all_references(
-            selected_records=selected_records, review_manager=review_manager
+            selected_records=selected_records,
+            review_manager=review_manager,
+            reference_store=reference_store,
         )
 
-        df_all_references = cls._deduplicate_all_references(all_references)
+        df_all_references = cls._deduplicate_all_references(
+            all_references, reference_store=reference_store
+        )
+        reference_store.save()
 
         cls._export_crosstab_thresholds(df_all_references)
 
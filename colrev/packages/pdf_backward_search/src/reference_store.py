@@ -0,0 +1,120 @@
+#! /usr/bin/env python
+"""Persisted reference lists and reference network (for incremental backward searches)"""
+from __future__ import annotations
+
+import hashlib
+import json
+import typing
+from importlib.metadata import version
+from multiprocessing import Lock
+from pathlib import Path
+
+import pandas as pd
+
+
+class BackwardSearchReferenceStore:
+    """Store of the references extracted from TEI documents
+
+    Reference lists are keyed by the hash of the TEI file (reused when
+    the TEI did not change). The deduplicated reference network is stored
+    with the TEI hashes of the records it integrates, so that reruns only
+    integrate the references of new records."""
+
+    def __init__(self, *, store_path: Path) -> None:
+        self.store_path = store_path
+        self.bib_dedupe_version = version("bib-dedupe")
+        store = self._load()
+        self.references: typing.Dict[str, list] = store.get("references", {})
+        self.network_tei_hashes: typing.Dict[str, str] = store.get(
+            "network_tei_hashes", {}
+        )
+        self.network: typing.List[dict] = store.get("network", [])
+        # TEI hashes of the current records
+        self.tei_hashes: typing.Dict[str, str] = {}
+        self._lock = Lock()
+
+    def _load(self) -> dict:
+        if not self.store_path.is_file():
+            return {}
+        try:
+            with open(self.store_path, encoding="utf-8") as file:
+                store = json.load(file)
+        except json.JSONDecodeError:
+            return {}
+        if store.get("bib_dedupe_version") != self.bib_dedupe_version:
+            return {}
+        return store
+
+    def save(self) -> None:
+        """Save the store (reference lists of the current records)"""
+        current_hashes = set(self.tei_hashes.values())
+        store = {
+            "bib_dedupe_version": self.bib_dedupe_version,
+            "references": {
+                tei_hash: references
+                for tei_hash, references in self.references.items()
+                if tei_hash in current_hashes
+            },
+            "network_tei_hashes": self.network_tei_hashes,
+            "network": self.network,
+        }
+        self.store_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.store_path, "w", encoding="utf-8") as file:
+            json.dump(store, file)
+
+    @classmethod
+    def get_tei_hash(cls, tei_path: Path) -> str:
+        """Get the hash of the TEI file"""
+        return hashlib.sha256(tei_path.read_bytes()).hexdigest()
+
+    def get_references(
+        self, *, record_id: str, tei_path: Path
+    ) -> typing.Optional[list]:
+        """Get the stored references of the TEI (None if not available)"""
+        tei_hash = self.get_tei_hash(tei_path)
+        with self._lock:
+            self.tei_hashes[record_id] = tei_hash
+            if tei_hash not in self.references:
+                return None
+            return [dict(reference) for reference in self.references[tei_hash]]
+
+    def add_references(
+        self, *, record_id: str, tei_path: Path, references: list
+    ) -> None:
+        """Add the references of the record (extracted from its TEI)"""
+        tei_hash = self.get_tei_hash(tei_path)
+        with self._lock:
+            self.tei_hashes[record_id] = tei_hash
+            self.references[tei_hash] = [dict(reference) for reference in references]
+
+    def get_network(
+        self, record_ids: typing.Iterable[str]
+    ) -> typing.Tuple[pd.DataFrame, typing.Set[str]]:
+        """Get the stored reference network and the records it does not integrate
+
+        The network is not used if records were removed or their TEI changed."""
+        record_ids = set(record_ids)
+        if not self.network or any(
+            self.tei_hashes.get(record_id) != tei_hash
+            for record_id, tei_hash in self.network_tei_hashes.items()
+        ):
+            return pd.DataFrame(), record_ids
+        return (
+            pd.DataFrame(self.network),
+            record_ids - self.network_tei_hashes.keys(),
+        )
+
+    def set_network(
+        self, *, network_df: pd.DataFrame, record_ids: typing.Iterable[str]
+    ) -> None:
+        """Set the reference network (integrating the references of the records)"""
+        # Missing values are cast to "nan" when merging
+        self.network = [
+            {key: value for key, value in reference.items() if value != "nan"}
+            for reference in network_df.to_dict(orient="records")
+        ]
+        self.network_tei_hashes = {
+            record_id: self.tei_hashes[record_id]
+            for record_id in record_ids
+            if record_id in self.tei_hashes
+        }
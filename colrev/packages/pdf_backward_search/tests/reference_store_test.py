@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+"""Test the reference store of the pdf_backward_search package"""
+import logging
+import typing
+from pathlib import Path
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+from bib_dedupe.bib_dedupe import match
+
+from colrev.constants import Fields
+from colrev.packages.pdf_backward_search.src import pdf_backward_search
+from colrev.packages.pdf_backward_search.src.reference_store import (
+    BackwardSearchReferenceStore,
+)
+
+# pylint: disable=unused-argument
+# pylint: disable=protected-access
+
+REFERENCES = {
+    "platforms": {
+        Fields.ENTRYTYPE: "article",
+        Fields.TITLE: "Digital platforms and the future of work",
+        Fields.AUTHOR: "Smith, John and Miller, Anna",
+        Fields.JOURNAL: "MIS Quarterly",
+        Fields.YEAR: "2020",
+        Fields.VOLUME: "44",
+        Fields.NUMBER: "2",
+        Fields.PAGES: "1--20",
+    },
+    "governance": {
+        Fields.ENTRYTYPE: "article",
+        Fields.TITLE: "Platform governance in digital ecosystems",
+        Fields.AUTHOR: "Jones, Peter",
+        Fields.JOURNAL: "Information Systems Research",
+        Fields.YEAR: "2019",
+        Fields.VOLUME: "30",
+        Fields.NUMBER: "1",
+        Fields.PAGES: "5--25",
+    },
+    "reviews": {
+        Fields.ENTRYTYPE: "article",
+        Fields.TITLE: "Literature reviews in information systems research",
+        Fields.AUTHOR: "Wagner, Gerit and Pare, Guy",
+        Fields.JOURNAL: "Journal of Information Technology",
+        Fields.YEAR: "2021",
+        Fields.VOLUME: "36",
+        Fields.NUMBER: "4",
+        Fields.PAGES: "300--330",
+    },
+}
+
+REFERENCE_LISTS = {
+    "A": ["platforms", "governance"],
+    "B": ["platforms", "reviews"],
+    "C": ["governance", "reviews"],
+}
+
+
+@pytest.fixture(name="review_manager")
+def fixture_review_manager(tmp_path: Path) -> SimpleNamespace:
+    """Review manager with TEI documents (parsed references are counted)"""
+
+    def get_tei(*, pdf_path: Path, tei_path: Path) -> SimpleNamespace:
+        record_id = tei_path.stem.replace(".tei", "")
+        review_manager.parsed_teis.append(record_id)
+
+        def get_references(add_intext_citation_count: bool) -> list:
+            return [
+                {
+                    **REFERENCES[key],
+                    Fields.ID: f"b{ind}",
+                    "tei_id": f"b{ind}",
+                    Fields.NR_INTEXT_CITATIONS: 3,
+                }
+                for ind, key in enumerate(REFERENCE_LISTS[record_id])
+            ]
+
+        return SimpleNamespace(get_references=get_references)
+
+    review_manager = SimpleNamespace(
+        path=tmp_path,
+        logger=logging.getLogger(__name__),
+        paths=SimpleNamespace(cache=tmp_path / Path(".colrev")),
+        get_tei=get_tei,
+        parsed_teis=[],
+    )
+    for record_id in REFERENCE_LISTS:
+        tei_path = tmp_path / Path(f"data/.tei/{record_id}.tei.xml")
+        tei_path.parent.mkdir(parents=True, exist_ok=True)
+        tei_path.write_text(f"<TEI>{record_id}</TEI>")
+    return review_manager
+
+
+def _run_backward_search(
+    review_manager: typing.Any, record_ids: typing.List[str]
+) -> pd.DataFrame:
+    backward_search_source = pdf_backward_search.BackwardSearchSource
+    reference_store = backward_search_source._get_reference_store(review_manager)
+    all_references = backward_search_source._get_all_references(
+        selected_records={
+            record_id: {
+                Fields.ID: record_id,
+                Fields.FILE: f"data/pdfs/{record_id}.pdf",
+            }
+            for record_id in record_ids
+        },
+        review_manager=review_manager,
+        reference_store=reference_store,
+    )
+    df_all_references = backward_search_source._deduplicate_all_references(
+        all_references, reference_store=reference_store
+    )
+    reference_store.save()
+    return df_all_references
+
+
+def _get_network(df_all_references: pd.DataFrame) -> typing.Set[tuple]:
+    return {
+        (
+            row[Fields.TITLE],
+            tuple(sorted(row["bw_search_origins"].split(";"))),
+            row["nr_references"],
+        )
+        for row in df_all_references.to_dict(orient="records")
+    }
+
+
+def test_incremental_backward_search(  # type: ignore
+    review_manager: SimpleNamespace, tmp_path: Path, mocker
+) -> None:
+    """Test that reference lists are reused and new records are integrated"""
+
+    matched_pairs = []
+
+    def match_pairs(pairs_df: pd.DataFrame, **kwargs) -> pd.DataFrame:  # type: ignore
+        matched_pairs.extend(pairs_df[["ID1", "ID2"]].values.tolist())
+        return match(pairs_df, **kwargs)
+
+    mocker.patch.object(pdf_backward_search, "match", side_effect=match_pairs)
+
+    df_all_references = _run_backward_search(review_manager, ["A", "B"])
+    assert sorted(review_manager.parsed_teis) == ["A", "B"]
+    assert _get_network(df_all_references) == {
+        (
+            REFERENCES["platforms"][Fields.TITLE],
+            ("A_backward_search_b0", "B_backward_search_b0"),
+            "2",
+        ),
+        (REFERENCES["governance"][Fields.TITLE], ("A_backward_search_b1",), "1"),
+        (REFERENCES["reviews"][Fields.TITLE], ("B_backward_search_b1",), "1"),
+    }
+
+    # Rerun: TEIs are not parsed again and only the references of C are matched
+    review_manager.parsed_teis.clear()
+    matched_pairs.clear()
+    df_incremental = _run_backward_search(review_manager, ["A", "B", "C"])
+    assert review_manager.parsed_teis == ["C"]
+    assert matched_pairs
+    assert all(
+        "C_backward_search_" in id_1 + id_2 for id_1, id_2 in matched_pairs
+    ), matched_pairs
+
+    # Same network as a full run
+    (tmp_path / Path(".colrev/pdf_backward_search.json")).unlink()
+    df_full = _run_backward_search(review_manager, ["A", "B", "C"])
+    assert _get_network(df_incremental) == _get_network(df_full)
+    assert len(df_full) == 3
+
+    # Changed TEI: the reference list is parsed again (and the network is rebuilt)
+    review_manager.parsed_teis.clear()
+    (tmp_path / Path("data/.tei/A.tei.xml")).write_text("<TEI>A (updated)</TEI>")
+    reference_store = BackwardSearchReferenceStore(
+        store_path=tmp_path / Path(".colrev/pdf_backward_search.json")
+    )
+    assert reference_store.network
+    df_changed = _run_backward_search(review_manager, ["A", "B", "C"])
+    assert review_manager.parsed_teis == ["A"]
+    assert _get_network(df_changed) == _get_network(df_full)
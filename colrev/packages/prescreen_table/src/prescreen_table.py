@@ -2,16 +2,17 @@
 """Prescreen based on a table"""
 from __future__ import annotations
 
-import csv
+import itertools
+import typing
 from pathlib import Path
 
-import pandas as pd
 import zope.interface
 from pydantic import Field
 
 import colrev.package_manager.interfaces
 import colrev.package_manager.package_manager
 import colrev.package_manager.package_settings
+import colrev.packages.screen_utils as util_cli_screen
 import colrev.record.record
 from colrev.constants import Colors
 from colrev.constants import Fields
@@ -39,6 +40,42 @@ class TablePrescreen:
         self.review_manager = prescreen_operation.review_manager
         self.settings = self.settings_class(**settings)
 
+    _EXPORT_STATES = {
+        RecordState.md_processed,
+        RecordState.rev_prescreen_excluded,
+        RecordState.rev_prescreen_included,
+        RecordState.pdf_needs_manual_retrieval,
+        RecordState.pdf_imported,
+        RecordState.pdf_not_available,
+        RecordState.pdf_needs_manual_preparation,
+        RecordState.pdf_prepared,
+        RecordState.rev_excluded,
+        RecordState.rev_included,
+        RecordState.rev_synthesized,
+    }
+
+    def _get_table_rows(self, *, records: dict, split: list) -> typing.Iterator[dict]:
+        split_ids = set(split)
+        for record in records.values():
+            if record[Fields.STATUS] not in self._EXPORT_STATES:
+                continue
+
+            if split_ids and record[Fields.ID] not in split_ids:
+                continue
+
+            if RecordState.md_processed == record[Fields.STATUS]:
+                inclusion_1 = "TODO"
+            elif self.export_todos_only:
+                continue
+            elif RecordState.rev_prescreen_excluded == record[Fields.STATUS]:
+                inclusion_1 = "out"
+            else:
+                inclusion_1 = "in"
+
+            row = util_cli_screen.get_table_row(record)
+            row["presceen_inclusion"] = inclusion_1
+            yield row
+
     def export_table(
         self,
         *,
@@ -55,62 +92,14 @@ class TablePrescreen:
 
         self.review_manager.logger.info("Loading records for export")
 
-        tbl = []
-        for record in records.values():
-            if record[Fields.STATUS] not in [
-                RecordState.md_processed,
-                RecordState.rev_prescreen_excluded,
-                RecordState.rev_prescreen_included,
-                RecordState.pdf_needs_manual_retrieval,
-                RecordState.pdf_imported,
-                RecordState.pdf_not_available,
-                RecordState.pdf_needs_manual_preparation,
-                RecordState.pdf_prepared,
-                RecordState.rev_excluded,
-                RecordState.rev_included,
-                RecordState.rev_synthesized,
-            ]:
-                continue
-
-            if len(split) > 0:
-                if record[Fields.ID] not in split:
-                    continue
-
-            if RecordState.md_processed == record[Fields.STATUS]:
-                inclusion_1 = "TODO"
-            elif self.export_todos_only:
-                continue
-            elif RecordState.rev_prescreen_excluded == record[Fields.STATUS]:
-                inclusion_1 = "out"
-            else:
-                inclusion_1 = "in"
-
-            # pylint: disable=duplicate-code
-            row = {
-                Fields.ID: record[Fields.ID],
-                Fields.AUTHOR: record.get(Fields.AUTHOR, ""),
-                Fields.TITLE: record.get(Fields.TITLE, ""),
-                Fields.JOURNAL: record.get(Fields.JOURNAL, ""),
-                Fields.BOOKTITLE: record.get(Fields.BOOKTITLE, ""),
-                Fields.YEAR: record.get(Fields.YEAR, ""),
-                Fields.VOLUME: record.get(Fields.VOLUME, ""),
-                Fields.NUMBER: record.get(Fields.NUMBER, ""),
-                Fields.PAGES: record.get(Fields.PAGES, ""),
-                Fields.DOI: record.get(Fields.DOI, ""),
-                Fields.ABSTRACT: record.get(Fields.ABSTRACT, ""),
-                "presceen_inclusion": inclusion_1,
-            }
-            tbl.append(row)
-
-        if export_table_format.lower() == "csv":
-            screen_df = pd.DataFrame(tbl)
-            screen_df.to_csv("prescreen.csv", index=False, quoting=csv.QUOTE_ALL)
-            self.review_manager.logger.info("Created prescreen.csv")
-
-        if export_table_format.lower() == "xlsx":
-            screen_df = pd.DataFrame(tbl)
-            screen_df.to_excel("prescreen.xlsx", index=False, sheet_name="screen")
-            self.review_manager.logger.info("Created prescreen.xlsx")
+        if export_table_format.lower() in ["csv", "xlsx"]:
+            table_path = Path(f"prescreen.{export_table_format.lower()}")
+            util_cli_screen.write_table(
+                self._get_table_rows(records=records, split=split),
+                path=table_path,
+                fieldnames=util_cli_screen.TABLE_FIELDS + ["presceen_inclusion"],
+            )
+            self.review_manager.logger.info(f"Created {table_path}")
 
         self.review_manager.logger.info(
             f"To prescreen records, {Colors.ORANGE}enter [in|out] "
@@ -127,7 +116,10 @@ class TablePrescreen:
         records: dict,
         import_table_path: str = "prescreen.csv",
     ) -> None:
-        """Import a prescreen table"""
+        """Import a prescreen table
+
+        The table is read row by row and only the records
+        with changed decisions are saved."""
 
         # pylint: disable=too-many-branches
 
@@ -140,60 +132,62 @@ class TablePrescreen:
             )
             return
 
-        if import_table_path.endswith(".csv"):
-            prescreen_df = pd.read_csv(import_table_path)
-        elif import_table_path.endswith(".xlsx") or import_table_path.endswith(".xls"):
-            prescreen_df = pd.read_excel(import_table_path)
-        else:
-            raise ValueError(f"Unsupported file format: {import_table_path}")
-        prescreen_df.fillna("", inplace=True)
-        prescreened_records = prescreen_df.to_dict("records")
-
-        if "presceen_inclusion" not in prescreened_records[0]:
+        prescreened_records = util_cli_screen.read_table(Path(import_table_path))
+        first_prescreened_record = next(prescreened_records, {})
+        if "presceen_inclusion" not in first_prescreened_record:
             self.review_manager.logger.warning("presceen_inclusion column missing")
             return
 
         prescreen_included = 0
         prescreen_excluded = 0
         nr_todo = 0
+        changed_records = {}
         self.review_manager.logger.info("Update prescreen results")
-        for prescreened_record in prescreened_records:
-            if prescreened_record.get(Fields.ID, "") in records:
-                record = colrev.record.record.Record(
-                    records[prescreened_record.get(Fields.ID, "")]
+        for prescreened_record in itertools.chain(
+            [first_prescreened_record], prescreened_records
+        ):
+            if prescreened_record.get(Fields.ID, "") not in records:
+                self.review_manager.logger.warning(
+                    f"ID not in records: {prescreened_record.get('ID', '')}"
                 )
-                if record.data[Fields.STATUS] in RecordState.get_post_x_states(
-                    state=RecordState.rev_prescreen_included
+                continue
+
+            record = colrev.record.record.Record(
+                records[prescreened_record.get(Fields.ID, "")]
+            )
+            prescreen_inclusion = prescreened_record.get("presceen_inclusion", "")
+            if record.data[Fields.STATUS] in RecordState.get_post_x_states(
+                state=RecordState.rev_prescreen_included
+            ):
+                if (
+                    "in" == prescreen_inclusion
+                    and RecordState.rev_prescreen_excluded != record.data[Fields.STATUS]
                 ):
-                    if (
-                        "in" == prescreened_record.data.get("presceen_inclusion", "")
-                        and RecordState.rev_prescreen_excluded
-                        != record.data[Fields.STATUS]
-                    ):
-                        continue
-
-                if prescreened_record.get("presceen_inclusion", "") == "out":
-                    if record.data[Fields.STATUS] != RecordState.rev_prescreen_excluded:
-                        prescreen_excluded += 1
-                    record.set_status(RecordState.rev_prescreen_excluded)
-
-                elif prescreened_record.get("presceen_inclusion", "") == "in":
-                    if record.data[Fields.STATUS] != RecordState.rev_prescreen_included:
-                        prescreen_included += 1
-                    record.set_status(RecordState.rev_prescreen_included)
-                elif prescreened_record.get("presceen_inclusion", "") == "TODO":
-                    nr_todo += 1
-                else:
-                    self.review_manager.logger.warning(
-                        "Invalid value in prescreen_inclusion: "
-                        f"{prescreened_record.get('presceen_inclusion', '')} "
-                        f"({prescreened_record.get('ID', 'NO_ID')})"
-                    )
+                    continue
 
+            if prescreen_inclusion == "out":
+                target_state = RecordState.rev_prescreen_excluded
+            elif prescreen_inclusion == "in":
+                target_state = RecordState.rev_prescreen_included
+            elif prescreen_inclusion == "TODO":
+                nr_todo += 1
+                continue
             else:
                 self.review_manager.logger.warning(
-                    f"ID not in records: {prescreened_record.get('ID', '')}"
+                    "Invalid value in prescreen_inclusion: "
+                    f"{prescreen_inclusion} "
+                    f"({prescreened_record.get('ID', 'NO_ID')})"
                 )
+                continue
+
+            if record.data[Fields.STATUS] == target_state:
+                continue
+            if target_state == RecordState.rev_prescreen_excluded:
+                prescreen_excluded += 1
+            else:
+                prescreen_included += 1
+            record.set_status(target_state)
+            changed_records[record.data[Fields.ID]] = record.get_data()
 
         self.review_manager.logger.info(
             f" {Colors.GREEN}{prescreen_included} records prescreen_included{Colors.END}"
@@ -206,7 +200,7 @@ class TablePrescreen:
             f" {Colors.ORANGE}{nr_todo} records to prescreen{Colors.END}"
         )
 
-        self.review_manager.dataset.save_records_dict(records)
+        self.review_manager.dataset.save_records_dict(changed_records, partial=True)
         self.review_manager.logger.info("Completed import")
 
     def run_prescreen(
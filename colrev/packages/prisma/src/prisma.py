@@ -68,10 +68,7 @@ class PRISMA:
             output_dir / path for path in self.settings.diagram_path
         ]
 
-        if not self.review_manager.in_ci_environment():
-            colrev.env.docker_manager.DockerManager.build_docker_image(
-                imagename=self.PRISMA_IMAGE
-            )
+        # The Docker image is provisioned when the diagram is created
         data_operation.docker_images_to_stop.append(self.PRISMA_IMAGE)
 
     # pylint: disable=unused-argument
@@ -170,6 +167,10 @@ class PRISMA:
             self.csv_path.unlink()
 
     def _call_docker_build_process(self, *, script: str) -> None:
+        if not self.review_manager.in_ci_environment():
+            colrev.env.docker_manager.DockerManager.build_docker_image(
+                imagename=self.PRISMA_IMAGE
+            )
         try:
             settings_path = self.review_manager.paths.settings
             uid = os.stat(settings_path).st_uid
@@ -189,6 +190,7 @@ class PRISMA:
                 detach=True,
             )
         except docker.errors.ImageNotFound:
+            colrev.env.docker_manager.DockerManager.invalidate_image(self.PRISMA_IMAGE)
             self.review_manager.logger.error("Docker image not found")
         except docker.errors.ContainerError as exc:
             if "Temporary failure in name resolution" in str(exc):
@@ -209,6 +211,11 @@ class PRISMA:
     ) -> None:
         """Update the data/prisma diagram"""
 
+        # The diagram is not created in silent mode (e.g., in pre-commit hooks)
+        # because it requires a Docker container
+        if silent_mode:
+            return
+
         self._export_csv(silent_mode=silent_mode)
         self._export_diagram(silent_mode=silent_mode)
 
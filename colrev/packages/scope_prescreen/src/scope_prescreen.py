@@ -8,8 +8,10 @@ import zope.interface
 from pydantic import BaseModel
 from pydantic import Field
 
+import colrev.env.keyword_matcher
 import colrev.env.language_service
 import colrev.env.local_index
+import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
 import colrev.package_manager.interfaces
 import colrev.package_manager.package_manager
@@ -115,8 +117,10 @@ class ScopePrescreen:
         self.settings = self.settings_class(**settings)
         self.local_index = colrev.env.local_index.LocalIndex()
 
-        self.title_complementary_materials_keywords = (
-            colrev.env.utils.load_complementary_material_keywords()
+        self.title_complementary_materials_matcher = (
+            colrev.env.keyword_matcher.KeywordMatcher(
+                strings=colrev.env.utils.load_complementary_material_keywords()
+            )
         )
 
     def _conditional_prescreen_entrytypes(
@@ -192,9 +196,8 @@ class ScopePrescreen:
             return
 
         if Fields.TITLE in record.data:
-            if (
-                record.data[Fields.TITLE].lower()
-                in self.title_complementary_materials_keywords
+            if self.title_complementary_materials_matcher.matches(
+                record.data[Fields.TITLE]
             ):
                 record.prescreen_exclude(reason="complementary material")
 
@@ -2,11 +2,9 @@
 """Screen based on a table"""
 from __future__ import annotations
 
-import csv
 import typing
 from pathlib import Path
 
-import pandas as pd
 import zope.interface
 from pydantic import Field
 
@@ -40,24 +38,19 @@ class TableScreen:
         self.screen_operation = screen_operation
         self.settings = self.settings_class(**settings)
 
-    def _create_screening_table(self, *, records: dict, split: list) -> list:
+    def _get_screening_table_rows(
+        self, *, records: dict, split: list, screening_criteria: dict
+    ) -> typing.Iterator[dict]:
         # pylint: disable=too-many-branches
-        self.review_manager.logger.info("Loading records for export")
-
-        screening_criteria = util_cli_screen.get_screening_criteria_from_user_input(
-            screen_operation=self.screen_operation, records=records
-        )
-
-        tbl = []
+        split_ids = set(split)
         for record in records.values():
             if record[Fields.STATUS] not in [
                 RecordState.pdf_prepared,
             ]:
                 continue
 
-            if len(split) > 0:
-                if record[Fields.ID] not in split:
-                    continue
+            if split_ids and record[Fields.ID] not in split_ids:
+                continue
 
             inclusion_2 = "NA"
 
@@ -73,20 +66,7 @@ class TableScreen:
             ]:
                 inclusion_2 = "in"
 
-            # pylint: disable=duplicate-code
-            row = {
-                Fields.ID: record[Fields.ID],
-                Fields.AUTHOR: record.get(Fields.AUTHOR, ""),
-                Fields.TITLE: record.get(Fields.TITLE, ""),
-                Fields.JOURNAL: record.get(Fields.JOURNAL, ""),
-                Fields.BOOKTITLE: record.get(Fields.BOOKTITLE, ""),
-                Fields.YEAR: record.get(Fields.YEAR, ""),
-                Fields.VOLUME: record.get(Fields.VOLUME, ""),
-                Fields.NUMBER: record.get(Fields.NUMBER, ""),
-                Fields.PAGES: record.get(Fields.PAGES, ""),
-                Fields.DOI: record.get(Fields.DOI, ""),
-                Fields.ABSTRACT: record.get(Fields.ABSTRACT, ""),
-            }
+            row = util_cli_screen.get_table_row(record)
 
             if len(screening_criteria) == 0:
                 # No criteria: code inclusion directly
@@ -103,9 +83,7 @@ class TableScreen:
                     for criterion_name, decision in screening_criteria_field.split(";"):
                         row[criterion_name] = decision
 
-            tbl.append(row)
-
-        return tbl
+            yield row
 
     def export_table(
         self,
@@ -124,25 +102,29 @@ class TableScreen:
             print("File already exists. Please rename it.")
             return
 
-        tbl = self._create_screening_table(records=records, split=split)
+        self.review_manager.logger.info("Loading records for export")
+
+        screening_criteria = util_cli_screen.get_screening_criteria_from_user_input(
+            screen_operation=self.screen_operation, records=records
+        )
 
         self.screen_table_path.parents[0].mkdir(parents=True, exist_ok=True)
 
-        if export_table_format.lower() == "csv":
-            screen_df = pd.DataFrame(tbl)
-            screen_df.to_csv(self.screen_table_path, index=False, quoting=csv.QUOTE_ALL)
-            self.review_manager.logger.info(f"Created {self.screen_table_path}")
-
-        if export_table_format.lower() == "xlsx":
-            screen_df = pd.DataFrame(tbl)
-            screen_df.to_excel(
-                self.screen_table_path.with_suffix(".xlsx"),
-                index=False,
-                sheet_name="screen",
+        if export_table_format.lower() in ["csv", "xlsx"]:
+            table_path = self.screen_table_path.with_suffix(
+                f".{export_table_format.lower()}"
             )
-            self.review_manager.logger.info(
-                f"Created {self.screen_table_path.with_suffix('.xlsx')}"
+            util_cli_screen.write_table(
+                self._get_screening_table_rows(
+                    records=records,
+                    split=split,
+                    screening_criteria=screening_criteria,
+                ),
+                path=table_path,
+                fieldnames=util_cli_screen.TABLE_FIELDS
+                + (list(screening_criteria) or ["screen_inclusion"]),
             )
+            self.review_manager.logger.info(f"Created {table_path}")
 
         return
 
@@ -151,9 +133,13 @@ class TableScreen:
         records: dict,
         import_table_path: typing.Optional[Path] = None,
     ) -> None:
-        """Import a screening table"""
+        """Import a screening table
+
+        The table is read row by row and only the records
+        with changed decisions are saved."""
 
         # pylint: disable=duplicate-code
+        # pylint: disable=too-many-branches
         if import_table_path is None:
             import_table_path = self.screen_table_path
 
@@ -163,27 +149,29 @@ class TableScreen:
             )
             return
 
-        screen_df = pd.read_csv(import_table_path)
-        screen_df.fillna("", inplace=True)
-        screened_records = screen_df.to_dict("records")
-
         screening_criteria = self.review_manager.settings.screen.criteria
 
-        for screened_record in screened_records:
-            if screened_record.get(Fields.ID, "") in records:
-                record_dict = records[screened_record.get(Fields.ID, "")]
-                record = colrev.record.record.Record(record_dict)
-                if "screen_inclusion" in screened_record:
-                    if screened_record["screen_inclusion"] == "in":
-                        record.set_status(RecordState.rev_included)
-                    elif screened_record["screen_inclusion"] == "out":
-                        record.set_status(RecordState.rev_excluded)
-                    else:
-                        print(
-                            f"Invalid choice: {screened_record['screen_inclusion']} "
-                            f"({screened_record['ID']})"
-                        )
-                    continue
+        changed_records = {}
+        for screened_record in util_cli_screen.read_table(Path(import_table_path)):
+            if screened_record.get(Fields.ID, "") not in records:
+                continue
+            record_dict = records[screened_record.get(Fields.ID, "")]
+            record = colrev.record.record.Record(record_dict)
+            previous_decision = (
+                record.data[Fields.STATUS],
+                record.data.get(Fields.SCREENING_CRITERIA, ""),
+            )
+            if "screen_inclusion" in screened_record:
+                if screened_record["screen_inclusion"] == "in":
+                    record.set_status(RecordState.rev_included)
+                elif screened_record["screen_inclusion"] == "out":
+                    record.set_status(RecordState.rev_excluded)
+                else:
+                    print(
+                        f"Invalid choice: {screened_record['screen_inclusion']} "
+                        f"({screened_record['ID']})"
+                    )
+            else:
                 screening_criteria_field = ""
                 for screening_criterion in screening_criteria.keys():
                     assert screened_record[screening_criterion] in ["in", "out"]
@@ -200,7 +188,13 @@ class TableScreen:
                 else:
                     record.set_status(RecordState.rev_included)
 
-        self.review_manager.dataset.save_records_dict(records)
+            if previous_decision != (
+                record.data[Fields.STATUS],
+                record.data.get(Fields.SCREENING_CRITERIA, ""),
+            ):
+                changed_records[record.data[Fields.ID]] = record.get_data()
+
+        self.review_manager.dataset.save_records_dict(changed_records, partial=True)
 
     def run_screen(self, records: dict, split: list) -> dict:
         """Screen records based on screening tables"""
@@ -2,6 +2,13 @@
 """Screening utilities"""
 from __future__ import annotations
 
+import csv
+import typing
+from pathlib import Path
+
+import openpyxl
+import pandas as pd
+
 import colrev.package_manager.package_manager
 import colrev.record.record
 import colrev.settings
@@ -71,3 +78,73 @@ def get_screening_criteria_from_user_input(
         screen_operation.set_screening_criteria(screening_criteria)
 
     return screening_criteria
+
+
+# Metadata fields of the (pre)screening tables
+TABLE_FIELDS = [
+    Fields.ID,
+    Fields.AUTHOR,
+    Fields.TITLE,
+    Fields.JOURNAL,
+    Fields.BOOKTITLE,
+    Fields.YEAR,
+    Fields.VOLUME,
+    Fields.NUMBER,
+    Fields.PAGES,
+    Fields.DOI,
+    Fields.ABSTRACT,
+]
+
+
+def get_table_row(record_dict: dict) -> dict:
+    """Get the metadata fields of a record (row of a (pre)screening table)"""
+    return {field: record_dict.get(field, "") for field in TABLE_FIELDS}
+
+
+def write_table(
+    rows: typing.Iterable[dict], *, path: Path, fieldnames: typing.List[str]
+) -> None:
+    """Write the rows of a (pre)screening table (csv or xlsx, row by row)"""
+
+    if path.suffix == ".xlsx":
+        workbook = openpyxl.Workbook(write_only=True)
+        sheet = workbook.create_sheet("screen")
+        sheet.append(fieldnames)
+        for row in rows:
+            sheet.append([row.get(fieldname, "") for fieldname in fieldnames])
+        workbook.save(path)
+        return
+
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        writer = csv.DictWriter(
+            file, fieldnames=fieldnames, quoting=csv.QUOTE_ALL, lineterminator="\n"
+        )
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def read_table(path: Path) -> typing.Iterator[dict]:
+    """Read the rows of a (pre)screening table (csv or xlsx, row by row)
+
+    Empty cells are returned as empty strings."""
+
+    if path.suffix == ".csv":
+        # utf-8-sig: tables saved by Excel start with a byte order mark
+        with open(path, encoding="utf-8-sig", newline="") as file:
+            yield from csv.DictReader(file, restval="")
+    elif path.suffix == ".xlsx":
+        workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            header = [str(value) for value in next(rows, ())]
+            for values in rows:
+                yield {
+                    fieldname: "" if value is None else str(value)
+                    for fieldname, value in zip(header, values)
+                }
+        finally:
+            workbook.close()
+    elif path.suffix == ".xls":
+        yield from pd.read_excel(path, dtype=str).fillna("").to_dict("records")
+    else:
+        raise ValueError(f"Unsupported file format: {path}")
@@ -13,6 +13,7 @@ import requests
 import zope.interface
 from pydantic import Field
 
+import colrev.env.language_service
 import colrev.exceptions as colrev_exceptions
 import colrev.package_manager.interfaces
 import colrev.package_manager.package_manager
@@ -42,9 +42,7 @@ class WebsiteScreenshot:
         self.settings = self.settings_class(**settings)
         self.review_manager = pdf_get_operation.review_manager
         self.pdf_get_operation = pdf_get_operation
-        colrev.env.docker_manager.DockerManager.build_docker_image(
-            imagename=self.CHROME_BROWSERLESS_IMAGE
-        )
+        # The Docker image is provisioned when the screenshot service is started
         pdf_get_operation.docker_images_to_stop.append(self.CHROME_BROWSERLESS_IMAGE)
 
     def _start_screenshot_service(self) -> None:
@@ -53,8 +51,15 @@ class WebsiteScreenshot:
         # pylint: disable=duplicate-code
 
         if self.screenshot_service_available():
+            # The container may be left from an earlier run (stop it in conclude)
+            colrev.env.docker_manager.DockerManager.mark_provisioned(
+                self.CHROME_BROWSERLESS_IMAGE
+            )
             return
 
+        colrev.env.docker_manager.DockerManager.build_docker_image(
+            imagename=self.CHROME_BROWSERLESS_IMAGE
+        )
         self.review_manager.environment_manager.register_ports(["3000"])
 
         try:
@@ -26,6 +26,11 @@ class PathManager:
     REPORT_FILE = Path(".report.log")
     GIT_IGNORE_FILE = Path(".gitignore")
     PRE_COMMIT_CONFIG = Path(".pre-commit-config.yaml")
+    # Local (git-ignored) caches
+    CACHE_DIR = Path(".colrev")
+    APPEND_ONLY_DIGESTS_FILE = CACHE_DIR / Path("append_only_digests.json")
+    QM_MEMO_FILE = CACHE_DIR / Path("qm_memo.json")
+    STATUS_ANALYTICS_FILE = CACHE_DIR / Path("status_analytics.json")
 
     # Ensure the path uses forward slashes, which is compatible with Git's path handling
     RECORDS_FILE_GIT = str(RECORDS_FILE).replace("\\", "/")
@@ -49,3 +54,7 @@ class PathManager:
         self.report = base_path / self.REPORT_FILE
         self.git_ignore = base_path / self.GIT_IGNORE_FILE
         self.pre_commit_config = base_path / self.PRE_COMMIT_CONFIG
+        self.cache = base_path / self.CACHE_DIR
+        self.append_only_digests = base_path / self.APPEND_ONLY_DIGESTS_FILE
+        self.qm_memo = base_path / self.QM_MEMO_FILE
+        self.status_analytics = base_path / self.STATUS_ANALYTICS_FILE
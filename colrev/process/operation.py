@@ -4,9 +4,7 @@ from __future__ import annotations
 
 import typing
 
-import docker
 import git
-from docker.errors import DockerException
 
 import colrev.exceptions as colrev_exceptions
 from colrev.constants import OperationsType
@@ -47,8 +45,17 @@ class Operation:
 
         def decorator_func(func: F) -> typing.Callable:
             def wrapper_func(self, *args, **kwargs) -> typing.Any:  # type: ignore
+                dataset = self.review_manager.dataset
+                index_writes = dataset.index_writes
                 # Invoke the wrapped function
-                retval = func(self, *args, **kwargs)
+                # (index updates are written at once, not once per file)
+                with dataset.batched_index_updates():
+                    retval = func(self, *args, **kwargs)
+                self.review_manager.logger.debug(
+                    "Index writes (%s): %s",
+                    self.type,
+                    dataset.index_writes - index_writes,
+                )
                 # Conclude the operation
                 self.conclude()
                 if self.review_manager.in_ci_environment():
@@ -61,6 +68,21 @@ class Operation:
 
     def conclude(self) -> None:  # pragma: no cover
         """Conclude the operation (stop Docker containers)"""
+        if not self.docker_images_to_stop:
+            return
+
+        # pylint: disable=import-outside-toplevel
+        import docker
+        from docker.errors import DockerException
+
+        import colrev.env.docker_manager
+
+        # Only containers of images provisioned in this process may be running
+        if not any(
+            colrev.env.docker_manager.DockerManager.is_provisioned(image)
+            for image in self.docker_images_to_stop
+        ):
+            return
         try:
             client = docker.from_env()
             for container in client.containers.list():
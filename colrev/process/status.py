@@ -421,6 +421,15 @@ class StatusStats(BaseModel):
 
     origin_states_dict: dict
 
+    def get_status_file_dict(self) -> dict:
+        """Get the statistics that are saved in the STATUS_FILE"""
+        exported_dict = self.model_dump()
+        exported_dict.pop("origin_states_dict")
+        exported_dict.pop("perc_curated")
+        exported_dict.pop("screening_statistics")
+        exported_dict.pop("nr_origins")
+        return exported_dict
+
     def get_active_metadata_operation_info(self) -> str:
         """Get active metadata operation info (convenience function for status printing)"""
         infos = []
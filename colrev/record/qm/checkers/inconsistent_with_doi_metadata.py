@@ -45,7 +45,19 @@ class InconsistentWithDOIMetadataChecker:
         if "md_curated.bib" in record.get_field_provenance_source(Fields.DOI):
             return
 
-        if self._doi_metadata_conflicts(record=record):
+        snapshot = self.quality_model.snapshot
+        if snapshot is not None:
+            if record.data[Fields.DOI] not in snapshot.doi_metadata:
+                snapshot.defer(record)
+                return
+            doi_metadata = snapshot.doi_metadata[record.data[Fields.DOI]]
+            conflicts = doi_metadata is not None and self._conflicts(
+                record=record, doi_metadata=doi_metadata
+            )
+        else:
+            conflicts = self._doi_metadata_conflicts(record=record)
+
+        if conflicts:
             record.add_field_provenance_note(key=Fields.DOI, note=self.msg)
         else:
             record.remove_field_provenance_note(key=Fields.DOI, note=self.msg)
@@ -55,31 +67,32 @@ class InconsistentWithDOIMetadataChecker:
 
         try:
             crossref_md = self.crossref_api.query_doi(doi=record_copy.data[Fields.DOI])
-
-            for key in crossref_md.data.keys():
-                if key not in self._fields_to_check:
-                    continue
-                if key not in record.data:
-                    continue
-                if record.data[key] == FieldValues.UNKNOWN:
-                    continue
-                if key not in [Fields.AUTHOR, Fields.TITLE, Fields.JOURNAL]:
-                    continue
-                if len(crossref_md.data[key]) < 5 or len(record.data[key]) < 5:
-                    continue
-                if (
-                    fuzz.partial_ratio(
-                        record.data[key].lower(), crossref_md.data[key].lower()
-                    )
-                    < 60
-                ):
-                    return True
-
         except (
             colrev_exceptions.RecordNotFoundInPrepSourceException,
             colrev_exceptions.RecordNotParsableException,
         ):
             return False
+        return self._conflicts(record=record, doi_metadata=crossref_md.data)
+
+    def _conflicts(
+        self, *, record: colrev.record.record.Record, doi_metadata: dict
+    ) -> bool:
+        for key in doi_metadata.keys():
+            if key not in self._fields_to_check:
+                continue
+            if key not in record.data:
+                continue
+            if record.data[key] == FieldValues.UNKNOWN:
+                continue
+            if key not in [Fields.AUTHOR, Fields.TITLE, Fields.JOURNAL]:
+                continue
+            if len(doi_metadata[key]) < 5 or len(record.data[key]) < 5:
+                continue
+            if (
+                fuzz.partial_ratio(record.data[key].lower(), doi_metadata[key].lower())
+                < 60
+            ):
+                return True
         return False
 
 
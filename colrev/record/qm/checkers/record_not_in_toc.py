@@ -5,6 +5,8 @@ from __future__ import annotations
 import colrev.env.local_index
 import colrev.exceptions as colrev_exceptions
 import colrev.record.qm.quality_model
+import colrev.record.qm.quality_model_snapshot
+import colrev.record.record_similarity
 from colrev.constants import DefectCodes
 from colrev.constants import ENTRYTYPES
 from colrev.constants import Fields
@@ -46,6 +48,11 @@ class RecordNotInTOCChecker:
 
     def _is_in_toc(self, record: colrev.record.record.Record) -> bool:
 
+        if self.quality_model.snapshot is not None:
+            return self._is_in_toc_snapshot(
+                record, snapshot=self.quality_model.snapshot
+            )
+
         try:
             self.quality_model.local_index_lock.acquire(timeout=60)
             # Search within the table-of-content in local_index
@@ -63,6 +70,35 @@ class RecordNotInTOCChecker:
                 pass
         return True
 
+    def _is_in_toc_snapshot(
+        self,
+        record: colrev.record.record.Record,
+        *,
+        snapshot: colrev.record.qm.quality_model_snapshot.QualityModelSnapshot,
+    ) -> bool:
+        try:
+            toc_key = record.get_toc_key()
+        except colrev_exceptions.NotTOCIdentifiableException:
+            return True
+        if toc_key not in snapshot.toc_records:
+            snapshot.defer(record)
+            return True
+        toc_records = snapshot.toc_records[toc_key]
+        if toc_records is None:
+            return True
+        try:
+            return any(
+                colrev.record.record_similarity.matches(
+                    record, colrev.record.record.Record(toc_record_dict)
+                )
+                for toc_record_dict in toc_records
+            )
+        except (
+            colrev_exceptions.NotEnoughDataToIdentifyException,
+            colrev_exceptions.NotTOCIdentifiableException,
+        ):
+            return True
+
 
 def register(quality_model: colrev.record.qm.quality_model.QualityModel) -> None:
     """Register the checker"""
@@ -2,14 +2,77 @@
 """Quality model for records."""
 from __future__ import annotations
 
+import hashlib
 import importlib
 import typing
+from copy import deepcopy
 from multiprocessing import Lock
 from pathlib import Path
 
 import colrev.record.qm.checkers
+import colrev.record.qm.quality_model_memo
 import colrev.record.record
+from colrev.constants import DefectCodes
 from colrev.constants import Fields
+from colrev.constants import Filepaths
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import colrev.record.qm.quality_model_snapshot
+
+# Register functions of the checkers (discovered once per process),
+# keyed by pdf_mode
+_CHECKER_REGISTRY: typing.Dict[bool, typing.List[typing.Callable]] = {}
+# Versions of the checker sets (hash of the checker modules), keyed by pdf_mode
+_CHECKER_VERSIONS: typing.Dict[bool, str] = {}
+# Checkers that depend on external data without a version (not memoized)
+_NON_MEMOIZED_DEFECTS = [DefectCodes.INCONSISTENT_WITH_DOI_METADATA]
+
+
+def _get_checker_register_functions(*, pdf_mode: bool) -> typing.List[typing.Callable]:
+    """Discover the checkers in the checker directory, looking for a
+    'register' function in each one.
+    """
+
+    if pdf_mode in _CHECKER_REGISTRY:
+        return _CHECKER_REGISTRY[pdf_mode]
+
+    if pdf_mode:
+        module_path = "colrev.record.qm.pdf_checkers."
+        checker_path = Path(__file__).parent / Path("pdf_checkers/")
+    else:
+        module_path = "colrev.record.qm.checkers."
+        checker_path = Path(__file__).parent / Path("checkers")
+
+    register_functions = []
+    checker_hash = hashlib.sha256()
+    for filename in sorted(checker_path.glob("*.py")):
+        if "__init__" in str(filename):
+            continue
+        checker_hash.update(filename.read_bytes())
+
+        try:
+            module = importlib.import_module(module_path + filename.stem)
+        except ValueError as exc:  # pragma: no cover
+            print(f"Problem with filepath for module import {filename}: {exc}")
+        except ImportError as exc:  # pragma: no cover
+            print(f"Problem importing module {filename}: {exc}")
+        else:
+            if hasattr(module, "register"):
+                register_functions.append(module.register)
+            else:  # pragma: no cover
+                print(f"Module {filename} does not have a register function")
+
+    _CHECKER_REGISTRY[pdf_mode] = register_functions
+    _CHECKER_VERSIONS[pdf_mode] = checker_hash.hexdigest()
+    return register_functions
+
+
+def _get_local_index_version() -> str:
+    """Get the version of the local index (TOCs), based on the sqlite file"""
+    if not Filepaths.LOCAL_INDEX_SQLITE_FILE.is_file():
+        return "no-local-index"
+    stat = Filepaths.LOCAL_INDEX_SQLITE_FILE.stat()
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
 
 
 class QualityModel:
@@ -23,44 +86,87 @@ class QualityModel:
         defects_to_ignore: list[str],
         pdf_mode: bool = False,
         path: typing.Optional[Path] = None,
+        memo_path: typing.Optional[Path] = None,
     ) -> None:
         self.pdf_mode = pdf_mode
         self.defects_to_ignore = defects_to_ignore
         self._register_checkers()
         self.local_index_lock = Lock()
         self.path = path
+        # Results of the (non-pdf) checkers are memoized for the checker set,
+        # the defects_to_ignore, and the local index (TOCs) (if a memo_path is set)
+        self.memo: typing.Optional[
+            colrev.record.qm.quality_model_memo.QualityModelMemo
+        ] = None
+        if not pdf_mode and memo_path is not None:
+            version = [_CHECKER_VERSIONS[pdf_mode]] + sorted(defects_to_ignore)
+            if DefectCodes.RECORD_NOT_IN_TOC not in defects_to_ignore:
+                version.append(_get_local_index_version())
+            self.memo = colrev.record.qm.quality_model_memo.QualityModelMemo(
+                version="|".join(version),
+                memo_path=memo_path,
+            )
+        # Offline mode: checkers read DOI metadata and TOCs from the snapshot
+        self.snapshot: typing.Optional[
+            colrev.record.qm.quality_model_snapshot.QualityModelSnapshot
+        ] = None
+
+    def save_memo(self) -> None:
+        """Save the memoized results of the checkers (if a memo_path is set)"""
+        if self.memo:
+            self.memo.save()
+
+    def prefetch(self, records: typing.Iterable[dict]) -> None:
+        """Prefetch the DOI metadata and TOCs of the records (activates the snapshot)
+
+        TOCs are only fetched for records that are not in the memo
+        (the DOI-metadata checker is not memoized).
+        Records whose data is not in the snapshot are deferred
+        and checked in run_deferred()."""
+        if self.pdf_mode:
+            return
+        if self.snapshot is None:
+            # pylint: disable=import-outside-toplevel
+            import colrev.record.qm.quality_model_snapshot
+
+            self.snapshot = (
+                colrev.record.qm.quality_model_snapshot.QualityModelSnapshot(
+                    doi_metadata=DefectCodes.INCONSISTENT_WITH_DOI_METADATA
+                    not in self.defects_to_ignore,
+                    tocs=DefectCodes.RECORD_NOT_IN_TOC not in self.defects_to_ignore,
+                )
+            )
+        records = list(records)
+        self.snapshot.prefetch_doi_metadata(records)
+        self.snapshot.prefetch_tocs(
+            record_dict
+            for record_dict in records
+            if not self.memo or not self.memo.contains(self.memo.get_key(record_dict))
+        )
+
+    def run_deferred(self, *, set_prepared: bool = False) -> None:
+        """Run the checkers for the deferred records (after prefetching their data)"""
+        if self.snapshot is None:
+            return
+        deferred = self.snapshot.pop_deferred()
+        if not deferred:
+            return
+        self.snapshot.prefetch(deferred)
+        for record_dict in deferred:
+            colrev.record.record.Record(record_dict).run_quality_model(
+                self, set_prepared=set_prepared
+            )
+
+    def reset_snapshot(self) -> None:
+        """Reset the snapshot (checkers query DOI metadata and TOCs directly)"""
+        self.snapshot = None
 
     def _register_checkers(self) -> None:
-        """Register checkers from the checker directory, looking for a
-        'register' function in each one.
-        """
+        """Register the checkers (discovered once per process)"""
 
         self.checkers = []
-        if self.pdf_mode:
-            module_path = "colrev.record.qm.pdf_checkers."
-        else:
-            module_path = "colrev.record.qm.checkers."
-
-        if self.pdf_mode:
-            checker_path = Path(__file__).parent / Path("pdf_checkers/")
-        else:
-            checker_path = Path(__file__).parent / Path("checkers")
-
-        for filename in checker_path.glob("*.py"):
-            if "__init__" in str(filename):
-                continue
-
-            try:
-                module = importlib.import_module(module_path + filename.stem)
-            except ValueError as exc:  # pragma: no cover
-                print(f"Problem with filepath for module import {filename}: {exc}")
-            except ImportError as exc:  # pragma: no cover
-                print(f"Problem importing module {filename}: {exc}")
-            else:
-                if hasattr(module, "register"):
-                    module.register(self)
-                else:  # pragma: no cover
-                    print(f"Module {filename} does not have a register function")
+        for register in _get_checker_register_functions(pdf_mode=self.pdf_mode):
+            register(self)
 
     def register_checker(self, checker) -> None:  # type: ignore
         """Register a checker"""
@@ -86,11 +192,46 @@ class QualityModel:
                 record = colrev.record.record_pdf.PDFRecord(record.data, path=self.path)
                 record.set_text_from_pdf()
 
-        for checker in self.checkers:
-            if checker.msg in self.defects_to_ignore:
-                continue
-            checker.run(record=record)
+        if self.memo:
+            self._run_memoized(record=record)
+        else:
+            for checker in self.checkers:
+                if checker.msg in self.defects_to_ignore:
+                    continue
+                checker.run(record=record)
 
         if self.pdf_mode:
             record.data.pop(Fields.TEXT_FROM_PDF, None)
             record.data.pop(Fields.NR_PAGES_IN_FILE, None)
+
+    def _run_memoized(self, *, record: colrev.record.record.Record) -> None:
+        """Run the checkers, using the memo for the checkers that do not
+        depend on external data without a version"""
+        assert self.memo is not None
+
+        memo_key = self.memo.get_key(record.data)
+        if not self.memo.apply(key=memo_key, record_dict=record.data):
+            original_record_dict = deepcopy(record.data)
+            for checker in self.checkers:
+                if (
+                    checker.msg in self.defects_to_ignore
+                    or checker.msg in _NON_MEMOIZED_DEFECTS
+                ):
+                    continue
+                checker.run(record=record)
+            if not (self.snapshot and self.snapshot.is_deferred(record)):
+                self.memo.add(
+                    key=memo_key,
+                    original_record_dict=original_record_dict,
+                    record_dict=record.data,
+                )
+
+        # Note: the non-memoized checkers only change their own defect codes
+        # and skip missing fields (the order of the checkers does not matter)
+        for checker in self.checkers:
+            if (
+                checker.msg in self.defects_to_ignore
+                or checker.msg not in _NON_MEMOIZED_DEFECTS
+            ):
+                continue
+            checker.run(record=record)
@@ -0,0 +1,170 @@
+#! /usr/bin/env python
+"""Memo of quality-model results (to skip the checkers for unchanged records)."""
+from __future__ import annotations
+
+import hashlib
+import json
+import typing
+from collections import OrderedDict
+from multiprocessing import Lock
+from pathlib import Path
+
+from colrev.constants import Fields
+from colrev.constants import FieldValues
+
+# Fields that are read by the (memoized) checkers
+CHECKED_FIELDS = {
+    Fields.ENTRYTYPE,
+    Fields.TITLE,
+    Fields.AUTHOR,
+    Fields.EDITOR,
+    Fields.YEAR,
+    Fields.JOURNAL,
+    Fields.BOOKTITLE,
+    Fields.CHAPTER,
+    Fields.PUBLISHER,
+    Fields.SCHOOL,
+    Fields.INSTITUTION,
+    Fields.VOLUME,
+    Fields.NUMBER,
+    "issue",
+    Fields.PAGES,
+    Fields.DOI,
+    Fields.ISBN,
+    Fields.PUBMED_ID,
+    Fields.URL,
+    Fields.LANGUAGE,
+    Fields.ABSTRACT,
+}
+
+
+class QualityModelMemo:
+    """Memo of quality-model results
+
+    Keys are hashes of the checked fields (values and provenance) before the
+    checkers run. For other fields, only the provenance notes are considered
+    (checkers may remove their defect codes). Values are the changes of the
+    checked fields and the provenance resulting from the checkers."""
+
+    MAX_ENTRIES = 200000
+
+    def __init__(self, *, version: str, memo_path: typing.Optional[Path] = None):
+        self.version = version
+        self.memo_path = memo_path
+        self._lock = Lock()
+        self._entries: typing.OrderedDict[str, str] = self._load()
+
+    def _load(self) -> typing.OrderedDict[str, str]:
+        if self.memo_path is None or not self.memo_path.is_file():
+            return OrderedDict()
+        try:
+            with open(self.memo_path, encoding="utf-8") as file:
+                memo = json.load(file)
+        except json.JSONDecodeError:
+            return OrderedDict()
+        if memo.get("version") != self.version:
+            return OrderedDict()
+        return OrderedDict(memo.get("entries", {}))
+
+    def save(self) -> None:
+        """Save the memo (if a memo_path is set)"""
+        if self.memo_path is None:
+            return
+        with self._lock:
+            memo = {"version": self.version, "entries": dict(self._entries)}
+        self.memo_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.memo_path, "w", encoding="utf-8") as file:
+            json.dump(memo, file)
+
+    @classmethod
+    def _get_checked_data(cls, record_dict: dict) -> dict:
+        checked_data: dict = {
+            "fields": {
+                field: value
+                for field, value in record_dict.items()
+                if field in CHECKED_FIELDS
+            }
+        }
+        for prov_field in [Fields.MD_PROV, Fields.D_PROV]:
+            if prov_field not in record_dict:
+                continue
+            checked_data[prov_field] = {
+                field: (
+                    provenance
+                    if field in CHECKED_FIELDS or field == FieldValues.CURATED
+                    else {"note": provenance.get("note", "")}
+                )
+                for field, provenance in record_dict[prov_field].items()
+                if field in CHECKED_FIELDS
+                or field == FieldValues.CURATED
+                or provenance.get("note", "")
+            }
+        return checked_data
+
+    @classmethod
+    def get_key(cls, record_dict: dict) -> str:
+        """Get the key of the record data (checked fields and provenance notes)"""
+        checked_data = cls._get_checked_data(record_dict)
+        # Checkers may remove notes of fields (depending on whether the field exists)
+        checked_data["noted_fields"] = sorted(
+            field
+            for prov_field in [Fields.MD_PROV, Fields.D_PROV]
+            for field in checked_data.get(prov_field, {})
+            if field in record_dict
+        )
+        content = json.dumps(checked_data, sort_keys=True, default=str)
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def contains(self, key: str) -> bool:
+        """Check whether the memo has results for the key"""
+        with self._lock:
+            return key in self._entries
+
+    def apply(self, *, key: str, record_dict: dict) -> bool:
+        """Apply the memoized changes to the record data (returns False if unknown)"""
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._entries.move_to_end(key)
+            changes = json.loads(self._entries[key])
+        record_dict.update(changes["fields"]["updated"])
+        for field in changes["fields"]["removed"]:
+            record_dict.pop(field, None)
+        for prov_field in [Fields.MD_PROV, Fields.D_PROV]:
+            if prov_field not in changes:
+                continue
+            provenance = record_dict.setdefault(prov_field, {})
+            for field, field_provenance in changes[prov_field]["updated"].items():
+                provenance.setdefault(field, {"source": "ORIGINAL", "note": ""})
+                provenance[field].update(field_provenance)
+            for field in changes[prov_field]["removed"]:
+                provenance.pop(field, None)
+        return True
+
+    @classmethod
+    def _get_changes(cls, original: dict, updated: dict) -> dict:
+        return {
+            "updated": {
+                field: value
+                for field, value in updated.items()
+                if field not in original or original[field] != value
+            },
+            "removed": [field for field in original if field not in updated],
+        }
+
+    def add(self, *, key: str, original_record_dict: dict, record_dict: dict) -> None:
+        """Add the changes of the checked fields and the provenance"""
+        original = self._get_checked_data(original_record_dict)
+        updated = self._get_checked_data(record_dict)
+        changes = {
+            field: self._get_changes(original.get(field, {}), updated_data)
+            for field, updated_data in updated.items()
+        }
+        try:
+            changes_str = json.dumps(changes)
+        except TypeError:
+            return
+        with self._lock:
+            self._entries[key] = changes_str
+            while len(self._entries) > self.MAX_ENTRIES:
+                self._entries.popitem(last=False)
@@ -0,0 +1,107 @@
+#! /usr/bin/env python
+"""Snapshot of the external data used by the quality model (DOI metadata and TOCs)."""
+from __future__ import annotations
+
+import typing
+from multiprocessing import Lock
+from multiprocessing.pool import ThreadPool as Pool
+
+import colrev.env.local_index
+import colrev.exceptions as colrev_exceptions
+import colrev.record.record
+from colrev.constants import Fields
+from colrev.packages.crossref.src import crossref_api
+
+
+class QualityModelSnapshot:
+    """Pre-fetched DOI metadata and TOC records
+
+    Checkers read from the snapshot (instead of querying Crossref
+    or the local index for each record) and defer records whose data
+    is not in the snapshot."""
+
+    NR_PARALLEL_REQUESTS = 10
+
+    def __init__(self, *, doi_metadata: bool = True, tocs: bool = True) -> None:
+        self._prefetch_doi_metadata = doi_metadata
+        self._prefetch_tocs = tocs
+        # None: not available (not found in Crossref / TOC not in the local index)
+        self.doi_metadata: typing.Dict[str, typing.Optional[dict]] = {}
+        self.toc_records: typing.Dict[str, typing.Optional[typing.List[dict]]] = {}
+        self._deferred: typing.Dict[int, dict] = {}
+        self._lock = Lock()
+
+    @classmethod
+    def get_toc_key(cls, record_dict: dict) -> str:
+        """Get the toc key of the record (empty if it is not TOC-identifiable)"""
+        try:
+            return colrev.record.record.Record(record_dict).get_toc_key()
+        except colrev_exceptions.NotTOCIdentifiableException:
+            return ""
+
+    @classmethod
+    def _fetch_doi_metadata(cls, doi: str) -> typing.Optional[dict]:
+        api = crossref_api.CrossrefAPI(params={})
+        try:
+            return api.query_doi(doi=doi).data
+        except (
+            colrev_exceptions.RecordNotFoundInPrepSourceException,
+            colrev_exceptions.RecordNotParsableException,
+        ):
+            return None
+
+    def prefetch(self, records: typing.Iterable[dict]) -> None:
+        """Fetch the DOI metadata and TOC records of the records (in bulk)"""
+        records = list(records)
+        self.prefetch_doi_metadata(records)
+        self.prefetch_tocs(records)
+
+    def prefetch_doi_metadata(self, records: typing.Iterable[dict]) -> None:
+        """Fetch the DOI metadata of the records (in parallel)"""
+        if not self._prefetch_doi_metadata:
+            return
+        dois = list(
+            {
+                record_dict[Fields.DOI]
+                for record_dict in records
+                if Fields.DOI in record_dict
+            }
+            - self.doi_metadata.keys()
+        )
+        if dois:
+            with Pool(self.NR_PARALLEL_REQUESTS) as pool:
+                doi_metadata = pool.map(self._fetch_doi_metadata, dois)
+            self.doi_metadata.update(zip(dois, doi_metadata))
+
+    def prefetch_tocs(self, records: typing.Iterable[dict]) -> None:
+        """Fetch the TOC records of the records (from the local index)"""
+        if not self._prefetch_tocs:
+            return
+        toc_keys = {
+            self.get_toc_key(record_dict) for record_dict in records
+        } - self.toc_records.keys()
+        toc_keys.discard("")
+        if toc_keys:
+            local_index = colrev.env.local_index.LocalIndex(verbose_mode=False)
+            for toc_key in toc_keys:
+                try:
+                    self.toc_records[toc_key] = local_index.get_toc_records(toc_key)
+                except colrev_exceptions.RecordNotInIndexException:
+                    self.toc_records[toc_key] = None
+
+    def defer(self, record: colrev.record.record.Record) -> None:
+        """Defer the record (data not in the snapshot)"""
+        with self._lock:
+            self._deferred[id(record.data)] = record.data
+
+    def is_deferred(self, record: colrev.record.record.Record) -> bool:
+        """Check whether the record was deferred"""
+        with self._lock:
+            return id(record.data) in self._deferred
+
+    def pop_deferred(self) -> typing.List[dict]:
+        """Get (and reset) the deferred records"""
+        with self._lock:
+            deferred = list(self._deferred.values())
+            self._deferred = {}
+        return deferred
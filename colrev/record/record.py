@@ -7,12 +7,9 @@ import typing
 from copy import deepcopy
 from pathlib import Path
 
-import dictdiffer
-
 import colrev.exceptions as colrev_exceptions
 import colrev.record.record_identifier
 import colrev.record.record_merger
-import colrev.record.record_similarity
 from colrev.constants import Colors
 from colrev.constants import DefectCodes
 from colrev.constants import ENTRYTYPES
@@ -807,6 +804,8 @@ class Record:
     ) -> list:
         """Get diff between record objects"""
 
+        import dictdiffer  # pylint: disable=import-outside-toplevel
+
         if not identifying_fields_only:
             return list(dictdiffer.diff(self.get_data(), other_record.get_data()))
 
@@ -841,6 +840,7 @@ class Record:
         fields are missing. For example, if the journal field is missing in both
         records, get_similarity will return a value > 1.0. The get_record_changes
         will return 0.0 (if all other fields are equal)."""
+        import colrev.record.record_similarity  # pylint: disable=import-outside-toplevel
 
         return colrev.record.record_similarity.get_record_change_score(
             record_a, record_b
@@ -849,6 +849,7 @@ class Record:
     @classmethod
     def get_record_similarity(cls, record_a: Record, record_b: Record) -> float:
         """Determine the similarity between two records (their masterdata)"""
+        import colrev.record.record_similarity  # pylint: disable=import-outside-toplevel
 
         return colrev.record.record_similarity.get_record_similarity(record_a, record_b)
 
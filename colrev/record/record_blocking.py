@@ -0,0 +1,254 @@
+#! /usr/bin/env python
+"""Blocking index to retrieve candidate records for similarity comparisons."""
+from __future__ import annotations
+
+import collections
+import re
+import typing
+from importlib.metadata import version
+from itertools import combinations
+
+import bib_dedupe.block
+import pandas as pd
+from bib_dedupe.constants.fields import DOI
+from bib_dedupe.constants.fields import PAGES
+from bib_dedupe.constants.fields import SEARCH_SET
+from bib_dedupe.constants.fields import TITLE_SHORT
+
+import colrev.env.utils
+import colrev.record.record
+import colrev.record.record_similarity
+from colrev.constants import Fields
+from colrev.constants import FieldValues
+
+_TITLE_STOPWORDS = {
+    "and",
+    "are",
+    "for",
+    "from",
+    "how",
+    "into",
+    "its",
+    "not",
+    "of",
+    "on",
+    "the",
+    "their",
+    "through",
+    "towards",
+    "what",
+    "when",
+    "with",
+}
+
+
+def get_title_tokens(title: str) -> typing.Set[str]:
+    """Get the normalized tokens of a title (used as blocking keys)"""
+    if not title or title == FieldValues.UNKNOWN:
+        return set()
+    title = colrev.env.utils.remove_accents(str(title).lower())
+    return {
+        token
+        for token in re.split(r"[^a-z0-9]+", title)
+        if len(token) > 2 and token not in _TITLE_STOPWORDS
+    }
+
+
+def get_first_author(record_dict: dict) -> str:
+    """Get the normalized last name of the first author (used as a blocking key)"""
+    author = str(record_dict.get(Fields.AUTHOR, ""))
+    if not author or author == FieldValues.UNKNOWN:
+        return ""
+    first_author = author.split(" and ", maxsplit=1)[0]
+    if "," in first_author:
+        last_name = first_author.split(",")[0]
+    else:
+        last_name = first_author.split(" ")[-1]
+    last_name = colrev.env.utils.remove_accents(last_name.lower())
+    return re.sub(r"[^a-z]", "", last_name)
+
+
+def _get_year(record_dict: dict) -> typing.Optional[int]:
+    year = str(record_dict.get(Fields.YEAR, ""))[:4]
+    if year.isdigit():
+        return int(year)
+    return None
+
+
+class BlockingIndex:
+    """Index of records (inverted index of title tokens and first authors, year buckets)
+
+    Candidates for a record are the indexed records that share title tokens
+    (or the first author) and whose year differs by at most one year.
+    The similarity data of each indexed record is computed once."""
+
+    def __init__(
+        self, records: typing.Iterable[dict], *, max_candidates: int = 20
+    ) -> None:
+        self.max_candidates = max_candidates
+        self._records: typing.Dict[str, dict] = {}
+        self._similarity_data: typing.Dict[str, dict] = {}
+        self._years: typing.Dict[str, typing.Optional[int]] = {}
+        self._title_index: typing.Dict[str, typing.Set[str]] = collections.defaultdict(
+            set
+        )
+        self._author_index: typing.Dict[str, typing.Set[str]] = collections.defaultdict(
+            set
+        )
+        for record_dict in records:
+            self.add(record_dict)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def add(self, record_dict: dict) -> None:
+        """Add a record to the index"""
+        record_id = record_dict[Fields.ID]
+        self._records[record_id] = record_dict
+        self._years[record_id] = _get_year(record_dict)
+        for token in get_title_tokens(record_dict.get(Fields.TITLE, "")):
+            self._title_index[token].add(record_id)
+        first_author = get_first_author(record_dict)
+        if first_author:
+            self._author_index[first_author].add(record_id)
+
+    def _get_similarity_data(self, record_id: str) -> dict:
+        if record_id not in self._similarity_data:
+            self._similarity_data[record_id] = (
+                colrev.record.record_similarity.get_similarity_data(
+                    colrev.record.record.Record(self._records[record_id])
+                )
+            )
+        return self._similarity_data[record_id]
+
+    def get_candidates(self, record_dict: dict) -> typing.List[dict]:
+        """Get the candidate records (most shared blocking keys first)"""
+
+        shared_keys: typing.Counter[str] = collections.Counter()
+        for token in get_title_tokens(record_dict.get(Fields.TITLE, "")):
+            shared_keys.update(self._title_index.get(token, set()))
+        first_author = get_first_author(record_dict)
+        if first_author:
+            shared_keys.update(self._author_index.get(first_author, set()))
+
+        year = _get_year(record_dict)
+        candidate_ids = [
+            record_id
+            for record_id, _ in shared_keys.most_common()
+            if year is None
+            or self._years[record_id] is None
+            or abs(year - self._years[record_id]) <= 1  # type: ignore
+        ]
+        return [
+            self._records[record_id]
+            for record_id in candidate_ids[: self.max_candidates]
+        ]
+
+    def get_most_similar(
+        self, record_dict: dict
+    ) -> typing.Tuple[typing.Optional[dict], float]:
+        """Get the most similar record (and its similarity) among the candidates"""
+
+        similarity_data = colrev.record.record_similarity.get_similarity_data(
+            colrev.record.record.Record(record_dict)
+        )
+        max_similarity = 0.0
+        max_sim_record = None
+        for candidate in self.get_candidates(record_dict):
+            similarity = colrev.record.record_similarity.get_similarity(
+                similarity_data, self._get_similarity_data(candidate[Fields.ID])
+            )
+            if similarity > max_similarity:
+                max_similarity = similarity
+                max_sim_record = candidate
+        return max_sim_record, max_similarity
+
+
+# Search set of records that were already deduplicated
+OLD_SEARCH = "old_search"
+
+# bib_dedupe version whose block() is applied incrementally in block_new_records()
+# (other versions fall back to bib_dedupe.block.block())
+INCREMENTAL_BLOCK_BIB_DEDUPE_VERSION = "0.10.0"
+
+
+def _get_new_record_pairs(
+    records_df: pd.DataFrame, *, block_fields: set, new_ids: typing.Set[str]
+) -> typing.List[typing.Tuple[str, str]]:
+    fields = list(block_fields)
+    non_empty_df = records_df.loc[records_df[fields].ne("").all(axis=1)]
+    block_keys = list(zip(*[non_empty_df[field] for field in fields]))
+    record_ids = non_empty_df[Fields.ID].tolist()
+    new_block_keys = {
+        block_key
+        for block_key, record_id in zip(block_keys, record_ids)
+        if record_id in new_ids
+    }
+    blocks = collections.defaultdict(list)
+    for block_key, record_id in zip(block_keys, record_ids):
+        if block_key in new_block_keys:
+            blocks[block_key].append(record_id)
+
+    return [
+        (id_1, id_2)
+        for block_ids in blocks.values()
+        for id_1, id_2 in combinations(block_ids, 2)
+        if id_1 in new_ids or id_2 in new_ids
+    ]
+
+
+def _block_new_records_incrementally(
+    records_df: pd.DataFrame, *, new_ids: typing.Set[str]
+) -> pd.DataFrame:
+    blocked_pairs = []
+    for block_fields in bib_dedupe.block.block_fields_list:
+        if not all(field in records_df.columns for field in block_fields):
+            continue
+        pairs = _get_new_record_pairs(
+            records_df, block_fields=block_fields, new_ids=new_ids
+        )
+        if not pairs:
+            continue
+        pairs_df = pd.DataFrame(pairs, columns=["ID1", "ID2"])
+        pairs_df["block_rule"] = "-".join(block_fields)
+        pairs_df["require_title_overlap"] = not block_fields.intersection(
+            {TITLE_SHORT, DOI, PAGES}
+        )
+        blocked_pairs.append(pairs_df)
+
+    if not blocked_pairs:
+        return pd.DataFrame(columns=["ID1", "ID2"])
+
+    pairs_df = pd.concat(blocked_pairs, ignore_index=True)
+    # Pairs blocked by several rules require a title overlap only if all rules do
+    pairs_df["require_title_overlap"] = pairs_df.groupby(["ID1", "ID2"])[
+        "require_title_overlap"
+    ].transform("all")
+    pairs_df = pairs_df.drop_duplicates(subset=["ID1", "ID2"])
+    for suffix, id_column in [("_1", "ID1"), ("_2", "ID2")]:
+        pairs_df = pd.merge(
+            pairs_df,
+            records_df.reset_index(drop=True).add_suffix(suffix),
+            left_on=id_column,
+            right_on=f"ID{suffix}",
+            how="left",
+        )
+    pairs_df = bib_dedupe.block.reduce_non_overlapping_titles(pairs_df)
+    pairs_df = bib_dedupe.block.reduce_distinct_sets(pairs_df)
+    return pairs_df
+
+
+def block_new_records(records_df: pd.DataFrame) -> pd.DataFrame:
+    """Block the pairs that involve at least one new record (not in the old_search)
+
+    The records_df must be prepared by bib_dedupe. The pairs correspond to the pairs
+    of bib_dedupe.block.block() that involve a new record, but pairs of old_search
+    records are not generated. The block rules are applied incrementally for the
+    bib_dedupe version that was verified (INCREMENTAL_BLOCK_BIB_DEDUPE_VERSION)."""
+
+    new_ids = set(records_df.loc[records_df[SEARCH_SET] != OLD_SEARCH, Fields.ID])
+    if version("bib-dedupe") == INCREMENTAL_BLOCK_BIB_DEDUPE_VERSION:
+        return _block_new_records_incrementally(records_df, new_ids=new_ids)
+
+    pairs_df = bib_dedupe.block.block(records_df, cpu=1)
+    return pairs_df[pairs_df["ID1"].isin(new_ids) | pairs_df["ID2"].isin(new_ids)]
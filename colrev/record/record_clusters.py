@@ -0,0 +1,68 @@
+#! /usr/bin/env python
+"""Clusters of duplicate records (union-find)."""
+from __future__ import annotations
+
+import typing
+
+
+class DuplicateClusters:
+    """Disjoint sets of record IDs (union by size with path compression)"""
+
+    def __init__(self) -> None:
+        self._parents: typing.Dict[str, str] = {}
+        self._sizes: typing.Dict[str, int] = {}
+
+    def __contains__(self, record_id: str) -> bool:
+        return record_id in self._parents
+
+    def add(self, record_id: str) -> None:
+        """Add a record ID (as a singleton cluster)"""
+        if record_id not in self._parents:
+            self._parents[record_id] = record_id
+            self._sizes[record_id] = 1
+
+    def find(self, record_id: str) -> str:
+        """Get the representative ID of the cluster"""
+        root = record_id
+        while self._parents[root] != root:
+            root = self._parents[root]
+        # Path compression
+        while self._parents[record_id] != root:
+            self._parents[record_id], record_id = root, self._parents[record_id]
+        return root
+
+    def union(self, record_id_1: str, record_id_2: str) -> str:
+        """Merge the clusters of two record IDs (returns the representative ID)"""
+        self.add(record_id_1)
+        self.add(record_id_2)
+        root_1, root_2 = self.find(record_id_1), self.find(record_id_2)
+        if root_1 == root_2:
+            return root_1
+        if self._sizes[root_1] < self._sizes[root_2]:
+            root_1, root_2 = root_2, root_1
+        self._parents[root_2] = root_1
+        self._sizes[root_1] += self._sizes.pop(root_2)
+        return root_1
+
+    def get_clusters(self) -> typing.List[typing.List[str]]:
+        """Get the clusters (sorted IDs, in the order in which IDs were added)"""
+        clusters: typing.Dict[str, typing.List[str]] = {}
+        for record_id in self._parents:
+            clusters.setdefault(self.find(record_id), []).append(record_id)
+        return [sorted(cluster) for cluster in clusters.values()]
+
+
+def get_connected_components(id_sets: typing.Iterable[typing.Iterable[str]]) -> list:
+    """Get the connected components of the id sets (linked by shared IDs)
+
+    id_sets : [[ID_1, ID_2, ID_3], ...]
+    Sets with a single ID are not linked to other IDs and therefore ignored."""
+
+    clusters = DuplicateClusters()
+    for id_set in id_sets:
+        id_list = list(id_set)
+        if len(id_list) < 2:
+            continue
+        for record_id in id_list[1:]:
+            clusters.union(id_list[0], record_id)
+    return clusters.get_clusters()
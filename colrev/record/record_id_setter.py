@@ -2,14 +2,13 @@
 """Functionality for record ID setting."""
 from __future__ import annotations
 
+import collections
 import itertools
 import logging
 import re
 import string
 import typing
 
-from tqdm import tqdm
-
 import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
 import colrev.loader.bib
@@ -24,6 +23,35 @@ from colrev.constants import RecordState
 # pylint: disable=too-few-public-methods
 
 
+class _IDRegistry:
+    """Index of the IDs in use (case-insensitive lookups in constant time)"""
+
+    def __init__(self, ids: typing.Iterable[str]) -> None:
+        self._exact: typing.Counter[str] = collections.Counter()
+        self._lower: typing.Counter[str] = collections.Counter()
+        for record_id in ids:
+            self.append(record_id)
+
+    def append(self, record_id: str) -> None:
+        """Register an ID"""
+        self._exact[record_id] += 1
+        self._lower[record_id.lower()] += 1
+
+    def remove(self, record_id: str) -> None:
+        """Unregister an ID (one occurrence)"""
+        if self._exact[record_id] == 0:
+            return
+        self._exact[record_id] -= 1
+        self._lower[record_id.lower()] -= 1
+
+    def is_taken(self, candidate: str, *, exclude: str = "") -> bool:
+        """Check whether the candidate ID (case-insensitive) is used by another record"""
+        count = self._lower[candidate.lower()]
+        if exclude and exclude.lower() == candidate.lower():
+            count -= self._exact[exclude]
+        return count > 0
+
+
 class IDSetter:
     """The IDSetter class"""
 
@@ -38,6 +66,10 @@ class IDSetter:
         self.id_pattern = id_pattern
         self.skip_local_index = skip_local_index
         if not self.skip_local_index:
+            # pylint: disable=import-outside-toplevel
+            # pylint: disable=redefined-outer-name
+            import colrev.env.local_index
+
             self.local_index = colrev.env.local_index.LocalIndex()
         self.logger = logger
 
@@ -91,7 +123,8 @@ class IDSetter:
         self,
         temp_id: str,
         *,
-        existing_ids: list,
+        existing_ids: _IDRegistry,
+        record_id: str = "",
     ) -> str:
         """Get the next unique ID"""
 
@@ -99,7 +132,7 @@ class IDSetter:
         letters = list(string.ascii_lowercase)
         next_unique_id = temp_id
         appends: list = []
-        while next_unique_id.lower() in [i.lower() for i in existing_ids]:
+        while existing_ids.is_taken(next_unique_id, exclude=record_id):
             if len(appends) == 0:
                 order += 1
                 appends = list(itertools.product(letters, repeat=order))
@@ -111,7 +144,8 @@ class IDSetter:
         self,
         record_dict: dict,
         *,
-        existing_ids: typing.Optional[list] = None,
+        existing_ids: typing.Optional[_IDRegistry] = None,
+        record_id: str = "",
     ) -> str:
         """Generate a blacklist to avoid setting duplicate IDs"""
 
@@ -131,6 +165,7 @@ class IDSetter:
             temp_id = self._make_id_unique(
                 temp_id,
                 existing_ids=existing_ids,
+                record_id=record_id,
             )
 
         return temp_id
@@ -139,8 +174,9 @@ class IDSetter:
         self, records: dict, *, selected_ids: typing.Optional[list] = None
     ) -> dict:
         """Set the IDs for the records in the dataset"""
+        from tqdm import tqdm  # pylint: disable=import-outside-toplevel
 
-        id_list = list(records.keys())
+        id_list = _IDRegistry(records.keys())
 
         for record_id in tqdm(list(records.keys())):
             record_dict = records[record_id]
@@ -163,7 +199,8 @@ class IDSetter:
             if Fields.STATUS not in record_dict:
                 new_id = self._generate_id(
                     record_dict,
-                    existing_ids=[x for x in id_list if x != record_id],
+                    existing_ids=id_list,
+                    record_id=record_id,
                 )
             # Only change IDs that are before md_processed
             elif record_dict[Fields.STATUS] not in RecordState.get_post_x_states(
@@ -171,7 +208,8 @@ class IDSetter:
             ):
                 new_id = self._generate_id(
                     record_dict,
-                    existing_ids=[x for x in id_list if x != record_id],
+                    existing_ids=id_list,
+                    record_id=record_id,
                 )
 
             if selected_ids:
@@ -194,7 +232,7 @@ class IDSetter:
         self,
         records: dict,
         *,
-        id_list: list,
+        id_list: _IDRegistry,
         record_dict: dict,
         old_id: str,
         new_id: str,
@@ -207,5 +245,4 @@ class IDSetter:
             records[new_id] = record_dict
             del records[old_id]
             self.logger.info(f"set_ids({old_id}) to {new_id}")
-            if old_id in id_list:
-                id_list.remove(old_id)
+            id_list.remove(old_id)
@@ -9,11 +9,6 @@ import tempfile
 import typing
 from pathlib import Path
 
-import imagehash
-import pymupdf
-from nameparser import HumanName
-from PIL import Image
-
 import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
 from colrev.constants import Colors
@@ -28,6 +23,8 @@ if typing.TYPE_CHECKING:  # pragma: no cover
 
 
 def _format_author_field_for_cid(input_string: str) -> str:
+    from nameparser import HumanName  # pylint: disable=import-outside-toplevel
+
     input_string = input_string.replace("\n", " ").replace("'", "")
     names = input_string.replace("; ", " and ").split(" and ")
     author_list = []
@@ -193,6 +190,12 @@ def get_colrev_id(record: colrev.record.record.Record, *, assume_complete: bool)
 
 
 def _get_colrev_pdf_id_cpid2(pdf_path: Path) -> str:
+    # pylint: disable=import-outside-toplevel
+    # Note: pymupdf and the imaging libraries are only imported for PDFs
+    import imagehash
+    import pymupdf
+    from PIL import Image
+
     with tempfile.NamedTemporaryFile(suffix=".png") as temp_file:
         file_name = temp_file.name
         try:
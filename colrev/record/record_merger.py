@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 import typing
+from functools import lru_cache
 
 import colrev.env.utils
 from colrev.constants import DefectCodes
@@ -12,6 +13,7 @@ from colrev.constants import FieldSet
 from colrev.constants import FieldValues
 
 if typing.TYPE_CHECKING:  # pragma: no cover
+    import colrev.record.qm.quality_model
     import colrev.record.record
 
 
@@ -180,6 +182,22 @@ CUSTOM_FIELD_SELECTORS = {
 }
 
 
+@lru_cache(maxsize=1)
+def _get_fuse_fields_quality_model() -> colrev.record.qm.quality_model.QualityModel:
+    # Note : the quality model has no memo and no snapshot (it can be shared)
+    import colrev.record.qm.quality_model  # pylint: disable=import-outside-toplevel
+
+    return colrev.record.qm.quality_model.QualityModel(
+        defects_to_ignore=[
+            DefectCodes.MISSING,
+            DefectCodes.RECORD_NOT_IN_TOC,
+            DefectCodes.INCONSISTENT_WITH_DOI_METADATA,
+            DefectCodes.CONTAINER_TITLE_ABBREVIATED,
+            DefectCodes.INCONSISTENT_WITH_DOI_METADATA,
+        ]
+    )
+
+
 def fuse_fields(
     main_record: colrev.record.record.Record,
     *,
@@ -190,15 +208,7 @@ def fuse_fields(
     # Note : the assumption is that we need masterdata_provenance notes
     # only for authors
 
-    quality_model = colrev.record.qm.quality_model.QualityModel(
-        defects_to_ignore=[
-            DefectCodes.MISSING,
-            DefectCodes.RECORD_NOT_IN_TOC,
-            DefectCodes.INCONSISTENT_WITH_DOI_METADATA,
-            DefectCodes.CONTAINER_TITLE_ABBREVIATED,
-            DefectCodes.INCONSISTENT_WITH_DOI_METADATA,
-        ]
-    )
+    quality_model = _get_fuse_fields_quality_model()
     quality_model.run(record=main_record)
     quality_model.run(record=merging_record)
 
@@ -5,8 +5,6 @@ from __future__ import annotations
 import re
 import typing
 
-from nameparser import HumanName
-
 import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
 import colrev.record.record
@@ -57,6 +55,7 @@ class PrepRecord(colrev.record.record.Record):
     @classmethod
     def format_author_field(cls, input_string: str) -> str:
         """Format the author field (recognizing first/last names based on HumanName parser)"""
+        from nameparser import HumanName  # pylint: disable=import-outside-toplevel
 
         def mostly_upper_case(input_string: str) -> bool:
             input_string = input_string.replace(".", "").replace(",", "")
@@ -5,10 +5,6 @@ from __future__ import annotations
 import re
 import typing
 
-import pandas as pd
-from bib_dedupe.bib_dedupe import block
-from bib_dedupe.bib_dedupe import match
-from bib_dedupe.bib_dedupe import prep
 from rapidfuzz import fuzz
 
 import colrev.env.utils
@@ -203,9 +199,7 @@ def _get_similarity_detailed(record_a: dict, record_b: dict) -> float:
     return round(weighted_average, 4)
 
 
-def _ensure_mandatory_fields(
-    record_a: colrev.record.record.Record, record_b: colrev.record.record.Record
-) -> None:
+def _ensure_mandatory_fields(record: colrev.record.record.Record) -> None:
     mandatory_fields = [
         Fields.TITLE,
         Fields.AUTHOR,
@@ -218,16 +212,26 @@ def _ensure_mandatory_fields(
     ]
 
     for mandatory_field in mandatory_fields:
-        if (
-            record_a.data.get(mandatory_field, FieldValues.UNKNOWN)
-            == FieldValues.UNKNOWN
-        ):
-            record_a.data[mandatory_field] = ""
-        if (
-            record_b.data.get(mandatory_field, FieldValues.UNKNOWN)
-            == FieldValues.UNKNOWN
-        ):
-            record_b.data[mandatory_field] = ""
+        if record.data.get(mandatory_field, FieldValues.UNKNOWN) == FieldValues.UNKNOWN:
+            record.data[mandatory_field] = ""
+
+
+def get_similarity_data(record: colrev.record.record.Record) -> dict:
+    """Get the normalized data that is compared to determine similarity
+
+    The result can be computed once per record and passed to
+    get_similarity (e.g., when a record is compared to many candidates)."""
+
+    record = record.copy()
+    _ensure_mandatory_fields(record)
+    _abbreviate_container_title(record)
+    _format_authors_string_for_comparison(record)
+    return record.get_data()
+
+
+def get_similarity(similarity_data_a: dict, similarity_data_b: dict) -> float:
+    """Determine the similarity between two records (based on get_similarity_data)"""
+    return _get_similarity_detailed(similarity_data_a, similarity_data_b)
 
 
 def get_record_similarity(
@@ -235,23 +239,23 @@ def get_record_similarity(
 ) -> float:
     """Determine the similarity between two records (their masterdata)"""
 
-    record_a = record_a.copy()
-    record_b = record_b.copy()
-
-    _ensure_mandatory_fields(record_a, record_b)
-
-    _abbreviate_container_title(record_a)
-    _abbreviate_container_title(record_b)
-    _format_authors_string_for_comparison(record_a)
-    _format_authors_string_for_comparison(record_b)
-
-    return _get_similarity_detailed(record_a.get_data(), record_b.get_data())
+    return _get_similarity_detailed(
+        get_similarity_data(record_a), get_similarity_data(record_b)
+    )
 
 
 def matches(
     record_a: colrev.record.record.Record, record_b: colrev.record.record.Record
 ) -> bool:
     """Determine whether two records match (correspond to the same entity)."""
+
+    # pylint: disable=import-outside-toplevel
+    # Note: pandas and bib_dedupe are only imported when records are matched
+    import pandas as pd
+    from bib_dedupe.bib_dedupe import block
+    from bib_dedupe.bib_dedupe import match
+    from bib_dedupe.bib_dedupe import prep
+
     record_a_dict = record_a.copy().get_data()
     record_b_dict = record_b.copy().get_data()
     record_a_dict[Fields.ID] = "a"
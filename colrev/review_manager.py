@@ -10,7 +10,6 @@ from datetime import timedelta
 from pathlib import Path
 
 import git
-import requests_cache
 import yaml
 
 import colrev.dataset
@@ -19,13 +18,17 @@ import colrev.logger
 import colrev.ops.check
 import colrev.ops.checker
 import colrev.process.operation
-import colrev.record.qm.quality_model
 import colrev.settings
 from colrev.constants import Colors
 from colrev.constants import Filepaths
 from colrev.constants import OperationsType
 from colrev.paths import PathManager
 
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import requests_cache
+
+    import colrev.record.qm.quality_model
+
 
 class ReviewManager:
     """Class for managing individual CoLRev review project (repositories)"""
@@ -75,6 +78,10 @@ class ReviewManager:
         self.paths = PathManager(self.path)
 
         self.exact_call = exact_call
+        # Quality models of the review (keyed by pdf_mode and defects_to_ignore)
+        self._quality_models: typing.Dict[
+            tuple, colrev.record.qm.quality_model.QualityModel
+        ] = {}
 
         try:
             if self.paths.settings.is_file():
@@ -181,9 +188,13 @@ class ReviewManager:
         """Reset the report logger"""
         colrev.logger.reset_report_logger(review_manager=self)
 
-    def check_repo(self) -> dict:
-        """Check the repository"""
+    def check_repo(self, *, staged_only: bool = False) -> dict:
+        """Check the repository
+
+        staged_only: check only the changes staged for the next commit"""
         checker = colrev.ops.checker.Checker(review_manager=self)
+        if staged_only:
+            return checker.check_repo_staged()
         return checker.check_repo()
 
     def in_virtualenv(self) -> bool:  # pragma: no cover
@@ -246,16 +257,17 @@ class ReviewManager:
         return sharing_advice
 
     def update_status_yaml(
-        self, *, add_to_git: bool = True, records: typing.Optional[dict] = None
+        self,
+        *,
+        add_to_git: bool = True,
+        records: typing.Optional[dict] = None,
+        status_stats: typing.Optional[colrev.process.status.StatusStats] = None,
     ) -> None:
         """Update the STATUS_FILE"""
 
-        status_stats = self.get_status_stats(records=records)
-        exported_dict = status_stats.model_dump()
-        exported_dict.pop("origin_states_dict")
-        exported_dict.pop("perc_curated")
-        exported_dict.pop("screening_statistics")
-        exported_dict.pop("nr_origins")
+        if status_stats is None:
+            status_stats = self.get_status_stats(records=records)
+        exported_dict = status_stats.get_status_file_dict()
         with open(self.paths.status, "w", encoding="utf8") as file:
             yaml.dump(exported_dict, file, allow_unicode=True)
         if add_to_git:
@@ -301,22 +313,35 @@ class ReviewManager:
 
         return colrev.ops.checker.Checker(review_manager=self)
 
+    def _get_quality_model(
+        self, *, defects_to_ignore: list, pdf_mode: bool
+    ) -> colrev.record.qm.quality_model.QualityModel:
+        import colrev.record.qm.quality_model
+
+        key = (pdf_mode, tuple(sorted(defects_to_ignore)))
+        if key not in self._quality_models:
+            self._quality_models[key] = colrev.record.qm.quality_model.QualityModel(
+                defects_to_ignore=list(defects_to_ignore),
+                pdf_mode=pdf_mode,
+                path=self.path,
+                memo_path=None if pdf_mode else self.paths.qm_memo,
+            )
+        return self._quality_models[key]
+
     def get_qm(self) -> colrev.record.qm.quality_model.QualityModel:  # pragma: no cover
-        """Get the quality model"""
+        """Get the quality model (shared by the operations of the review)"""
 
-        return colrev.record.qm.quality_model.QualityModel(
-            defects_to_ignore=self.settings.prep.defects_to_ignore
+        return self._get_quality_model(
+            defects_to_ignore=self.settings.prep.defects_to_ignore, pdf_mode=False
         )
 
     def get_pdf_qm(
         self,
     ) -> colrev.record.qm.quality_model.QualityModel:  # pragma: no cover
-        """Get the PDF quality model"""
+        """Get the PDF quality model (shared by the operations of the review)"""
 
-        return colrev.record.qm.quality_model.QualityModel(
-            defects_to_ignore=self.settings.pdf_get.defects_to_ignore,
-            pdf_mode=True,
-            path=self.path,
+        return self._get_quality_model(
+            defects_to_ignore=self.settings.pdf_get.defects_to_ignore, pdf_mode=True
         )
 
     def get_status_stats(
@@ -334,9 +359,14 @@ class ReviewManager:
             review_manager=self, records=records
         )
 
-    def get_completeness_condition(self) -> bool:
+    def get_completeness_condition(
+        self,
+        *,
+        status_stats: typing.Optional[colrev.process.status.StatusStats] = None,
+    ) -> bool:
         """Get the completeness condition"""
-        status_stats = self.get_status_stats()
+        if status_stats is None:
+            status_stats = self.get_status_stats()
         return status_stats.completeness_condition
 
     @classmethod
@@ -389,6 +419,7 @@ class ReviewManager:
     @classmethod
     def get_cached_session(cls) -> requests_cache.CachedSession:  # pragma: no cover
         """Get a cached session"""
+        import requests_cache
 
         return requests_cache.CachedSession(
             str(Filepaths.PREP_REQUESTS_CACHE_FILE),
@@ -12,7 +12,6 @@ from pydantic import model_validator
 
 import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
-import colrev.ops.search_api_feed
 from colrev.constants import IDPattern
 from colrev.constants import PDFPathType
 from colrev.constants import ScreenCriterionType
@@ -86,7 +85,7 @@ class SearchSource(BaseModel):
     comment: typing.Optional[str]
 
     to_import: int = 0
-    imported_origins: typing.List[str] = []
+    imported_origins: typing.Set[str] = set()
     len_before: int = 0
     source_records_list: typing.List[typing.Dict] = []
 
@@ -113,7 +112,7 @@ class SearchSource(BaseModel):
         self,
         *,
         source_records_list: typing.List[typing.Dict],
-        imported_origins: typing.List[str],
+        imported_origins: typing.Set[str],
     ) -> None:
         """Set the SearchSource up for the load process (initialize statistics)"""
         # pylint: disable=attribute-defined-outside-init
@@ -122,7 +121,7 @@ class SearchSource(BaseModel):
         # saved to SETTINGS_FILE.
 
         self.to_import = len(source_records_list)
-        self.imported_origins: typing.List[str] = imported_origins
+        self.imported_origins: typing.Set[str] = imported_origins
         self.len_before = len(imported_origins)
         self.source_records_list: typing.List[typing.Dict] = source_records_list
 
@@ -159,6 +158,9 @@ class SearchSource(BaseModel):
         prep_mode: bool = False,
     ) -> colrev.ops.search_api_feed.SearchAPIFeed:
         """Get a feed to add and update records"""
+        # pylint: disable=import-outside-toplevel
+        # pylint: disable=redefined-outer-name
+        import colrev.ops.search_api_feed
 
         return colrev.ops.search_api_feed.SearchAPIFeed(
             review_manager=review_manager,
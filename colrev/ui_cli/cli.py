@@ -12,21 +12,8 @@ from functools import wraps
 from pathlib import Path
 
 import click
-import click_repl
-import inquirer
-import pandas as pd
-from git.exc import GitCommandError
 
-import colrev.env.local_index
 import colrev.exceptions as colrev_exceptions
-import colrev.ops.check
-import colrev.package_manager.package_manager
-import colrev.record.record
-import colrev.review_manager
-import colrev.ui_cli.add_package_to_settings
-import colrev.ui_cli.cli_status_printer
-import colrev.ui_cli.cli_validation
-import colrev.ui_cli.dedupe_errors
 from colrev.constants import Colors
 from colrev.constants import EndpointType
 from colrev.constants import Fields
@@ -35,6 +22,13 @@ from colrev.constants import IDPattern
 from colrev.constants import RecordState
 from colrev.constants import ScreenCriterionType
 
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import colrev.ops.dedupe
+    import colrev.ops.pdf_prep_man
+    import colrev.ops.screen
+    import colrev.package_manager.package_manager
+    import colrev.review_manager
+
 # pylint: disable=too-many-lines
 # pylint: disable=redefined-outer-name
 # pylint: disable=too-many-arguments
@@ -51,17 +45,38 @@ from colrev.constants import ScreenCriterionType
 
 EXACT_CALL = "colrev " + subprocess.list2cmdline(sys.argv[1:])  # nosec
 
-PACKAGE_MANAGER = colrev.package_manager.package_manager.PackageManager()
-# TYPE_IDENTIFIER_ENDPOINT_DICT = PACKAGE_MANAGER.load_type_identifier_endpoint_dict()
+# Note: heavy modules (review_manager, pandas, inquirer, ...) are imported
+# in the commands that need them (the import of the cli and commands
+# like --help do not load them). The review manager only imports what the
+# status command needs (pandas, pymupdf, requests, ... are imported by the
+# operations that use them). Keep the imports of these modules lazy
+# (tests/1_env/packages_test.py checks them).
+_PACKAGE_MANAGER: typing.Optional[
+    colrev.package_manager.package_manager.PackageManager
+] = None
 
 SHELL_MODE = False
 
 
+def _get_package_manager() -> colrev.package_manager.package_manager.PackageManager:
+    """Get the package manager (created on first use)"""
+    import colrev.package_manager.package_manager
+
+    # pylint: disable=global-statement
+    global _PACKAGE_MANAGER
+    if _PACKAGE_MANAGER is None:
+        _PACKAGE_MANAGER = colrev.package_manager.package_manager.PackageManager()
+    return _PACKAGE_MANAGER
+
+
 def _add_endpoint_interactively(add: str, endpoint_type: EndpointType) -> str:
     """Add package interactively"""
     if add != "add_interactively":
         return add
-    packages = PACKAGE_MANAGER.discover_packages(package_type=endpoint_type)
+
+    import inquirer
+
+    packages = _get_package_manager().discover_packages(package_type=endpoint_type)
     questions = [
         inquirer.List(
             "package",
@@ -72,9 +87,9 @@ def _add_endpoint_interactively(add: str, endpoint_type: EndpointType) -> str:
     answers = inquirer.prompt(questions)
     endpoint = answers["package"]
 
-    if not PACKAGE_MANAGER.is_installed(endpoint):
+    if not _get_package_manager().is_installed(endpoint):
         print(f"{Colors.GREEN}Install package{Colors.END}")
-        PACKAGE_MANAGER.install(packages=[endpoint])
+        _get_package_manager().install(packages=[endpoint])
 
     return endpoint
 
@@ -86,6 +101,8 @@ def _select_source_interactively(
     if selected != "select_interactively":
         return selected
 
+    import inquirer
+
     sources = [str(s.filename) for s in review_manager.settings.sources]
     questions = [
         inquirer.Checkbox(
@@ -102,6 +119,9 @@ def _add_screen_criterion_interactively(
     add: str, screen_operation: colrev.ops.screen.Screen
 ) -> None:
     """Add screening criterion interactively"""
+    import inquirer
+    import colrev.settings
+
     if add != "add_interactively":
         assert add.count(",") == 2
         (
@@ -142,6 +162,8 @@ def get_search_files() -> list:
     """Get the search files (for click choices)"""
     # Take the filenames from sources because there may be API searches
     # without files (yet)
+    import colrev.review_manager
+
     try:
         review_manager = colrev.review_manager.ReviewManager()
         return [str(x.filename) for x in review_manager.settings.sources]
@@ -230,11 +252,13 @@ def main(ctx: click.core.Context) -> None:
     Documentation:  https://colrev-environment.github.io/colrev/
     """
 
-    try:
-        if ctx.invoked_subcommand == "shell":
+    if ctx.invoked_subcommand == "shell":
+        import colrev.review_manager
+
+        try:
             ctx.obj = {"review_manager": colrev.review_manager.ReviewManager()}
-    except colrev.exceptions.RepoSetupError:
-        pass
+        except colrev_exceptions.RepoSetupError:
+            pass
 
 
 def get_review_manager(
@@ -246,6 +270,8 @@ def get_review_manager(
     reload it
     """
 
+    import colrev.review_manager
+
     review_manager_params["exact_call"] = ctx.command_path
     try:
         review_manager = ctx.obj["review_manager"]
@@ -279,6 +305,8 @@ def shell(
     ctx: click.core.Context,
 ) -> None:
     """Starts a interactive terminal"""
+    import click_repl
+
     from prompt_toolkit.history import FileHistory
 
     print(f"CoLRev version {colrev.__version__}")
@@ -300,6 +328,8 @@ def exit_command(
     ctx: click.core.Context,
 ) -> None:
     """Starts a interactive terminal"""
+    import click_repl
+
     import inspect
 
     curframe = inspect.currentframe()
@@ -377,6 +407,8 @@ def status(
     verbose: bool,
 ) -> None:
     """Show status"""
+    import colrev.ui_cli.cli_status_printer
+
     try:
         review_manager = get_review_manager(
             ctx,
@@ -552,6 +584,8 @@ def search(
     Docs: https://colrev-environment.github.io/colrev/manual/metadata_retrieval/search.html
     """
 
+    import colrev.ui_cli.add_package_to_settings
+
     review_manager = get_review_manager(
         ctx, {"verbose_mode": verbose, "force_mode": force, "exact_call": EXACT_CALL}
     )
@@ -564,13 +598,9 @@ def search(
         return
 
     if add:
-        # pylint: disable=import-outside-toplevel
-        # pylint: disable=reimported
-        import colrev.ui_cli.add_package_to_settings
-
         add = _add_endpoint_interactively(add, EndpointType.search_source)
         colrev.ui_cli.add_package_to_settings.add_package_to_settings(
-            PACKAGE_MANAGER,
+            _get_package_manager(),
             operation=search_operation,
             package_identifier=add,
             params=params,
@@ -761,6 +791,8 @@ def prep(
     Docs: https://colrev-environment.github.io/colrev/manual/metadata_retrieval/prep.html
     """
 
+    import colrev.ui_cli.add_package_to_settings
+
     try:
         review_manager = get_review_manager(
             ctx,
@@ -789,7 +821,7 @@ def prep(
         if add:
             add = _add_endpoint_interactively(add, EndpointType.prep)
             colrev.ui_cli.add_package_to_settings.add_package_to_settings(
-                PACKAGE_MANAGER,
+                _get_package_manager(),
                 operation=prep_operation,
                 package_identifier=add,
                 params=params,
@@ -863,6 +895,8 @@ def prep_man(
     Docs: https://colrev-environment.github.io/colrev/manual/metadata_retrieval/prep.html
     """
 
+    import colrev.ui_cli.add_package_to_settings
+
     review_manager = get_review_manager(
         ctx, {"verbose_mode": verbose, "force_mode": force, "exact_call": EXACT_CALL}
     )
@@ -878,7 +912,7 @@ def prep_man(
     if add:
         add = _add_endpoint_interactively(add, EndpointType.prep_man)
         colrev.ui_cli.add_package_to_settings.add_package_to_settings(
-            PACKAGE_MANAGER,
+            _get_package_manager(),
             operation=prep_man_operation,
             package_identifier=add,
             params=params,
@@ -982,6 +1016,9 @@ def dedupe(
     Docs: https://colrev-environment.github.io/colrev/manual/metadata_retrieval/dedupe.html
     """
 
+    import colrev.ui_cli.add_package_to_settings
+    import colrev.ui_cli.dedupe_errors
+
     review_manager = get_review_manager(
         ctx, {"verbose_mode": verbose, "force_mode": force, "exact_call": EXACT_CALL}
     )
@@ -993,7 +1030,7 @@ def dedupe(
     if add:
         add = _add_endpoint_interactively(add, EndpointType.dedupe)
         colrev.ui_cli.add_package_to_settings.add_package_to_settings(
-            PACKAGE_MANAGER,
+            _get_package_manager(),
             operation=dedupe_operation,
             package_identifier=add,
             params=params,
@@ -1155,6 +1192,8 @@ def prescreen(
 
     # pylint: disable=too-many-locals
 
+    import colrev.ui_cli.add_package_to_settings
+
     review_manager = get_review_manager(
         ctx, {"verbose_mode": verbose, "force_mode": force, "exact_call": EXACT_CALL}
     )
@@ -1186,7 +1225,7 @@ def prescreen(
     elif add:
         add = _add_endpoint_interactively(add, EndpointType.prescreen)
         colrev.ui_cli.add_package_to_settings.add_package_to_settings(
-            PACKAGE_MANAGER,
+            _get_package_manager(),
             operation=prescreen_operation,
             package_identifier=add,
             params=params,
@@ -1312,6 +1351,8 @@ def screen(
     Docs: https://colrev-environment.github.io/colrev/manual/pdf_screen/screen.html
     """
 
+    import colrev.ui_cli.add_package_to_settings
+
     review_manager = get_review_manager(
         ctx, {"verbose_mode": verbose, "force_mode": force, "exact_call": EXACT_CALL}
     )
@@ -1323,7 +1364,7 @@ def screen(
     if add:
         add = _add_endpoint_interactively(add, EndpointType.screen)
         colrev.ui_cli.add_package_to_settings.add_package_to_settings(
-            PACKAGE_MANAGER,
+            _get_package_manager(),
             operation=screen_operation,
             package_identifier=add,
             params=params,
@@ -1548,6 +1589,8 @@ def pdf_get(
     Docs: https://colrev-environment.github.io/colrev/manual/pdf_retrieval/pdf_get.html
     """
 
+    import colrev.ui_cli.add_package_to_settings
+
     review_manager = get_review_manager(
         ctx,
         {
@@ -1565,7 +1608,7 @@ def pdf_get(
     if add:
         add = _add_endpoint_interactively(add, EndpointType.pdf_get)
         colrev.ui_cli.add_package_to_settings.add_package_to_settings(
-            PACKAGE_MANAGER,
+            _get_package_manager(),
             operation=pdf_get_operation,
             package_identifier=add,
             params=params,
@@ -1646,6 +1689,9 @@ def pdf_get_man(
     Docs: https://colrev-environment.github.io/colrev/manual/pdf_retrieval/pdf_get.html
     """
 
+    import pandas as pd
+    import colrev.ui_cli.add_package_to_settings
+
     review_manager = get_review_manager(
         ctx,
         {
@@ -1659,7 +1705,7 @@ def pdf_get_man(
     if add:
         add = _add_endpoint_interactively(add, EndpointType.pdf_get_man)
         colrev.ui_cli.add_package_to_settings.add_package_to_settings(
-            PACKAGE_MANAGER,
+            _get_package_manager(),
             operation=pdf_get_man_operation,
             package_identifier=add,
             params=params,
@@ -1809,6 +1855,8 @@ def pdf_prep(
 
     # pylint: disable=import-outside-toplevel
 
+    import colrev.ui_cli.add_package_to_settings
+
     review_manager = get_review_manager(
         ctx,
         {
@@ -1822,7 +1870,7 @@ def pdf_prep(
     if add:
         add = _add_endpoint_interactively(add, EndpointType.pdf_prep)
         colrev.ui_cli.add_package_to_settings.add_package_to_settings(
-            PACKAGE_MANAGER,
+            _get_package_manager(),
             operation=pdf_prep_operation,
             package_identifier=add,
             params=params,
@@ -1848,6 +1896,8 @@ def pdf_prep(
 def _delete_first_pages_cli(
     pdf_prep_man_operation: colrev.ops.pdf_prep_man.PDFPrepMan, record_id: str
 ) -> None:
+    import colrev.record.record
+
     records = pdf_prep_man_operation.review_manager.dataset.load_records_dict()
     while True:
         if record_id in records:
@@ -1946,6 +1996,8 @@ def pdf_prep_man(
     Docs: https://colrev-environment.github.io/colrev/manual/pdf_retrieval/pdf_prep.html
     """
 
+    import colrev.ui_cli.add_package_to_settings
+
     review_manager = get_review_manager(
         ctx,
         {
@@ -1959,7 +2011,7 @@ def pdf_prep_man(
     if add:
         add = _add_endpoint_interactively(add, EndpointType.pdf_prep_man)
         colrev.ui_cli.add_package_to_settings.add_package_to_settings(
-            PACKAGE_MANAGER,
+            _get_package_manager(),
             operation=pdf_prep_man_operation,
             package_identifier=add,
             params=params,
@@ -2041,6 +2093,8 @@ def data(
     Docs: https://colrev-environment.github.io/colrev/manual/data/data.html
     """
 
+    import colrev.ui_cli.add_package_to_settings
+
     review_manager = get_review_manager(
         ctx,
         {
@@ -2066,7 +2120,7 @@ def data(
     if add:
         add = _add_endpoint_interactively(add, EndpointType.data)
         colrev.ui_cli.add_package_to_settings.add_package_to_settings(
-            PACKAGE_MANAGER,
+            _get_package_manager(),
             operation=data_operation,
             package_identifier=add,
             params=params,
@@ -2156,6 +2210,8 @@ def validate(
     - A contributor name
     """
 
+    import colrev.ui_cli.cli_validation
+
     review_manager = get_review_manager(
         ctx,
         {
@@ -2381,6 +2437,8 @@ def env(
 
     # pylint: disable=too-many-branches
 
+    from git.exc import GitCommandError
+
     options_set = any(
         [index, install, pull, status, register, unregister, update_package_list]
     )
@@ -2798,6 +2856,8 @@ def show(  # type: ignore
 ) -> None:
     """Show aspects (sample, ...)"""
 
+    import colrev.ops.check
+
     import colrev.process.operation
     import colrev.ui_cli.show_printer
 
@@ -2892,6 +2952,8 @@ def upgrade(
 ) -> None:
     """Upgrade to the latest CoLRev project version."""
 
+    import colrev.review_manager
+
     if disable_auto:
         review_manager = colrev.review_manager.ReviewManager(
             force_mode=True, verbose_mode=verbose, skip_upgrade=True
@@ -3037,6 +3099,8 @@ def merge(
 ) -> None:
     """Merge git branches."""
 
+    import colrev.ops.check
+
     review_manager = get_review_manager(
         ctx,
         {"verbose_mode": verbose, "force_mode": force},
@@ -3078,6 +3142,8 @@ def undo(
 ) -> None:
     """Undo operations."""
 
+    import colrev.ops.check
+
     review_manager = get_review_manager(
         ctx,
         {"verbose_mode": verbose, "force_mode": force},
@@ -3091,6 +3157,8 @@ def undo(
 
 def select_format() -> str:
     """Select the format"""
+    import inquirer
+
     questions = [
         inquirer.List(
             "format",
@@ -3128,6 +3196,8 @@ def convert(
     Convert a file to the specified format.
     """
     # Example placeholder logic
+    import colrev.record.record_id_setter
+
     click.echo(f"Converting file: {input_file}")
     if output_format:
         click.echo(f"Output format: {output_format}")
@@ -3197,15 +3267,17 @@ def install(
     To install all internal packages, run\n
         colrev install all_internal_packages"""
 
+    import colrev.review_manager
+
     if len(packages) == 1 and packages[0] == ".":
         review_manager = colrev.review_manager.ReviewManager()
-        PACKAGE_MANAGER.install_project(
+        _get_package_manager().install_project(
             review_manager=review_manager, force_reinstall=force_reinstall
         )
 
     else:
 
-        PACKAGE_MANAGER.install(
+        _get_package_manager().install(
             packages=packages,
             upgrade=upgrade,
             editable=editable,
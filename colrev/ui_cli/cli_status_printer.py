@@ -6,8 +6,6 @@ import sys
 import typing
 from time import sleep
 
-from tqdm import tqdm
-
 import colrev.exceptions as colrev_exceptions
 from colrev.constants import Colors
 from colrev.constants import ExitCodes
@@ -144,6 +142,7 @@ def print_environment_instructions(environment_instructions: dict) -> None:
 
 def print_progress(*, total_atomic_steps: int, completed_steps: int) -> None:
     """Print the progress bar on cli"""
+    from tqdm import tqdm  # pylint: disable=import-outside-toplevel
 
     # Prints the percentage of atomic processing tasks that have been completed
     # possible extension: estimate the number of manual tasks (making assumptions on
@@ -8,26 +8,24 @@ Usage::
 """
 from __future__ import annotations
 
+import importlib
 from pathlib import Path
 
-import colrev.writer.bib
-import colrev.writer.csv
-import colrev.writer.excel
-import colrev.writer.ris
+# Writer modules per file suffix
+# Note: writers are imported when they are used (e.g., csv/excel writers require pandas)
+_WRITERS = {
+    ".bib": "colrev.writer.bib",
+    ".ris": "colrev.writer.ris",
+    ".csv": "colrev.writer.csv",
+    ".xlsx": "colrev.writer.excel",
+}
 
 
 def write_file(records_dict: dict, filename: Path, **kw) -> dict:  # type: ignore
     """Write a file (BiBTex, RIS, or other) from a dictionary of records."""
-    if filename.suffix == ".bib":
-        writer = colrev.writer.bib.write_file  # type: ignore
-    elif filename.suffix == ".ris":
-        writer = colrev.writer.ris.write_file  # type: ignore
-    elif filename.suffix == ".csv":
-        writer = colrev.writer.csv.write_file  # type: ignore
-    elif filename.suffix == ".xlsx":
-        writer = colrev.writer.excel.write_file  # type: ignore
-    else:
+    if filename.suffix not in _WRITERS:
         raise NotImplementedError
+    writer = importlib.import_module(_WRITERS[filename.suffix]).write_file
 
     kw["filename"] = filename
     kw["records_dict"] = records_dict
@@ -37,12 +35,9 @@ def write_file(records_dict: dict, filename: Path, **kw) -> dict:  # type: ignor
 
 def to_string(*, records_dict: dict, implementation: str, **kw) -> str:  # type: ignore
     """Write a string (BiBTex, RIS, or other) from a dictionary of records."""
-    if implementation == "bib":
-        writer = colrev.writer.bib.to_string  # type: ignore
-    elif implementation == "ris":
-        writer = colrev.writer.ris.to_string  # type: ignore
-    else:
+    if implementation not in ["bib", "ris"]:
         raise NotImplementedError
+    writer = importlib.import_module(_WRITERS[f".{implementation}"]).to_string
 
     kw["records_dict"] = records_dict
 
@@ -622,6 +622,89 @@ def test_add_changes_remove(
     ), "add_changes failed to remove the file from the repository."
 
 
+def test_batched_index_updates(
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+) -> None:
+    """Test batched_index_updates method."""
+    dataset = base_repo_review_manager.dataset
+    file_paths = [
+        base_repo_review_manager.path / f"batched_file_{i}.txt" for i in range(20)
+    ]
+    index_writes = dataset.index_writes
+    with dataset.batched_index_updates():
+        for file_path in file_paths:
+            file_path.write_text("This file will be added.")
+            dataset.add_changes(file_path)
+        dataset.add_changes(Path("non_existsnt.file"), ignore_missing=True)
+        with pytest.raises(FileNotFoundError):
+            dataset.add_changes(Path("non_existsnt.file"))
+
+        # Not written before the context exits
+        assert file_paths[0].name not in dataset._git_repo.git.ls_files()
+
+    ls_files = dataset._git_repo.git.ls_files()
+    assert all(file_path.name in ls_files for file_path in file_paths)
+    assert 1 == dataset.index_writes - index_writes
+
+    # Pending updates are written before the index is read
+    with dataset.batched_index_updates():
+        for file_path in file_paths:
+            dataset.add_changes(file_path, remove=True)
+        assert dataset.has_changes(Path(file_paths[0].name), change_type="unstaged")
+        assert file_paths[0].name not in dataset._git_repo.git.ls_files()
+    assert 2 == dataset.index_writes - index_writes
+
+
+def test_batched_index_updates_removed_files(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+    mocker,
+) -> None:
+    """Test batched_index_updates for files removed before the updates are written"""
+    dataset = base_repo_review_manager.dataset
+    file_paths = [
+        base_repo_review_manager.path / f"batched_removed_file_{i}.txt"
+        for i in range(4)
+    ]
+    for file_path in file_paths:
+        file_path.write_text("This file will be added.")
+
+    # Removed files that were added with ignore_missing are skipped
+    with dataset.batched_index_updates():
+        dataset.add_changes(file_paths[0], ignore_missing=True)
+        dataset.add_changes(file_paths[1])
+        file_paths[0].unlink()
+    ls_files = dataset._git_repo.git.ls_files()
+    assert file_paths[0].name not in ls_files
+    assert file_paths[1].name in ls_files
+
+    # Other removed files raise a FileNotFoundError (the other files are added)
+    with pytest.raises(FileNotFoundError):
+        with dataset.batched_index_updates():
+            dataset.add_changes(file_paths[2])
+            dataset.add_changes(file_paths[3])
+            file_paths[2].unlink()
+    ls_files = dataset._git_repo.git.ls_files()
+    assert file_paths[2].name not in ls_files
+    assert file_paths[3].name in ls_files
+
+    # Updates are kept if writing fails
+    with dataset.batched_index_updates():
+        dataset.add_changes(file_paths[1], remove=True)
+        dataset.add_changes(file_paths[3], remove=True)
+        write_index_updates = mocker.patch.object(
+            dataset, "_write_index_updates", side_effect=OSError("index.lock")
+        )
+        with pytest.raises(OSError):
+            dataset.flush_index_updates()
+        mocker.stop(write_index_updates)
+    ls_files = dataset._git_repo.git.ls_files()
+    assert file_paths[1].name not in ls_files
+    assert file_paths[3].name not in ls_files
+
+    for file_path in file_paths:
+        file_path.unlink(missing_ok=True)
+
+
 def test_add_changes_ignore_missing(
     base_repo_review_manager: colrev.review_manager.ReviewManager,
 ) -> None:
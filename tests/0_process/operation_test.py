@@ -1,5 +1,6 @@
 import pytest
 
+import colrev.env.docker_manager
 import colrev.exceptions as colrev_exceptions
 import colrev.process.operation
 from colrev.constants import OperationsType
@@ -39,6 +40,31 @@ def test_check_precondition_load(  # type: ignore
     load_operation.check_precondition()
 
 
+def test_conclude_reused_container(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, mocker
+) -> None:
+    """Containers are stopped if their (running) service was reused"""
+
+    mocker.patch.object(colrev.env.docker_manager, "_PROVISIONED_IMAGES", set())
+    container = mocker.Mock()
+    container.image.tags = ["browserless/chrome:latest"]
+    from_env = mocker.patch("docker.from_env")
+    from_env.return_value.containers.list.return_value = [container]
+    operation = colrev.process.operation.Operation(
+        review_manager=base_repo_review_manager, operations_type=OperationsType.pdf_get
+    )
+    operation.docker_images_to_stop.append("browserless/chrome:latest")
+
+    operation.conclude()
+    from_env.assert_not_called()
+
+    colrev.env.docker_manager.DockerManager.mark_provisioned(
+        "browserless/chrome:latest"
+    )
+    operation.conclude()
+    container.stop.assert_called_once()
+
+
 # def test_conclude(self):
 #     docker_mock = MagicMock()
 #     container_mock = MagicMock()
@@ -2,11 +2,18 @@
 """Tests for the quality model"""
 from __future__ import annotations
 
+import re
+from pathlib import Path
+
 import pytest
 
 import colrev.exceptions as colrev_exceptions
+import colrev.record.qm.checkers
 import colrev.record.qm.quality_model
+import colrev.record.qm.quality_model_memo
+import colrev.record.qm.quality_model_snapshot
 import colrev.record.record
+import colrev.review_manager
 from colrev.constants import DefectCodes
 from colrev.constants import ENTRYTYPES
 from colrev.constants import Fields
@@ -1529,3 +1536,253 @@ def test_run_quality_model_curated(  # type: ignore
     v_t_record.run_quality_model(quality_model=quality_model, set_prepared=True)
 
     assert v_t_record.data[Fields.STATUS] == RecordState.md_prepared
+
+
+def test_get_quality_model(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+) -> None:
+    """Test the quality models of a review (and the checker registry)"""
+
+    quality_model = base_repo_review_manager.get_qm()
+    assert quality_model is base_repo_review_manager.get_qm()
+    assert quality_model.memo is not None
+    pdf_quality_model = base_repo_review_manager.get_pdf_qm()
+    assert pdf_quality_model is base_repo_review_manager.get_pdf_qm()
+    assert pdf_quality_model is not quality_model
+    assert all(
+        checker.quality_model is quality_model for checker in quality_model.checkers
+    )
+
+    # Quality models (and their state) are not shared between review managers
+    other_review_manager = colrev.review_manager.ReviewManager(
+        path_str=str(base_repo_review_manager.path)
+    )
+    other_quality_model = other_review_manager.get_qm()
+    assert other_quality_model is not quality_model
+    assert len(other_quality_model.checkers) == len(quality_model.checkers)
+
+
+def test_quality_model_memo(tmp_path, mocker) -> None:  # type: ignore
+    """Test the memoized (and persisted) results of the quality model"""
+
+    defects_to_ignore = [
+        DefectCodes.RECORD_NOT_IN_TOC,
+        DefectCodes.INCONSISTENT_WITH_DOI_METADATA,
+    ]
+    memo_path = tmp_path / "qm_memo.json"
+    record_dict = {
+        Fields.ID: "Wagner2022",
+        Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+        Fields.JOURNAL: "Journal of Information Technology",
+        Fields.AUTHOR: "Wagner, Gerit and Lukyanenko, Roman and Paré, Guy",
+        Fields.TITLE: "ARTIFICIAL INTELLIGENCE AND THE CONDUCT OF LITERATURE REVIEWS",
+        Fields.YEAR: "2022",
+        Fields.VOLUME: "37",
+    }
+
+    quality_model = colrev.record.qm.quality_model.QualityModel(
+        defects_to_ignore=defects_to_ignore, memo_path=memo_path
+    )
+    record = colrev.record.record.Record(dict(record_dict))
+    quality_model.run(record=record)
+    assert record.data[Fields.NUMBER] == FieldValues.UNKNOWN
+    assert DefectCodes.MOSTLY_ALL_CAPS in record.get_field_provenance_notes(
+        Fields.TITLE
+    )
+    expected = record.data
+    quality_model.save_memo()
+
+    quality_model = colrev.record.qm.quality_model.QualityModel(
+        defects_to_ignore=defects_to_ignore, memo_path=memo_path
+    )
+    checker_runs = [
+        mocker.spy(checker, "run")
+        for checker in quality_model.checkers
+        if checker.msg not in defects_to_ignore
+    ]
+    record = colrev.record.record.Record(dict(record_dict))
+    quality_model.run(record=record)
+    assert record.data == expected
+    assert all(checker_run.call_count == 0 for checker_run in checker_runs)
+
+    # Changed records are checked
+    record = colrev.record.record.Record(dict(record_dict, **{Fields.NUMBER: "2"}))
+    quality_model.run(record=record)
+    assert Fields.NUMBER not in record.data.get(Fields.MD_PROV, {})
+    assert all(checker_run.call_count == 1 for checker_run in checker_runs)
+
+
+def test_quality_model_memo_non_memoized(tmp_path, mocker) -> None:  # type: ignore
+    """Test that the memo key only considers the checked fields and that
+    the DOI-metadata checker is not memoized"""
+
+    defects_to_ignore = [DefectCodes.RECORD_NOT_IN_TOC]
+    memo_path = tmp_path / "qm_memo.json"
+    record_dict: dict = {
+        Fields.ID: "Wagner2022",
+        Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+        Fields.STATUS: RecordState.md_imported,
+        Fields.ORIGIN: ["pubmed.bib/0001"],
+        Fields.JOURNAL: "Journal of Information Technology",
+        Fields.AUTHOR: "Wagner, Gerit and Lukyanenko, Roman and Paré, Guy",
+        Fields.TITLE: "Artificial intelligence and the conduct of literature reviews",
+        Fields.YEAR: "2022",
+        Fields.VOLUME: "37",
+        Fields.NUMBER: "2",
+        Fields.DOI: "10.1177/02683962211048201",
+        Fields.LANGUAGE: "eng",
+    }
+    quality_model = colrev.record.qm.quality_model.QualityModel(
+        defects_to_ignore=defects_to_ignore, memo_path=memo_path
+    )
+    quality_model.snapshot = (
+        colrev.record.qm.quality_model_snapshot.QualityModelSnapshot()
+    )
+    quality_model.snapshot.doi_metadata[record_dict[Fields.DOI]] = {
+        Fields.TITLE: "Artificial intelligence and the conduct of literature reviews",
+    }
+    checker_runs = {
+        checker.msg: mocker.spy(checker, "run")
+        for checker in quality_model.checkers
+        if checker.msg not in defects_to_ignore
+    }
+    record = colrev.record.record.Record(dict(record_dict))
+    quality_model.run(record=record)
+    assert not record.has_quality_defects()
+
+    # Changes in fields that are not checked (status, origin) do not affect the memo
+    record = colrev.record.record.Record(
+        dict(
+            record_dict,
+            **{
+                Fields.STATUS: RecordState.md_prepared,
+                Fields.ORIGIN: ["crossref.bib/0001"],
+            },
+        )
+    )
+    # The DOI metadata is checked for each record (not memoized)
+    quality_model.snapshot.doi_metadata[record_dict[Fields.DOI]] = {
+        Fields.TITLE: "Conflicting title of another paper in the journal",
+    }
+    quality_model.run(record=record)
+    assert DefectCodes.INCONSISTENT_WITH_DOI_METADATA in (
+        record.get_field_provenance_notes(Fields.DOI)
+    )
+    for msg, checker_run in checker_runs.items():
+        if msg == DefectCodes.INCONSISTENT_WITH_DOI_METADATA:
+            assert checker_run.call_count == 2
+        else:
+            assert checker_run.call_count == 1
+
+
+def test_quality_model_prefetch(tmp_path, mocker) -> None:  # type: ignore
+    """Test that TOCs are only prefetched for records that are not in the memo"""
+
+    quality_model = colrev.record.qm.quality_model.QualityModel(
+        defects_to_ignore=[], memo_path=tmp_path / "qm_memo.json"
+    )
+    assert quality_model.memo is not None
+    record_dicts = [
+        {
+            Fields.ID: f"Wagner2022{suffix}",
+            Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+            Fields.JOURNAL: "Journal of Information Technology",
+            Fields.TITLE: title,
+            Fields.YEAR: "2022",
+            Fields.VOLUME: "37",
+            Fields.NUMBER: "2",
+            Fields.DOI: doi,
+        }
+        for suffix, title, doi in [
+            ("a", "Artificial intelligence and literature reviews", "10.1/a"),
+            ("b", "Literature reviews in information systems", "10.1/b"),
+        ]
+    ]
+    quality_model.memo.add(
+        key=quality_model.memo.get_key(record_dicts[0]),
+        original_record_dict=record_dicts[0],
+        record_dict=record_dicts[0],
+    )
+    snapshot_class = colrev.record.qm.quality_model_snapshot.QualityModelSnapshot
+    prefetch_doi_metadata = mocker.patch.object(snapshot_class, "prefetch_doi_metadata")
+    prefetch_tocs = mocker.patch.object(snapshot_class, "prefetch_tocs")
+
+    quality_model.prefetch(record_dicts)
+    assert prefetch_doi_metadata.call_args.args[0] == record_dicts
+    assert list(prefetch_tocs.call_args.args[0]) == [record_dicts[1]]
+
+
+def test_quality_model_memo_checked_fields() -> None:
+    """Test that the memo key covers the fields that are read by the checkers"""
+
+    checker_path = Path(colrev.record.qm.checkers.__file__).parent
+    checked_fields = {
+        getattr(Fields, field_name)
+        for filename in checker_path.glob("*.py")
+        for field_name in re.findall(
+            r"Fields\.([A-Z_]+)", filename.read_text(encoding="utf-8")
+        )
+    }
+    assert checked_fields <= colrev.record.qm.quality_model_memo.CHECKED_FIELDS
+
+
+def test_quality_model_snapshot(mocker) -> None:  # type: ignore
+    """Test the checkers in snapshot mode (pre-fetched DOI metadata and TOCs)"""
+
+    quality_model = colrev.record.qm.quality_model.QualityModel(defects_to_ignore=[])
+    quality_model.snapshot = (
+        colrev.record.qm.quality_model_snapshot.QualityModelSnapshot()
+    )
+    record_dict = {
+        Fields.ID: "Wagner2022",
+        Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+        Fields.JOURNAL: "Journal of Information Technology",
+        Fields.AUTHOR: "Wagner, Gerit and Lukyanenko, Roman and Paré, Guy",
+        Fields.TITLE: "Artificial intelligence and the conduct of literature reviews",
+        Fields.YEAR: "2022",
+        Fields.VOLUME: "37",
+        Fields.NUMBER: "2",
+        Fields.DOI: "10.1177/02683962211048201",
+    }
+    toc_key = colrev.record.record.Record(record_dict).get_toc_key()
+    quality_model.snapshot.doi_metadata[record_dict[Fields.DOI]] = {
+        Fields.TITLE: "Conflicting title of another paper in the journal",
+    }
+    quality_model.snapshot.toc_records[toc_key] = [dict(record_dict)]
+
+    record = colrev.record.record.Record(dict(record_dict))
+    quality_model.run(record=record)
+    assert DefectCodes.INCONSISTENT_WITH_DOI_METADATA in (
+        record.get_field_provenance_notes(Fields.DOI)
+    )
+    assert DefectCodes.RECORD_NOT_IN_TOC not in (
+        record.get_field_provenance_notes(Fields.JOURNAL)
+    )
+
+    # Records whose data is not in the snapshot are deferred
+    other_record_dict = dict(
+        record_dict, **{Fields.DOI: "10.1177/0000", Fields.NUMBER: "3"}
+    )
+    other_record = colrev.record.record.Record(other_record_dict)
+    quality_model.run(record=other_record)
+    assert quality_model.snapshot.is_deferred(other_record)
+
+    def patched_prefetch(records):  # type: ignore
+        for deferred_record_dict in records:
+            quality_model.snapshot.doi_metadata[deferred_record_dict[Fields.DOI]] = None
+            quality_model.snapshot.toc_records[
+                colrev.record.record.Record(deferred_record_dict).get_toc_key()
+            ] = [record_dict]
+
+    mocker.patch.object(quality_model.snapshot, "prefetch", patched_prefetch)
+    quality_model.run_deferred()
+    assert not quality_model.snapshot.pop_deferred()
+    assert DefectCodes.INCONSISTENT_WITH_DOI_METADATA not in (
+        other_record.get_field_provenance_notes(Fields.DOI)
+    )
+    assert DefectCodes.RECORD_NOT_IN_TOC in (
+        other_record.get_field_provenance_notes(Fields.JOURNAL)
+    )
+
+    quality_model.reset_snapshot()
+    assert quality_model.snapshot is None
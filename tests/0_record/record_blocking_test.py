@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+"""Tests of the record blocking index"""
+import pandas as pd
+from bib_dedupe.bib_dedupe import block
+from bib_dedupe.bib_dedupe import prep
+
+import colrev.record.record
+import colrev.record.record_blocking
+from colrev.constants import ENTRYTYPES
+from colrev.constants import Fields
+
+# flake8: noqa
+
+RECORDS = [
+    {
+        Fields.ID: "Webster2002",
+        Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+        Fields.AUTHOR: "Webster, Jane and Watson, Richard T.",
+        Fields.TITLE: "Analyzing the past to prepare for the future: Writing a literature review",
+        Fields.JOURNAL: "MIS Quarterly",
+        Fields.YEAR: "2002",
+        Fields.VOLUME: "26",
+        Fields.NUMBER: "2",
+    },
+    {
+        Fields.ID: "Wagner2022",
+        Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+        Fields.AUTHOR: "Wagner, Gerit and Lukyanenko, Roman and Paré, Guy",
+        Fields.TITLE: "Artificial intelligence and the conduct of literature reviews",
+        Fields.JOURNAL: "Journal of Information Technology",
+        Fields.YEAR: "2022",
+        Fields.VOLUME: "37",
+        Fields.NUMBER: "2",
+    },
+    {
+        Fields.ID: "Rai2017",
+        Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+        Fields.AUTHOR: "Rai, Arun",
+        Fields.TITLE: "Editor's comments: Avoiding type III errors",
+        Fields.JOURNAL: "MIS Quarterly",
+        Fields.YEAR: "2017",
+        Fields.VOLUME: "41",
+        Fields.NUMBER: "2",
+    },
+]
+
+
+def test_title_tokens() -> None:
+    assert colrev.record.record_blocking.get_title_tokens(
+        "Analyzing the Past: a Review"
+    ) == {"analyzing", "past", "review"}
+    assert colrev.record.record_blocking.get_title_tokens("UNKNOWN") == set()
+
+
+def test_first_author() -> None:
+    assert (
+        colrev.record.record_blocking.get_first_author(
+            {Fields.AUTHOR: "Paré, Guy and Wagner, Gerit"}
+        )
+        == "pare"
+    )
+    assert (
+        colrev.record.record_blocking.get_first_author({Fields.AUTHOR: "Guy Paré"})
+        == "pare"
+    )
+
+
+def test_blocking_index() -> None:
+    blocking_index = colrev.record.record_blocking.BlockingIndex(RECORDS)
+    assert len(blocking_index) == 3
+
+    query = {
+        Fields.ID: "pdf",
+        Fields.AUTHOR: "Wagner, G. and Lukyanenko, R. and Paré, G.",
+        Fields.TITLE: "Artificial intelligence and the conduct of literature reviews",
+        Fields.JOURNAL: "Journal of Information Technology",
+        Fields.YEAR: "2022",
+    }
+    candidates = blocking_index.get_candidates(query)
+    assert [c[Fields.ID] for c in candidates] == ["Wagner2022"]
+
+    record, similarity = blocking_index.get_most_similar(query)
+    assert record[Fields.ID] == "Wagner2022"  # type: ignore
+    assert similarity == colrev.record.record.Record.get_record_similarity(
+        colrev.record.record.Record(query), colrev.record.record.Record(RECORDS[1])
+    )
+
+    # Year differs (blocked)
+    query[Fields.YEAR] = "2010"
+    assert blocking_index.get_candidates(query) == []
+
+
+def test_block_new_records(mocker) -> None:  # type: ignore
+    """Test that incremental blocking corresponds to bib_dedupe.block()"""
+    records = RECORDS + [
+        {
+            **RECORDS[0],
+            Fields.ID: "Webster2002a",
+            Fields.AUTHOR: "Webster, J. and Watson, R. T.",
+        },
+        {
+            **RECORDS[1],
+            Fields.ID: "Wagner2022a",
+            Fields.TITLE: "Artificial intelligence and the conduct of literature reviews.",
+        },
+        {
+            **RECORDS[2],
+            Fields.ID: "Rai2017a",
+            Fields.TITLE: "Editor's comments: Avoiding type III errors in research",
+        },
+    ]
+    records_df = pd.DataFrame(records)
+    records_df["search_set"] = ""
+    records_df.loc[
+        records_df[Fields.ID].isin(
+            ["Webster2002", "Wagner2022", "Rai2017", "Rai2017a"]
+        ),
+        "search_set",
+    ] = colrev.record.record_blocking.OLD_SEARCH
+    prepared_df = prep(records_df, cpu=1)
+    new_ids = {"Webster2002a", "Wagner2022a"}
+
+    def get_pairs(pairs_df: pd.DataFrame) -> set:
+        return {
+            (frozenset([row["ID1"], row["ID2"]]), row["require_title_overlap"])
+            for row in pairs_df.to_dict(orient="records")
+        }
+
+    expected_df = block(prepared_df, cpu=1)
+    expected_pairs = get_pairs(
+        expected_df[expected_df["ID1"].isin(new_ids) | expected_df["ID2"].isin(new_ids)]
+    )
+    assert (frozenset(["Webster2002", "Webster2002a"]), False) in expected_pairs
+    assert all(pair & new_ids for pair, _ in expected_pairs)
+
+    pairs_df = colrev.record.record_blocking.block_new_records(prepared_df)
+    assert get_pairs(pairs_df) == expected_pairs
+    assert set(expected_df.columns) <= set(pairs_df.columns)
+
+    # Other bib_dedupe versions are blocked with bib_dedupe.block()
+    mocker.patch("colrev.record.record_blocking.version", return_value="0.0.0")
+    pairs_df = colrev.record.record_blocking.block_new_records(prepared_df)
+    assert get_pairs(pairs_df) == expected_pairs
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""Tests of the duplicate clusters (union-find)"""
+import sys
+
+import colrev.record.record_clusters
+
+# pylint: disable=protected-access
+
+
+def test_get_connected_components() -> None:
+    """Test the connected components of id sets"""
+
+    components = colrev.record.record_clusters.get_connected_components(
+        [["c", "a"], ["d", "e"], ["b", "a"], ["x"], ["e", "f", "g"]]
+    )
+    assert components == [["a", "b", "c"], ["d", "e", "f", "g"]]
+
+    clusters = colrev.record.record_clusters.DuplicateClusters()
+    clusters.add("a")
+    assert "a" in clusters
+    assert "b" not in clusters
+    assert clusters.union("a", "b") == clusters.find("b")
+    assert clusters.get_clusters() == [["a", "b"]]
+
+
+class _CountingDict(dict):
+    """Parents dict that counts the lookups of parent IDs"""
+
+    lookups = 0
+
+    def __getitem__(self, key):  # type: ignore
+        self.lookups += 1
+        return super().__getitem__(key)
+
+
+def _get_nr_lookups(nr_ids: int) -> int:
+    # clusters of five IDs, linked in chains (pairs of consecutive IDs)
+    clusters = colrev.record.record_clusters.DuplicateClusters()
+    clusters._parents = _CountingDict()
+    for i in range(nr_ids):
+        if (i + 1) % 5 != 0:
+            clusters.union(f"ID{i:07d}", f"ID{i + 1:07d}")
+    assert len(clusters.get_clusters()) == nr_ids // 5
+    return clusters._parents.lookups
+
+
+def test_get_connected_components_large() -> None:
+    """Test large clusters and the number of lookups (near-linear)"""
+
+    # A chain that exceeds the recursion limit (recursive DFS would fail)
+    nr_ids = sys.getrecursionlimit() * 5
+    chain = [[f"ID{i}", f"ID{i + 1}"] for i in range(nr_ids)]
+    components = colrev.record.record_clusters.get_connected_components(chain)
+    assert len(components) == 1
+    assert len(components[0]) == nr_ids + 1
+
+    # Five times the IDs: linear number of lookups (factor 5) and not quadratic
+    assert _get_nr_lookups(10_000) <= _get_nr_lookups(2_000) * 5
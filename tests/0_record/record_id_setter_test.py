@@ -109,3 +109,49 @@ def test_id_generation_selected(  # type: ignore
 
     actual = id_setter.set_ids(record_dict, selected_ids=["0001"])
     assert "WagnerLukyanenkoPare2022" in actual
+
+
+def test_id_generation_unique(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+) -> None:
+    """Test that generated IDs are unique (case-insensitive)."""
+
+    records = {
+        "wagner2022": {
+            "ID": "wagner2022",
+            "author": "Wagner, G",
+            "year": "2022",
+            Fields.STATUS: RecordState.rev_synthesized,
+        },
+        "0001": {
+            "ID": "0001",
+            "author": "Wagner, G",
+            "year": "2022",
+            Fields.STATUS: RecordState.md_imported,
+        },
+        "0002": {
+            "ID": "0002",
+            "author": "Wagner, Gerit",
+            "year": "2022",
+            Fields.STATUS: RecordState.md_imported,
+        },
+        "Wagner2022a": {
+            "ID": "Wagner2022a",
+            "author": "Wagner, G",
+            "year": "2022",
+            Fields.STATUS: RecordState.md_imported,
+        },
+    }
+
+    id_setter = colrev.record.record_id_setter.IDSetter(
+        id_pattern=IDPattern.first_author_year,
+        skip_local_index=True,
+        logger=base_repo_review_manager.report_logger,
+    )
+    actual = id_setter.set_ids(records)
+    assert sorted(actual.keys()) == [
+        "Wagner2022a",
+        "Wagner2022b",
+        "Wagner2022c",
+        "wagner2022",
+    ]
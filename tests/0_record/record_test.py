@@ -6,6 +6,7 @@ import pytest
 
 import colrev.env.local_index
 import colrev.exceptions as colrev_exceptions
+import colrev.record.qm.quality_model
 import colrev.record.record
 import colrev.record.record_prep
 from colrev.constants import DefectCodes
@@ -6,6 +6,7 @@ from pathlib import Path
 import docker
 
 import colrev.env.docker_manager
+from colrev.constants import Filepaths
 
 
 def continue_test() -> bool:
@@ -19,6 +20,7 @@ def continue_test() -> bool:
 def test_build_docker_image(tmp_path) -> None:  # type: ignore
     def remove_docker_image(image_name: str) -> None:
         client = docker.from_env()
+        colrev.env.docker_manager.DockerManager.invalidate_image(image_name)
         try:
             client.images.remove(image_name)
             print(f"Image '{image_name}' removed successfully.")
@@ -67,3 +69,45 @@ def test_build_docker_image(tmp_path) -> None:  # type: ignore
     )
     remove_docker_container("testimage:latest")
     remove_docker_image("testimage:latest")
+
+
+def test_docker_image_cache(tmp_path, mocker) -> None:  # type: ignore
+    """Test the cache of verified images (no Docker API calls for cached images)"""
+
+    class FakeImage:
+        tags = ["hello-world:latest"]
+
+    fake_client = mocker.Mock()
+    fake_client.images.list.return_value = [FakeImage()]
+    from_env = mocker.patch("docker.from_env", return_value=fake_client)
+    cache_file = tmp_path / "docker_images_cache.json"
+    mocker.patch.object(Filepaths, "DOCKER_IMAGES_CACHE_FILE", cache_file)
+    mocker.patch.object(colrev.env.docker_manager, "_VERIFIED_IMAGES", set())
+    mocker.patch.object(colrev.env.docker_manager, "_PROVISIONED_IMAGES", set())
+    docker_manager = colrev.env.docker_manager.DockerManager
+
+    assert not docker_manager.is_provisioned("hello-world:latest")
+    docker_manager.build_docker_image(imagename="hello-world:latest")
+    docker_manager.build_docker_image(imagename="hello-world:latest")
+    assert 1 == from_env.call_count
+    assert docker_manager.is_provisioned("hello-world:latest")
+    assert cache_file.is_file()
+
+    # Verified images are cached on disk (for other processes)
+    colrev.env.docker_manager._VERIFIED_IMAGES.clear()
+    docker_manager.build_docker_image(imagename="hello-world:latest")
+    assert 1 == from_env.call_count
+
+    # Expired (IMAGE_CACHE_TTL) or invalidated images are checked again
+    colrev.env.docker_manager._VERIFIED_IMAGES.clear()
+    mocker.patch.object(docker_manager, "IMAGE_CACHE_TTL", -1)
+    docker_manager.build_docker_image(imagename="hello-world:latest")
+    assert 2 == from_env.call_count
+    fake_client.images.pull.assert_not_called()
+
+    mocker.patch.object(docker_manager, "IMAGE_CACHE_TTL", 60)
+    docker_manager.invalidate_image("hello-world:latest")
+    docker_manager.build_docker_image(imagename="pandoc/latex:3.2.0")
+    fake_client.images.pull.assert_called_once_with("pandoc/latex:3.2.0")
+    docker_manager.build_docker_image(imagename="hello-world:latest")
+    assert 4 == from_env.call_count
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""Test the keyword matcher"""
+import random
+import string
+import time
+
+import pytest
+
+import colrev.env.keyword_matcher
+import colrev.env.utils
+
+
+def test_keyword_matcher() -> None:
+    """Test the substring, whole-string, and prefix semantics"""
+
+    matcher = colrev.env.keyword_matcher.KeywordMatcher(
+        substrings=["about our authors", "index of", "index of authors"],
+        strings=["editorial", "Contents"],
+        prefixes=["abstracts", "poster session"],
+    )
+
+    assert matcher.matches("About our Authors")
+    assert matcher.matches("An index of authors (2020)")
+    assert matcher.matches("editorial")
+    assert matcher.matches("contents")
+    assert matcher.matches("Abstracts of the conference")
+    assert matcher.matches("Poster Session 1")
+    assert not matcher.matches("An editorial perspective on digital platforms")
+    assert not matcher.matches("Conference abstracts")
+    assert not matcher.matches("Digital platforms and the future of work")
+    assert not matcher.matches("")
+
+    assert not colrev.env.keyword_matcher.KeywordMatcher().matches("editorial")
+    case_sensitive_matcher = colrev.env.keyword_matcher.KeywordMatcher(
+        substrings=["MIS"], case_sensitive=True
+    )
+    assert case_sensitive_matcher.matches("MIS Quarterly")
+    assert not case_sensitive_matcher.matches("mis quarterly")
+    assert colrev.env.keyword_matcher.KeywordMatcher(substrings=["a+b (c)"]).matches(
+        "x a+b (c) y"
+    )
+
+
+def test_keyword_matcher_complementary_materials() -> None:
+    """Test the matcher against the keyword scans (complementary materials)"""
+
+    keywords = colrev.env.utils.load_complementary_material_keywords()
+    strings = colrev.env.utils.load_complementary_material_strings()
+    prefixes = colrev.env.utils.load_complementary_material_prefixes()
+    matcher = colrev.env.keyword_matcher.KeywordMatcher(
+        substrings=keywords, strings=strings, prefixes=prefixes
+    )
+    titles = (
+        [keyword.upper() for keyword in keywords + strings + prefixes]
+        + [f"A review: {keyword} (revisited)" for keyword in keywords + strings]
+        + [f"{prefix} 2020" for prefix in prefixes]
+        + ["Digital platforms and the future of work"]
+    )
+    for title in titles:
+        expected = (
+            any(keyword in title.lower() for keyword in keywords)
+            or any(string == title.lower() for string in strings)
+            or any(title.lower().startswith(prefix) for prefix in prefixes)
+        )
+        assert expected == matcher.matches(title)
+
+
+@pytest.mark.slow
+def test_keyword_matcher_benchmark() -> None:
+    """Benchmark: 100k titles (runtime grows slowly with the number of keywords)
+
+    Timing-based: only runs with --slow"""
+
+    rng = random.Random(0)
+    words = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9)))
+        for _ in range(5000)
+    ]
+    titles = [" ".join(rng.choices(words, k=12)) for _ in range(100_000)]
+    keywords = [" ".join(rng.choices(words, k=2)) for _ in range(500)]
+
+    matcher = colrev.env.keyword_matcher.KeywordMatcher(substrings=keywords)
+    start_time = time.perf_counter()
+    matches = [matcher.matches(title) for title in titles]
+    matcher_runtime = time.perf_counter() - start_time
+
+    # Keyword scans (on a tenth of the titles)
+    start_time = time.perf_counter()
+    expected = [
+        any(keyword in title.lower() for keyword in keywords)
+        for title in titles[:10_000]
+    ]
+    scan_runtime = (time.perf_counter() - start_time) * 10
+
+    assert expected == matches[:10_000]
+    assert matcher_runtime < scan_runtime / 2
@@ -123,6 +123,37 @@ def test_compute_language(
     assert expected_lang == predicted_lang
 
 
+def test_compute_languages(
+    language_service: colrev.env.language_service.LanguageService,
+) -> None:
+    """Test the compute_languages (batch and cache)"""
+    texts = [
+        "An Integrated Framework for Understanding Digital Work in Organizations",
+        "Editorial",
+        "ελληνικά",
+        "Maxillary Implant Prosthodontic Treatment Using Digital Laboratory Protocol for a Patient with Epidermolysis Bullosa: A Case History Report",
+        "Ein integriertes Rahmenwerk für das Verständnis digitaler Arbeit in Organisationen",
+    ]
+    expected = [language_service.compute_language(text=text) for text in texts]
+    colrev.env.language_service._LANGUAGE_CACHE.clear()
+
+    assert language_service.compute_languages(texts=texts) == expected
+    assert (
+        "an integrated framework for understanding digital work in organizations"
+        in colrev.env.language_service._LANGUAGE_CACHE
+    )
+
+    # The detector is shared (and the cache is used)
+    other_language_service = colrev.env.language_service.LanguageService()
+    assert (
+        other_language_service._lingua_language_detector
+        is language_service._lingua_language_detector
+    )
+    assert (
+        other_language_service.compute_language(text="  " + texts[-1].upper()) == "deu"
+    )
+
+
 @pytest.mark.parametrize(
     "language_code, expected",
     [
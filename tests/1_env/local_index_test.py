@@ -1,12 +1,15 @@
 #!/usr/bin/env python
 """Test the local_index"""
+import pandas as pd
 import pytest
 
 import colrev.env.local_index
+import colrev.env.local_index_sqlite
 import colrev.env.tei_parser
 import colrev.review_manager
 from colrev.constants import ENTRYTYPES
 from colrev.constants import Fields
+from colrev.constants import Filepaths
 from colrev.constants import RecordState
 
 # pylint: disable=line-too-long
@@ -39,7 +42,46 @@ def test_get_fields_to_remove(local_index) -> None:  # type: ignore
     assert expected == actual
 
 
-# TODO get_journal_rankings
+def test_get_journal_rankings(local_index, tmp_path, mocker) -> None:  # type: ignore
+    """Test get_journal_rankings() (loaded once, normalized journal names)"""
+
+    mocker.patch.object(
+        Filepaths, "LOCAL_INDEX_SQLITE_FILE", tmp_path / "sqlite_index_test.db"
+    )
+    colrev.env.local_index_sqlite.SQLiteIndexRankings().insert_df(
+        pd.DataFrame(
+            [
+                ["MIS Quarterly", None, "FT-50", "no"],
+                ["MIS Quarterly", None, "UT Dallas 24", "no"],
+                ["Information & Management", None, "VHB-JQ3", "no"],
+                ["Journal of Predatory Studies", None, "Beall", "yes"],
+            ],
+            columns=["journal_name", "impact_factor", "ranking", "predatory"],
+        )
+    )
+    colrev.env.local_index.LocalIndex.reset_journal_rankings()
+    select_all = mocker.spy(
+        colrev.env.local_index_sqlite.SQLiteIndexRankings, "select_all"
+    )
+
+    rankings = local_index.get_journal_rankings("MIS Quarterly")
+    assert ["FT-50", "UT Dallas 24"] == [r["ranking"] for r in rankings]
+    assert rankings == local_index.get_journal_rankings("mis  quarterly.")
+    assert ["VHB-JQ3"] == [
+        r["ranking"]
+        for r in local_index.get_journal_rankings("Information and Management")
+    ]
+    assert [] == local_index.get_journal_rankings("Unknown Journal")
+    assert 1 == select_all.call_count
+
+    # The sqlite index is queried on the normalized journal name
+    assert ["yes"] == [
+        r["predatory"]
+        for r in colrev.env.local_index_sqlite.SQLiteIndexRankings().select(
+            journal="JOURNAL OF PREDATORY STUDIES"
+        )
+    ]
+    colrev.env.local_index.LocalIndex.reset_journal_rankings()
 
 
 def test_get_year_from_toc(local_index) -> None:  # type: ignore
@@ -1,5 +1,14 @@
 #!/usr/bin/env python
 """Tests for the colrev package manager"""
+import subprocess
+import sys
+
+import pytest
+
+import colrev.package_manager.package_manager
+from colrev.constants import EndpointType
+from colrev.constants import Filepaths
+
 # @pytest.fixture
 # def settings() -> colrev.settings.Settings:
 #     """Fixture returning a settings object"""
@@ -362,3 +371,141 @@
 #     )
 #     print(cls)
 #     raise Exception
+
+
+def test_endpoint_registry_cache(tmp_path, mocker) -> None:  # type: ignore
+    """Test the endpoint registry (cached on disk, keyed by the distributions)"""
+
+    cache_file = tmp_path / "endpoint_registry_cache.json"
+    mocker.patch.object(Filepaths, "ENDPOINT_REGISTRY_CACHE_FILE", cache_file)
+    registry = colrev.package_manager.package_manager._TYPE_IDENTIFIER_ENDPOINT_DICT
+    mocker.patch.dict(registry, clear=True)
+
+    package_manager = colrev.package_manager.package_manager.PackageManager()
+    endpoints = package_manager.discover_installed_packages(
+        package_type=EndpointType.search_source
+    )
+    assert "colrev.crossref" in endpoints
+    assert cache_file.is_file()
+
+    # Loaded from the cache (without discovering the distributions)
+    registry.clear()
+    discover = mocker.patch.object(
+        package_manager, "_discover_type_identifier_endpoint_dict"
+    )
+    assert (
+        package_manager.discover_installed_packages(
+            package_type=EndpointType.search_source
+        )
+        == endpoints
+    )
+    discover.assert_not_called()
+
+    # Invalidated when the installed distributions change
+    registry.clear()
+    mocker.patch.object(
+        colrev.package_manager.package_manager,
+        "_get_distributions_fingerprint",
+        return_value="changed",
+    )
+    discover.return_value = {endpoint_type: {} for endpoint_type in EndpointType}
+    package_manager.discover_installed_packages(package_type=EndpointType.search_source)
+    discover.assert_called_once()
+
+
+def test_cli_lazy_imports() -> None:
+    """Test that heavy modules are not imported at cli startup"""
+
+    heavy_modules = ["pandas", "colrev.review_manager", "inquirer", "click_repl"]
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; import colrev.ui_cli.cli; "
+            "colrev.ui_cli.cli.main(['status', '--help'], standalone_mode=False); "
+            f"print([m for m in {heavy_modules} if m in sys.modules])",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip().splitlines()[-1] == "[]"
+
+
+def test_status_lazy_imports() -> None:
+    """Test that the modules of the status command do not import heavy modules"""
+
+    status_modules = [
+        "colrev.review_manager",
+        "colrev.ops.status",
+        "colrev.ops.checker",
+        "colrev.ops.advisor",
+        "colrev.ops.data",
+        "colrev.package_manager.package_manager",
+        "colrev.ui_cli.cli_status_printer",
+    ]
+    heavy_modules = [
+        "pandas",
+        "pymupdf",
+        "requests",
+        "requests_cache",
+        "bib_dedupe",
+        "lingua",
+        "docker",
+        "lxml",
+        "nameparser",
+        "rapidfuzz",
+        "dictdiffer",
+        "jinja2",
+        "tqdm",
+    ]
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, importlib; "
+            f"[importlib.import_module(m) for m in {status_modules}]; "
+            f"print([m for m in {heavy_modules} if m in sys.modules])",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "[]"
+
+
+@pytest.mark.parametrize(
+    "outdated_endpoint",
+    [
+        # Renamed class (AttributeError)
+        "colrev.packages.crossref.src.crossref_search_source:RenamedSearchSource",
+        # Moved module (ImportError)
+        "colrev.packages.crossref.src.moved_search_source:CrossrefSearchSource",
+        # Class that does not implement the interface (MissingDependencyError)
+        "colrev.constants:Fields",
+    ],
+)
+def test_endpoint_registry_cache_outdated(  # type: ignore
+    outdated_endpoint: str, tmp_path, mocker
+) -> None:
+    """Test that outdated endpoints of the registry cache are discovered again"""
+
+    cache_file = tmp_path / "endpoint_registry_cache.json"
+    mocker.patch.object(Filepaths, "ENDPOINT_REGISTRY_CACHE_FILE", cache_file)
+    registry = colrev.package_manager.package_manager._TYPE_IDENTIFIER_ENDPOINT_DICT
+    mocker.patch.dict(registry, clear=True)
+
+    package_manager = colrev.package_manager.package_manager.PackageManager()
+    endpoints = package_manager.discover_installed_packages(
+        package_type=EndpointType.search_source
+    )
+    assert cache_file.is_file()
+    endpoints["colrev.crossref"] = outdated_endpoint
+
+    endpoint_class = package_manager.get_package_endpoint_class(
+        package_type=EndpointType.search_source,
+        package_identifier="colrev.crossref",
+    )
+    assert endpoint_class.__name__ == "CrossrefSearchSource"
+    assert "colrev.crossref" not in endpoints
+    assert not cache_file.is_file()
@@ -1818,6 +1818,42 @@ def test_tei_mark_references(tei_doc, tmp_path) -> None:  # type: ignore
     assert "NOT_INCLUDED" not in actual
 
 
+def test_tei_mark_references_sample(tei_doc, tmp_path) -> None:  # type: ignore
+    """Test the marking of references (blocking index) against a larger sample"""
+
+    tei_doc.tei_path = tmp_path / Path("test.tei.xml")
+    records = {
+        f"R{i}": {
+            Fields.ID: f"R{i}",
+            Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+            Fields.STATUS: RecordState.rev_included,
+            Fields.TITLE: f"Digital platform ecosystems and governance case {i}",
+            Fields.JOURNAL: "Information Systems Research",
+            Fields.AUTHOR: f"Author{i}, A.",
+            Fields.YEAR: str(1990 + i % 30),
+        }
+        for i in range(2000)
+    }
+    records["TEST_ID"] = {
+        Fields.ID: "TEST_ID",
+        Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+        Fields.STATUS: RecordState.rev_synthesized,
+        Fields.TITLE: "What constitutes a theoretical contribution?",
+        Fields.JOURNAL: "Academy of Management Review",
+        Fields.AUTHOR: "Whetten, D. A",
+        Fields.YEAR: "1989",
+        Fields.VOLUME: "14",
+        Fields.NUMBER: "4",
+    }
+    tei_doc.mark_references(records=records)
+    actual = tei_doc.get_tei_str()
+    assert '<biblStruct xml:id="b118" ID="TEST_ID">' in actual
+    assert actual.count('ID="TEST_ID"') == 1 + tei_doc.get_tei_str().count(
+        'target="#b118"'
+    )
+    assert 'ID="R' not in actual
+
+
 def test_tei_exception(tmp_path) -> None:  # type: ignore
     tei_path = tmp_path / Path("erroneous_tei.tei.xml")
 
@@ -44,6 +44,28 @@ def test_inplace_change() -> None:
         assert file.read() == "Another content."
 
 
+def test_inplace_change_values(tmp_path) -> None:  # type: ignore
+    bib_file = tmp_path / Path("pdfs.bib")
+    bib_file.write_text(
+        "@article{0001,\n  file = {data/pdfs/a.pdf},\n}\n\n"
+        "@article{0002,\n  file = {data/pdfs/b.pdf},\n}\n",
+        encoding="utf-8",
+    )
+
+    # Simultaneous replacements (the new path of a is the old path of b)
+    colrev.env.utils.inplace_change_values(
+        filename=bib_file,
+        replacements={
+            "data/pdfs/a.pdf": "data/pdfs/b.pdf",
+            "data/pdfs/b.pdf": "data/pdfs/c.pdf",
+        },
+    )
+    assert bib_file.read_text(encoding="utf-8") == (
+        "@article{0001,\n  file = {data/pdfs/b.pdf},\n}\n\n"
+        "@article{0002,\n  file = {data/pdfs/c.pdf},\n}\n"
+    )
+
+
 def test_remove_accents() -> None:
 
     assert colrev.env.utils.remove_accents("éàèùç") == "eaeuc"
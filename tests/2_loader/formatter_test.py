@@ -57,6 +57,24 @@ class LoadFormatterTests(unittest.TestCase):
         self.assertEqual(record.data[Fields.LANGUAGE], "eng")
         self.assertEqual(record.data[Fields.NUMBER], "1")
 
+    def test_unescape_field_values(self) -> None:
+        record = Record(
+            {
+                Fields.STATUS: RecordState.md_retrieved,
+                "title": 'Caf{\\\'e} \\emph{M\\"uller} \\& {\\"O}ffentlichkeit &lt;b&gt;',
+                "journal": "Plain <i>journal</i>",
+                "abstract": 'A "quoted" abstract',
+                "url": "https://www.example.com/\\&amp;",
+            }
+        )
+
+        self.load_formatter.run(record=record)
+
+        self.assertEqual(record.data["title"], "Café {Müller} & Öffentlichkeit")
+        self.assertEqual(record.data["journal"], "Plain journal")
+        self.assertEqual(record.data["abstract"], 'A "quoted" abstract')
+        self.assertEqual(record.data["url"], "https://www.example.com/\\&amp;")
+
 
 if __name__ == "__main__":
     unittest.main()
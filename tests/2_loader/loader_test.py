@@ -6,7 +6,9 @@ from pathlib import Path
 
 import pytest
 
+import colrev.loader.bib
 import colrev.loader.load_utils
+import colrev.loader.load_utils_name_formatter
 import colrev.review_manager
 import colrev.settings
 
@@ -51,3 +53,35 @@ def test_load(tmp_path, helpers) -> None:  # type: ignore
 
     with pytest.raises(NotImplementedError):
         colrev.loader.load_utils.loads(load_string="content...", implementation="xy")
+
+
+def test_get_nr_records_cache(tmp_path, monkeypatch) -> None:  # type: ignore
+    """Test the cached record counts (invalidated when the file changes)"""
+    monkeypatch.chdir(tmp_path)
+    csv_file = Path("records.csv")
+    csv_file.write_text(
+        'ID,title\n1,"A multi-\nline title"\n\n2,Second\n', encoding="utf-8"
+    )
+    assert 2 == colrev.loader.load_utils.get_nr_records(csv_file)
+    assert 2 == colrev.loader.load_utils.get_nr_records(csv_file)
+
+    csv_file.write_text("ID,title\n1,First\n2,Second\n3,Third\n", encoding="utf-8")
+    assert 3 == colrev.loader.load_utils.get_nr_records(csv_file)
+
+
+def test_parse_names() -> None:
+    """Test the (cached) name parsing"""
+    parse_names = colrev.loader.load_utils_name_formatter.parse_names
+    parse_names.cache_clear()
+
+    assert (
+        parse_names("Jan vom Brocke and Wil M. P. van der Aalst; Guy Pare")
+        == "vom Brocke, Jan and van der Aalst, Wil M. P. and Pare, Guy"
+    )
+    assert parse_names("Wagner, Gerit and Pare, Guy") == "Wagner, Gerit and Pare, Guy"
+    assert parse_names("{The CoLRev Team}") == "{The CoLRev Team}"
+    assert (
+        parse_names("Jan vom Brocke and Wil M. P. van der Aalst; Guy Pare")
+        == "vom Brocke, Jan and van der Aalst, Wil M. P. and Pare, Guy"
+    )
+    assert parse_names.cache_info().hits == 1
@@ -1,9 +1,15 @@
 import logging
 import os
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
 from pathlib import Path
 
 import pytest
 
+import colrev.env.grobid_service
+import colrev.loader.md
 import colrev.review_manager
 import colrev.settings
 from colrev.constants import SearchType
@@ -134,3 +140,86 @@ def test_load_md(  # type: ignore
 
     nr_records = colrev.loader.load_utils.get_nr_records(Path("data/search/md_data.md"))
     assert 6 == nr_records
+
+
+class _GrobidStubHandler(BaseHTTPRequestHandler):
+    """Stub for the GROBID citation endpoints (title: reference string)"""
+
+    requests: list = []
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        """Parse the citations"""
+        length = int(self.headers["Content-Length"])
+        form = urllib.parse.parse_qs(self.rfile.read(length).decode("utf-8"))
+        citations = form["citations"]
+        self.requests.append((self.path, len(citations)))
+        if self.path == "/api/processCitationList":
+            keys = [str(i) for i in range(len(citations))]
+        else:
+            keys = ["-1"]
+        body = "\n".join(
+            f"@article{{{key},\n  title = {{{citation}}},\n  year = {{2020}}\n}}\n"
+            for key, citation in zip(keys, citations)
+        )
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write(body.encode("utf-8"))
+
+    def log_message(self, format, *args) -> None:  # type: ignore # pylint: disable=redefined-builtin
+        """Do not log requests"""
+
+
+def test_load_md_batched(tmp_path, mocker) -> None:  # type: ignore
+    """Test the batched (and cached) parsing of reference lists"""
+
+    server = ThreadingHTTPServer(("localhost", 0), _GrobidStubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    mocker.patch.object(
+        colrev.env.grobid_service.GrobidService, "__init__", return_value=None
+    )
+    mocker.patch.object(
+        colrev.env.grobid_service.GrobidService,
+        "GROBID_URL",
+        f"http://localhost:{server.server_address[1]}",
+    )
+    mocker.patch.object(
+        colrev.env.grobid_service.GrobidService,
+        "check_grobid_availability",
+        return_value=True,
+    )
+    mocker.patch.dict(
+        colrev.loader.md._BIBTEX_CACHE, clear=True  # pylint: disable=protected-access
+    )
+    _GrobidStubHandler.requests = []
+
+    references = [f"Author A (2020) Reference title {i}." for i in range(1, 121)]
+    filename = tmp_path / Path("references.md")
+    filename.write_text(
+        "# References\n" + "\n".join(references) + "\n\n" + references[0] + "\n",
+        encoding="utf-8",
+    )
+
+    try:
+        records = colrev.loader.load_utils.load(
+            filename=filename, logger=logging.getLogger(__name__)
+        )
+        assert len(records) == 121
+        assert records["1"]["title"] == "Author A (2020) Reference title 1."
+        assert records["120"]["title"] == "Author A (2020) Reference title 120."
+        assert records["122"]["title"] == "Author A (2020) Reference title 1."
+        # 120 unique references in chunks of 50
+        assert sorted(_GrobidStubHandler.requests) == [
+            ("/api/processCitationList", 20),
+            ("/api/processCitationList", 50),
+            ("/api/processCitationList", 50),
+        ]
+
+        # Cached: no further requests
+        records = colrev.loader.load_utils.load(
+            filename=filename, logger=logging.getLogger(__name__)
+        )
+        assert len(records) == 121
+        assert len(_GrobidStubHandler.requests) == 3
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -5,6 +5,8 @@ import typing
 from pathlib import Path
 
 import colrev.review_manager
+from colrev.constants import Fields
+from colrev.constants import RecordState
 from colrev.constants import SearchType
 
 
@@ -66,3 +68,71 @@ def test_checks(  # type: ignore
             },
         ]
         assert expected == actual
+
+
+def test_check_repo_staged(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, helpers
+) -> None:
+    """Test the checks of the staged changes"""
+
+    helpers.reset_commit(base_repo_review_manager, commit="prep_commit")
+    checker = colrev.ops.checker.Checker(review_manager=base_repo_review_manager)
+
+    # No staged changes
+    expected = {"status": 0, "msg": "Everything ok."}
+    assert expected == checker.check_repo_staged()
+
+    records = base_repo_review_manager.dataset.load_records_dict()
+    record_id = list(records.keys())[0]
+    records[record_id][Fields.SCREENING_CRITERIA] = "criterion=in"
+    base_repo_review_manager.dataset.save_records_dict(records)
+    base_repo_review_manager.update_status_yaml()
+
+    actual = checker.check_repo_staged()
+    assert 1 == actual["status"]
+    assert f"{record_id}: screen_crit != NA" in actual["msg"]
+
+    del records[record_id][Fields.SCREENING_CRITERIA]
+    base_repo_review_manager.dataset.save_records_dict(records)
+    base_repo_review_manager.update_status_yaml()
+    assert expected == checker.check_repo_staged()
+
+    # Added record with the origin of an unchanged record
+    records[record_id + "_copy"] = {
+        **records[record_id],
+        Fields.ID: record_id + "_copy",
+    }
+    base_repo_review_manager.dataset.save_records_dict(records)
+    base_repo_review_manager.update_status_yaml()
+
+    actual = checker.check_repo_staged()
+    assert 1 == actual["status"]
+    assert "Non-unique origins" in actual["msg"]
+
+    helpers.reset_commit(base_repo_review_manager, commit="prep_commit")
+
+
+def test_check_repo_staged_status_file(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, helpers, mocker
+) -> None:
+    """Test that the full check is run when the staged status.yaml is outdated"""
+
+    helpers.reset_commit(base_repo_review_manager, commit="prep_commit")
+    checker = colrev.ops.checker.Checker(review_manager=base_repo_review_manager)
+    check_repo = mocker.spy(checker, "check_repo")
+
+    records = base_repo_review_manager.dataset.load_records_dict()
+    record_id = list(records.keys())[0]
+    records[record_id][Fields.STATUS] = RecordState.md_needs_manual_preparation
+
+    # status.yaml is not updated
+    base_repo_review_manager.dataset.save_records_dict(records)
+    checker.check_repo_staged()
+    assert check_repo.call_count == 1
+
+    # status.yaml is updated
+    base_repo_review_manager.update_status_yaml()
+    checker.check_repo_staged()
+    assert check_repo.call_count == 1
+
+    helpers.reset_commit(base_repo_review_manager, commit="prep_commit")
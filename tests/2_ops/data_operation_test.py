@@ -10,3 +10,27 @@ def test_data_custom_script(  # type: ignore
 
     data_operation = base_repo_review_manager.get_data_operation()
     data_operation.setup_custom_script()
+
+
+def test_data_silent_mode_without_docker(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, helpers, mocker
+) -> None:
+    """Test that the data endpoints do not call Docker in silent mode (pre-commit hooks)"""
+
+    helpers.reset_commit(base_repo_review_manager, commit="data_commit")
+    mocker.patch.object(
+        colrev.review_manager.ReviewManager, "in_ci_environment", return_value=False
+    )
+    from_env = mocker.patch("docker.from_env")
+
+    data_operation = base_repo_review_manager.get_data_operation()
+    base_repo_review_manager.settings.data.data_package_endpoints = [
+        {"endpoint": "colrev.prisma", "version": "0.1"},
+        {"endpoint": "colrev.paper_md", "version": "0.1"},
+    ]
+    data_operation.main(silent_mode=True)
+
+    from_env.assert_not_called()
+
+    base_repo_review_manager.settings.data.data_package_endpoints = []
+    helpers.reset_commit(base_repo_review_manager, commit="data_commit")
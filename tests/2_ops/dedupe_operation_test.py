@@ -7,6 +7,8 @@ from pathlib import Path
 import pytest
 
 import colrev.review_manager
+from colrev.constants import Fields
+from colrev.constants import RecordState
 
 
 @pytest.fixture(scope="session", name="dedupe_test_setup")
@@ -106,3 +108,84 @@ def test_dedupe_skip_prescreen(
     dedupe_test_setup.settings.prescreen.prescreen_package_endpoints = []
     dedupe_operation.main()
     # TODO : add testing of results
+
+
+class _CountingDict(dict):
+    """Records dict that counts the lookups of records"""
+
+    lookups = 0
+
+    def __getitem__(self, key):  # type: ignore
+        self.lookups += 1
+        return super().__getitem__(key)
+
+
+def test_apply_merges_chained(  # type: ignore
+    dedupe_test_setup: colrev.review_manager.ReviewManager, mocker
+) -> None:
+    """Test the resolution of chained merges (and the number of record lookups)"""
+
+    dedupe_operation = dedupe_test_setup.get_dedupe_operation(
+        notify_state_transition_operation=False
+    )
+    saved_records: dict = {}
+
+    def get_records(nr_records: int) -> _CountingDict:
+        return _CountingDict(
+            {
+                f"ID{i:07d}": {
+                    Fields.ID: f"ID{i:07d}",
+                    Fields.ENTRYTYPE: "article",
+                    Fields.TITLE: "Literature reviews in information systems",
+                    Fields.ORIGIN: [f"source.bib/{i:07d}"],
+                    Fields.STATUS: RecordState.md_prepared,
+                    Fields.MD_PROV: {},
+                    Fields.D_PROV: {},
+                }
+                for i in range(nr_records)
+            }
+        )
+
+    def apply_merges(records: dict, id_sets: list) -> dict:
+        mocker.patch.object(
+            dedupe_test_setup.dataset, "load_records_dict", return_value=records
+        )
+        mocker.patch.object(
+            dedupe_test_setup.dataset,
+            "save_records_dict",
+            side_effect=saved_records.update,
+        )
+        saved_records.clear()
+        dedupe_operation.apply_merges(id_sets=id_sets)
+        return saved_records
+
+    merged_records = apply_merges(
+        get_records(6),
+        [
+            ["ID0000001", "ID0000000"],
+            ["ID0000002", "ID0000001"],
+            ["ID0000000", "ID0000002"],
+            ["ID0000003", "ID0000004", "ID0000005"],
+        ],
+    )
+    assert list(merged_records) == ["ID0000002", "ID0000005"]
+    assert sorted(merged_records["ID0000002"][Fields.ORIGIN]) == [
+        "source.bib/0000000",
+        "source.bib/0000001",
+        "source.bib/0000002",
+    ]
+
+    # Clusters of five records (chained id sets)
+    def get_nr_lookups(nr_records: int) -> int:
+        records = get_records(nr_records)
+        id_sets = [
+            [f"ID{i:07d}", f"ID{i + 1:07d}"]
+            for i in range(nr_records - 1)
+            if (i + 1) % 5 != 0
+        ]
+        merged_records = apply_merges(records, id_sets)
+        assert len(merged_records) == nr_records // 5
+        return records.lookups
+
+    # Five times the records: linear number of lookups (not quadratic)
+    assert get_nr_lookups(2_500) <= get_nr_lookups(500) * 5
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""Tests of the CoLRev load operation"""
+import json
+from multiprocessing.pool import ThreadPool as Pool
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import colrev.exceptions as colrev_exceptions
+import colrev.review_manager
+from colrev.constants import Fields
+
+# pylint: disable=protected-access
+
+
+def test_ensure_append_only(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, helpers
+) -> None:
+    """Test the append-only check of search files"""
+    helpers.reset_commit(base_repo_review_manager, commit="data_commit")
+    load_operation = base_repo_review_manager.get_load_operation()
+
+    search_file = base_repo_review_manager.path / Path("data/search/append_only.bib")
+    search_file.write_text("@article{0001,\n}\n", encoding="utf-8")
+    base_repo_review_manager.dataset.add_changes(search_file)
+    base_repo_review_manager.dataset.create_commit(msg="add search file")
+    load_operation.ensure_append_only(search_file)
+    assert base_repo_review_manager.paths.append_only_digests.is_file()
+
+    search_file.write_text("@article{0001,\n}\n\n@article{0002,\n}\n", encoding="utf-8")
+    load_operation.ensure_append_only(search_file)
+    base_repo_review_manager.dataset.add_changes(search_file)
+    base_repo_review_manager.dataset.create_commit(msg="append to search file")
+    load_operation.ensure_append_only(search_file)
+
+    search_file.write_text("@article{0003,\n}\n", encoding="utf-8")
+    with pytest.raises(colrev_exceptions.AppendOnlyViolation):
+        load_operation.ensure_append_only(search_file)
+
+    base_repo_review_manager.dataset.add_changes(search_file)
+    base_repo_review_manager.dataset.create_commit(msg="change search file")
+    with pytest.raises(colrev_exceptions.AppendOnlyViolation):
+        load_operation.ensure_append_only(search_file)
+
+    base_repo_review_manager.paths.append_only_digests.unlink()
+
+
+def test_ensure_append_only_parallel(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, helpers
+) -> None:
+    """Test the append-only check of search files loaded in parallel"""
+    helpers.reset_commit(base_repo_review_manager, commit="data_commit")
+    load_operation = base_repo_review_manager.get_load_operation()
+
+    search_files = []
+    for ind in range(8):
+        search_file = base_repo_review_manager.path / Path(
+            f"data/search/append_only_{ind}.bib"
+        )
+        search_file.write_text(f"@article{{000{ind},\n}}\n", encoding="utf-8")
+        base_repo_review_manager.dataset.add_changes(search_file)
+        search_files.append(search_file)
+    base_repo_review_manager.dataset.create_commit(msg="add search files")
+
+    pool = Pool(8)
+    pool.map(load_operation.ensure_append_only, search_files)
+    pool.close()
+    pool.join()
+
+    with open(
+        base_repo_review_manager.paths.append_only_digests, encoding="utf-8"
+    ) as file:
+        digests = json.load(file)
+    assert {f"data/search/{f.name}" for f in search_files} <= digests.keys()
+
+    base_repo_review_manager.paths.append_only_digests.unlink()
+
+
+def test_import_source_records_skips_source(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, mocker
+) -> None:
+    """Test that an ImportException only skips the records of its source"""
+    load_operation = base_repo_review_manager.get_load_operation()
+
+    def import_record(*, record_dict: dict) -> dict:
+        if record_dict[Fields.ID] == "invalid":
+            raise colrev_exceptions.ImportException("Invalid record")
+        return record_dict
+
+    mocker.patch.object(load_operation, "_import_record", side_effect=import_record)
+    sources = [
+        SimpleNamespace(
+            search_source=SimpleNamespace(
+                filename=Path(f"data/search/{filename}.bib"),
+                source_records_list=[{Fields.ID: record_id} for record_id in ids],
+            )
+        )
+        for filename, ids in [("valid", ["0001", "0002"]), ("other", ["invalid"])]
+    ]
+    imported_records = load_operation._import_source_records(sources)  # type: ignore
+    assert imported_records == {
+        "data/search/valid.bib": [{Fields.ID: "0001"}, {Fields.ID: "0002"}]
+    }
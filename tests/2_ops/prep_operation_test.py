@@ -1,6 +1,13 @@
 #!/usr/bin/env python
 """Tests of the CoLRev prep operation"""
+import zope.interface
+
+import colrev.package_manager.interfaces
+import colrev.record.record_prep
 import colrev.review_manager
+from colrev.constants import Fields
+
+# pylint: disable=protected-access
 
 
 def test_prep(  # type: ignore
@@ -46,3 +53,30 @@ def test_prep_with_polish_flag(  # type: ignore
     prep_operation.main()
 
     # Assertions can be added here based on expected outcomes
+
+
+def test_prep_prefetch(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, mocker
+) -> None:
+    """Test that records are prefetched by endpoints that provide the interface"""
+
+    @zope.interface.implementer(colrev.package_manager.interfaces.PrepPrefetchInterface)
+    class PrefetchPrep:  # pylint: disable=too-few-public-methods
+        """Prep endpoint that prefetches records"""
+
+        prefetch = mocker.Mock()
+
+    class OtherPrep:  # pylint: disable=too-few-public-methods
+        """Prep endpoint with a prefetch method (without the interface)"""
+
+        prefetch = mocker.Mock()
+
+    prep_operation = base_repo_review_manager.get_prep_operation()
+    prep_operation.prep_package_endpoints = {
+        "prefetch_prep": PrefetchPrep(),
+        "other_prep": OtherPrep(),
+    }
+    records = [colrev.record.record_prep.PrepRecord({Fields.ID: "0001"})]
+    prep_operation._prefetch([{"record": record} for record in records])
+    PrefetchPrep.prefetch.assert_called_once_with(records)
+    OtherPrep.prefetch.assert_not_called()
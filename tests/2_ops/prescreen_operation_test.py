@@ -1,6 +1,11 @@
 #!/usr/bin/env python
 """Tests of the CoLRev prescreen operation"""
+from pathlib import Path
+
+import colrev.packages.screen_utils
 import colrev.review_manager
+from colrev.constants import Fields
+from colrev.constants import RecordState
 
 
 def test_prescreen(  # type: ignore
@@ -18,3 +23,70 @@ def test_prescreen(  # type: ignore
 
     helpers.reset_commit(base_repo_review_manager, commit="dedupe_commit")
     prescreen_operation.setup_custom_script()
+
+
+def test_read_table_csv_bom(tmp_path: Path) -> None:
+    """Test reading a csv table that starts with a byte order mark (Excel)"""
+
+    table_path = tmp_path / "prescreen.csv"
+    table_path.write_text(
+        "ID,presceen_inclusion\nSmith2020,in\nJones2019,\n", encoding="utf-8-sig"
+    )
+    assert table_path.read_bytes().startswith(b"\xef\xbb\xbf")
+    rows = list(colrev.packages.screen_utils.read_table(table_path))
+    assert rows == [
+        {Fields.ID: "Smith2020", "presceen_inclusion": "in"},
+        {Fields.ID: "Jones2019", "presceen_inclusion": ""},
+    ]
+
+
+def test_prescreen_table(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, helpers
+) -> None:
+    """Test the prescreen table (export and import)"""
+
+    helpers.reset_commit(
+        review_manager=base_repo_review_manager, commit="dedupe_commit"
+    )
+    prescreen_operation = base_repo_review_manager.get_prescreen_operation()
+    records = base_repo_review_manager.dataset.load_records_dict()
+    to_prescreen = sorted(
+        record_id
+        for record_id, record in records.items()
+        if record[Fields.STATUS] == RecordState.md_processed
+    )
+    assert to_prescreen
+
+    for export_table_format in ["csv", "xlsx"]:
+        table_path = Path(f"prescreen.{export_table_format}")
+        prescreen_operation.export_table(export_table_format=export_table_format)
+        rows = list(colrev.packages.screen_utils.read_table(table_path))
+        assert sorted(row[Fields.ID] for row in rows) == to_prescreen
+        assert all(row["presceen_inclusion"] == "TODO" for row in rows)
+        table_path.unlink()
+
+    table_path = Path("prescreen.csv")
+    colrev.packages.screen_utils.write_table(
+        [
+            {Fields.ID: to_prescreen[0], "presceen_inclusion": "out"},
+            {Fields.ID: "NOT_IN_RECORDS", "presceen_inclusion": "in"},
+        ]
+        + [
+            {Fields.ID: record_id, "presceen_inclusion": "TODO"}
+            for record_id in to_prescreen[1:]
+        ],
+        path=table_path,
+        fieldnames=[Fields.ID, "presceen_inclusion"],
+    )
+    prescreen_operation.import_table(import_table_path=str(table_path))
+    table_path.unlink()
+
+    records = base_repo_review_manager.dataset.load_records_dict()
+    assert records[to_prescreen[0]][Fields.STATUS] == RecordState.rev_prescreen_excluded
+    for record_id in to_prescreen[1:]:
+        assert records[record_id][Fields.STATUS] == RecordState.md_processed
+    # Only the changed record is updated (partial save)
+    diff = base_repo_review_manager.dataset.get_repo().git.diff(
+        "HEAD", "--unified=0", base_repo_review_manager.paths.RECORDS_FILE_GIT
+    )
+    assert diff.count("colrev_status") == 2
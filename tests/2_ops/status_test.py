@@ -64,6 +64,34 @@ def test_get_analytics(  # type: ignore
     }
 
 
+def test_get_analytics_incremental(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, helpers, mocker
+) -> None:
+    """Test the analytics store (incremental updates and rewritten history)"""
+
+    helpers.reset_commit(base_repo_review_manager, commit="load_commit")
+    status_operation = base_repo_review_manager.get_status_operation()
+    status_operation.get_analytics()
+
+    # Only the new commits are parsed
+    helpers.reset_commit(base_repo_review_manager, commit="dedupe_commit")
+    commit_analytics = mocker.spy(status_operation, "_get_commit_analytics")
+    ret = status_operation.get_analytics()
+    assert commit_analytics.call_count == 2
+    assert ret[5]["commit_message"] == "Dedupe: merge duplicate records"
+    assert list(ret.keys()) == [5, 4, 3, 2, 1]
+
+    # Nothing to parse
+    status_operation.get_analytics()
+    assert commit_analytics.call_count == 2
+
+    # The store is rebuilt when the stored head is not in the history
+    helpers.reset_commit(base_repo_review_manager, commit="prep_commit")
+    ret = status_operation.get_analytics()
+    assert commit_analytics.call_count == 2 + 4
+    assert list(ret.keys()) == [4, 3, 2, 1]
+
+
 def test_status_stats(  # type: ignore
     base_repo_review_manager: colrev.review_manager.ReviewManager, helpers
 ) -> None:
@@ -10,10 +10,12 @@ from pathlib import Path
 import git
 import pytest
 
+import colrev.env.language_service
 import colrev.env.local_index
 import colrev.env.local_index_builder
 import colrev.exceptions as colrev_exceptions
 import colrev.ops.init
+import colrev.record.qm.quality_model
 import colrev.record.record_pdf
 import colrev.review_manager
 from colrev.constants import ENTRYTYPES